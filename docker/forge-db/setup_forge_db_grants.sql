@@ -10,8 +10,10 @@
  *
  * Revision History:
  *  20260329: Initial creation of grants for containerized database.
+ *  20261017: Grant EXECUTE on functions (ipd2.refresh_summaries)
  ******************************************************************************/
 
 GRANT USAGE ON SCHEMA ipd2 TO PUBLIC;
 GRANT ALL ON ALL TABLES IN SCHEMA ipd2 TO PUBLIC;
 GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA ipd2 TO PUBLIC;
+GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA ipd2 TO PUBLIC;
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+asyncio-native Episodic IPD with LLM Agents
+Same game and results format as episodic_ipd_game.py, but every LLM call is
+awaited so one process can run many independent games concurrently
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+from async_ollama_agent import AsyncOllamaAgent, aclose_async_sessions
+from episodic_ipd_game import (
+    EpisodicIPDGame,
+    build_arg_parser,
+    load_prompts,
+    open_round_log,
+    config_from_args,
+    create_agents,
+    prepare_resume,
+    resolve_checkpoint_path,
+    save_results
+)
+from prompts import extract_decision
+
+
+class AsyncEpisodicIPDGame(EpisodicIPDGame):
+    """Manages an episodic IPD game between two AsyncOllamaAgents"""
+
+    async def _gather_pair(self, coro_0, coro_1) -> Tuple:
+        """
+        Await one coroutine per agent and return both results
+
+        With config.concurrent_agents the two requests are in flight together;
+        otherwise agent_0 is awaited before agent_1, as in the threaded game.
+        """
+        if self.config.concurrent_agents:
+            return tuple(await asyncio.gather(coro_0, coro_1))
+        return await coro_0, await coro_1
+
+    async def play_round(
+        self,
+        round_num: int,
+        episode_num: int,
+        episode_history_0: List[Dict],
+        episode_history_1: List[Dict],
+        episode_scores: Dict[int, int]
+    ) -> Tuple[str, str, Dict]:
+        """
+        Play a single round within an episode
+
+        Returns:
+            (action_0, action_1, round_data)
+        """
+        if self.config.verbose:
+            print(f"  Round {round_num + 1}/{self.config.rounds_per_episode}", end=" ", flush=True)
+
+        # Get decisions from both agents (with forced decision retry)
+        (action_0, reasoning_0), (action_1, reasoning_1) = await self._gather_pair(
+            self._get_agent_decision_with_retry(
+                self.agent_0, round_num, episode_num, episode_history_0,
+                episode_scores[0], episode_scores[1], 0
+            ),
+            self._get_agent_decision_with_retry(
+                self.agent_1, round_num, episode_num, episode_history_1,
+                episode_scores[1], episode_scores[0], 1
+            )
+        )
+
+        round_data = self._record_round(
+            round_num, action_0, action_1, reasoning_0, reasoning_1,
+            episode_history_0, episode_history_1, episode_scores
+        )
+
+        return action_0, action_1, round_data
+
+    async def play_episode(self, episode_num: int) -> Dict:
+        """
+        Play one complete episode
+
+        Returns:
+            Episode data dictionary
+        """
+        self._start_episode(episode_num)
+
+        # Episode-specific state
+        episode_history_0 = []
+        episode_history_1 = []
+        episode_scores = {0: 0, 1: 0}
+        round_details = []
+
+        # Play all rounds in episode
+        for round_num in range(self.config.rounds_per_episode):
+            action_0, action_1, round_data = await self.play_round(
+                round_num, episode_num,
+                episode_history_0, episode_history_1,
+                episode_scores
+            )
+            self._store_round(round_details, episode_num, round_data)
+
+        coop_0, coop_1 = self._report_episode(
+            episode_num, episode_history_0, episode_history_1, episode_scores
+        )
+
+        # Get reflections from both agents
+        print(f"\nGetting reflections...", flush=True)
+        reflection_0, reflection_1 = await self._gather_pair(
+            self._get_reflection(
+                self.agent_0, episode_num, episode_history_0,
+                episode_scores[0], episode_scores[1]
+            ),
+            self._get_reflection(
+                self.agent_1, episode_num, episode_history_1,
+                episode_scores[1], episode_scores[0]
+            )
+        )
+
+        return self._finish_episode(
+            episode_num, round_details, episode_scores,
+            coop_0, coop_1, reflection_0, reflection_1
+        )
+
+    async def play_game(self) -> Dict:
+        """
+        Play the full multi-episode game
+
+        Returns:
+            Game results dictionary
+        """
+        self._print_game_header()
+        self._log_game_start()
+
+        start_time = time.time()
+
+        # Play all episodes (continuing after the last checkpointed one)
+        for episode_num in range(len(self.all_episodes), self.config.num_episodes):
+            episode_data = await self.play_episode(episode_num)
+            self._complete_episode(episode_data, start_time)
+
+        elapsed_time = self.prior_elapsed_seconds + time.time() - start_time
+
+        results = self._build_results(elapsed_time)
+
+        self._print_summary(results)
+
+        return results
+
+    async def _get_agent_decision_with_retry(
+        self,
+        agent: AsyncOllamaAgent,
+        round_num: int,
+        episode_num: int,
+        history: List[Dict],
+        my_score: int,
+        opp_score: int,
+        agent_idx: int
+    ) -> Tuple[str, str]:
+        """Get decision from an agent with retry logic for ambiguous responses"""
+
+        prompt = self._decision_prompt(round_num, episode_num, history, my_score, opp_score)
+
+        decision, response = await agent.generate_with_forced_decision(
+            prompt,
+            extract_decision
+        )
+
+        return self._resolve_decision(agent, decision, response)
+
+    async def _get_reflection(
+        self,
+        agent: AsyncOllamaAgent,
+        episode_num: int,
+        history: List[Dict],
+        my_score: int,
+        opp_score: int
+    ) -> str:
+        """Get post-episode reflection from agent"""
+
+        prompt = self._reflection_prompt(episode_num, history, my_score, opp_score)
+
+        # Reflections use higher token limit
+        reflection = await agent.generate(prompt, is_reflection=True)
+
+        return self._resolve_reflection(reflection)
+
+
+async def play_games(games: List[AsyncEpisodicIPDGame]) -> List[Dict]:
+    """
+    Play several independent games concurrently on one event loop
+
+    Returns:
+        List of results dictionaries, in the same order as games
+    """
+    return list(await asyncio.gather(*(game.play_game() for game in games)))
+
+
+async def async_main(args, checkpoint_path=None) -> Dict:
+    """Run one game from parsed command line arguments"""
+    system_prompt, reflection_template = load_prompts(args)
+
+    # Create configuration
+    config = config_from_args(args)
+
+    # Create agents
+    print("Initializing agents...", flush=True)
+    agent_0, agent_1 = create_agents(config, system_prompt, agent_cls=AsyncOllamaAgent)
+    round_log = open_round_log(args)
+
+    # Create and play game
+    game = AsyncEpisodicIPDGame(
+        agent_0,
+        agent_1,
+        config,
+        system_prompt_text=system_prompt,
+        reflection_template_text=reflection_template,
+        checkpoint_path=str(checkpoint_path) if checkpoint_path else None,
+        round_log=round_log
+    )
+    if args.resume:
+        prepare_resume(game, checkpoint_path)
+    try:
+        return await game.play_game()
+    finally:
+        await aclose_async_sessions()
+        if round_log is not None:
+            round_log.close()
+
+
+def main():
+    """Run an episodic IPD game with the asyncio engine"""
+    parser = build_arg_parser()
+    parser.description = "Episodic IPD with LLM Agents (asyncio engine)"
+    args = parser.parse_args()
+
+    checkpoint_path = resolve_checkpoint_path(args)
+
+    results = asyncio.run(async_main(args, checkpoint_path))
+
+    save_results(results, args.output, args.comment)
+
+    # The results file supersedes the checkpoint
+    if checkpoint_path and checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
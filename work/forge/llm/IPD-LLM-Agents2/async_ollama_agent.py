@@ -0,0 +1,214 @@
+"""
+asyncio-native Ollama Agent for Episodic IPD experiments
+Mirrors OllamaAgent but talks to Ollama through a shared httpx.AsyncClient
+"""
+
+import asyncio
+import socket
+import time
+from typing import Optional
+
+import httpx
+
+from ollama_agent import OllamaAgent, RETRY_DELAY_SECONDS
+
+
+class AsyncOllamaSession:
+    """
+    Pooled keep-alive async HTTP client for a single Ollama server
+
+    Async counterpart of OllamaSession. The httpx client is bound to the event
+    loop it was created in, so if the session is used from a different loop
+    (e.g., a second asyncio.run()) the old client is released and a new one
+    is opened.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 4, idle_timeout: float = 300):
+        """
+        Args:
+            base_url: Ollama server URL (e.g., "http://tungsten:11434")
+            pool_size: Max keep-alive connections held open to the server
+            idle_timeout: Seconds of inactivity before pooled connections are dropped
+        """
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+
+        self._client = None
+        self._loop = None
+
+        # Connection statistics
+        self.requests_sent = 0
+        self.clients_created = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            self._drop_client()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.idle_timeout
+                )
+            )
+            self._loop = loop
+            self.clients_created += 1
+        return self._client
+
+    def _drop_client(self):
+        """Release a client opened in another event loop"""
+        client, loop = self._client, self._loop
+        self._client = None
+        self._loop = None
+        if loop.is_running():
+            # Its loop is still serving another thread: close the client there
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        # The loop is stopped or closed, so the client cannot be awaited; shut
+        # down its pooled sockets so the server frees the connections now
+        for connection in client._transport._pool.connections:
+            try:
+                connection._connection._network_stream.get_extra_info('socket').shutdown(socket.SHUT_RDWR)
+            except (AttributeError, OSError):
+                pass
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """POST through the pooled client (same signature as httpx.AsyncClient.post)"""
+        client = self._get_client()
+        self.requests_sent += 1
+        return await client.post(url, **kwargs)
+
+    def stats(self) -> dict:
+        """Return request statistics for this server"""
+        return {
+            'base_url': self.base_url,
+            'pool_size': self.pool_size,
+            'requests': self.requests_sent,
+            'clients_created': self.clients_created
+        }
+
+    async def aclose(self):
+        """Close the pooled client"""
+        if self._client is None:
+            return
+        if self._loop is not asyncio.get_running_loop():
+            self._drop_client()
+            return
+        await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+
+# Shared async sessions, one per Ollama host:port
+_async_sessions = {}
+
+
+def get_async_session(host: str, port: int, pool_size: int = 4,
+                      idle_timeout: float = 300) -> AsyncOllamaSession:
+    """
+    Return the shared AsyncOllamaSession for host:port, creating it on first use
+
+    Pool settings are taken from the first caller for a given server.
+    """
+    base_url = f"http://{host}:{port}"
+    if base_url not in _async_sessions:
+        _async_sessions[base_url] = AsyncOllamaSession(base_url, pool_size, idle_timeout)
+    return _async_sessions[base_url]
+
+
+async def aclose_async_sessions():
+    """Close and forget all shared async sessions"""
+    sessions = list(_async_sessions.values())
+    _async_sessions.clear()
+    for session in sessions:
+        await session.aclose()
+
+
+class AsyncOllamaAgent(OllamaAgent):
+    """An agent that uses Ollama LLM for decision-making in IPD (asyncio version)"""
+
+    def _create_session(self, host: str, port: int, pool_size: int, pool_idle_timeout: float):
+        """Return the shared async HTTP session used to reach the Ollama server"""
+        return get_async_session(host, port, pool_size, pool_idle_timeout)
+
+    async def generate(
+        self,
+        prompt: str,
+        max_retries: int = 3,
+        num_predict: int = None,
+        is_reflection: bool = False,
+        response_format: Optional[dict] = None
+    ) -> Optional[str]:
+        """
+        Generate a response from the LLM
+
+        Args:
+            prompt: User prompt
+            max_retries: Number of times to retry on failure
+            num_predict: Maximum tokens to generate (uses configured limits if None)
+            is_reflection: If True, use reflection token limit
+            response_format: JSON schema the response must follow (Ollama "format")
+
+        Returns:
+            Generated text, or None if all retries fail
+        """
+        url, payload = self._prepare_request(prompt, num_predict, is_reflection, response_format)
+
+        self._begin_call()
+        try:
+            # Try to get response with retries
+            for attempt in range(max_retries):
+                started = time.perf_counter()
+                try:
+                    response = await self.session.post(url, json=payload, timeout=self.http_timeout)
+                    return self._parse_response(response, started)
+
+                except (httpx.HTTPError, ValueError) as e:
+                    # ValueError: a truncated or malformed body that response.json() could not decode
+                    if not self._retry_after_error(e, attempt, max_retries, started):
+                        return None
+                    await asyncio.sleep(RETRY_DELAY_SECONDS)
+
+            return None
+        finally:
+            self._end_call()
+
+    async def generate_with_forced_decision(
+        self,
+        prompt: str,
+        extract_decision_fn
+    ) -> tuple[Optional[str], Optional[str]]:
+        """
+        Generate a response and retry with simplified prompt if ambiguous
+
+        Args:
+            prompt: Initial decision prompt
+            extract_decision_fn: Function to extract decision from response
+
+        Returns:
+            (decision, full_response) tuple
+        """
+        self._begin_call()
+        try:
+            return await self._generate_decision(prompt, extract_decision_fn)
+        finally:
+            self._end_call()
+
+    async def _generate_decision(
+        self,
+        prompt: str,
+        extract_decision_fn
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Run _decision_exchange with awaited generate() calls"""
+        exchange = self._decision_exchange(prompt, extract_decision_fn)
+        try:
+            request_prompt, request_args = next(exchange)
+            while True:
+                request_prompt, request_args = exchange.send(await self.generate(request_prompt, **request_args))
+        except StopIteration as done:
+            return done.value
+
+    def __repr__(self) -> str:
+        return f"AsyncOllamaAgent(id={self.agent_id}, model={self.model}, conv_length={len(self.conversation)})"
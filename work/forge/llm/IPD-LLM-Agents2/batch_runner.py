@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Multi-game batch runner for Episodic IPD experiments
+Expands a sweep spec into EpisodeConfig instances and plays the games with the
+asyncio engine, scheduled over the Ollama fleet with per-host concurrency
+limits and models pinned to hosts
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from async_episodic_ipd_game import AsyncEpisodicIPDGame
+from async_ollama_agent import AsyncOllamaAgent, aclose_async_sessions
+from config import EpisodeConfig
+from episodic_ipd_game import create_agents, save_results
+from prompts import load_system_prompt, load_reflection_template, DEFAULT_SYSTEM_PROMPT
+
+
+# Ollama nodes in the cluster (override with OLLAMA_HOSTS=host1,host2,...)
+DEFAULT_HOSTS = os.environ.get(
+    'OLLAMA_HOSTS', 'copper,iron,nickel,platinum,tungsten,zinc'
+).split(',')
+
+
+@dataclass
+class SweepGame:
+    """One game of a sweep: its configuration plus the prompt it runs with"""
+    index: int
+    config: EpisodeConfig
+    system_prompt_file: str
+    replicate: int
+
+    @property
+    def label(self) -> str:
+        """File-name friendly description of the game"""
+        models = self.config.model_0
+        if self.config.model_1 != self.config.model_0:
+            models += f"_vs_{self.config.model_1}"
+        models = re.sub(r'[^A-Za-z0-9.-]+', '-', models)
+        prompt = Path(self.system_prompt_file).stem
+        return (f"{self.index:04d}_{models}_t{self.config.temperature}"
+                f"_h{self.config.history_window_size}_{prompt}_r{self.replicate}")
+
+
+def expand_sweep(spec: Dict) -> List[SweepGame]:
+    """
+    Expand a sweep spec into one SweepGame per combination and replicate
+
+    Spec keys (all optional except models):
+        models:           List of model names (self-play) or [model_0, model_1] pairs
+        temperatures:     List of sampling temperatures (default: [0.7])
+        history_windows:  List of history window sizes (default: [10])
+        system_prompts:   List of system prompt files (default: ["system_prompt.txt"])
+        replicates:       Games per combination (default: 1)
+        base:             EpisodeConfig fields applied to every game
+    """
+    base = EpisodeConfig(**spec.get('base', {}))
+
+    model_pairs = []
+    for entry in spec['models']:
+        if isinstance(entry, str):
+            model_pairs.append((entry, entry))
+        else:
+            model_pairs.append((entry[0], entry[1]))
+
+    combos = itertools.product(
+        model_pairs,
+        spec.get('temperatures', [base.temperature]),
+        spec.get('history_windows', [base.history_window_size]),
+        spec.get('system_prompts', ['system_prompt.txt']),
+        range(1, spec.get('replicates', 1) + 1)
+    )
+
+    games = []
+    for (model_0, model_1), temperature, window, prompt_file, replicate in combos:
+        config = replace(
+            base,
+            model_0=model_0,
+            model_1=model_1,
+            temperature=temperature,
+            history_window_size=window
+        )
+        config.validate()
+        games.append(SweepGame(len(games) + 1, config, prompt_file, replicate))
+
+    return games
+
+
+def pin_models(models: List[str], hosts: List[str]) -> Dict[str, List[str]]:
+    """
+    Assign each model a fixed set of hosts so GPU memory isn't thrashed by reloads
+
+    With at least as many hosts as models, every host serves exactly one model
+    and the spare hosts are dealt out round-robin. With more models than hosts,
+    models share hosts round-robin.
+    """
+    pinning = {model: [] for model in models}
+    if len(hosts) >= len(models):
+        for i, host in enumerate(hosts):
+            pinning[models[i % len(models)]].append(host)
+    else:
+        for i, model in enumerate(models):
+            pinning[model].append(hosts[i % len(hosts)])
+    return pinning
+
+
+class HostScheduler:
+    """
+    Hands out Ollama hosts to games
+
+    Each game holds one slot on every distinct host its agents use, and no
+    host runs more than per_host_limit games at once. Both hosts of a game are
+    acquired together so games never deadlock waiting on each other.
+    """
+
+    def __init__(self, pinning: Dict[str, List[str]], per_host_limit: int = 1):
+        self.pinning = pinning
+        self.per_host_limit = per_host_limit
+        self.active = {host: 0 for hosts in pinning.values() for host in hosts}
+        self._cond = asyncio.Condition()
+
+    def _pick(self, model: str, taken: List[str]) -> Optional[str]:
+        """Pick the least-loaded free host pinned to model (reusing a host the game already holds)"""
+        for host in taken:
+            if host in self.pinning[model]:
+                return host
+        free = [host for host in self.pinning[model] if self.active[host] < self.per_host_limit]
+        return min(free, key=lambda host: self.active[host]) if free else None
+
+    async def acquire(self, model_0: str, model_1: str) -> Tuple[str, str]:
+        """Wait until both models have a free pinned host, then claim them"""
+        async with self._cond:
+            while True:
+                host_0 = self._pick(model_0, [])
+                if host_0 is not None:
+                    self.active[host_0] += 1
+                    host_1 = self._pick(model_1, [host_0])
+                    if host_1 is not None:
+                        if host_1 != host_0:
+                            self.active[host_1] += 1
+                        return host_0, host_1
+                    self.active[host_0] -= 1
+                await self._cond.wait()
+
+    async def release(self, host_0: str, host_1: str):
+        """Return a game's hosts to the pool"""
+        async with self._cond:
+            for host in {host_0, host_1}:
+                self.active[host] -= 1
+            self._cond.notify_all()
+
+
+def _load_prompt_file(path: str) -> str:
+    try:
+        return load_system_prompt(path)
+    except FileNotFoundError as e:
+        print(f"Warning: {e}", flush=True)
+        print("Using default system prompt", flush=True)
+        return DEFAULT_SYSTEM_PROMPT
+
+
+async def run_batch(
+    games: List[SweepGame],
+    scheduler: HostScheduler,
+    output_dir: Path,
+    reflection_template: str = "",
+    comment: Optional[str] = None
+) -> Dict:
+    """
+    Play every game of a sweep and save one results JSON per game
+
+    Returns:
+        {'completed': [(label, path)], 'failed': [(label, error)]}
+    """
+    prompts = {}
+    for game in games:
+        if game.system_prompt_file not in prompts:
+            prompts[game.system_prompt_file] = _load_prompt_file(game.system_prompt_file)
+
+    report = {'completed': [], 'failed': []}
+
+    async def run_one(game: SweepGame):
+        host_0, host_1 = await scheduler.acquire(game.config.model_0, game.config.model_1)
+        config = replace(game.config, host_0=host_0, host_1=host_1)
+        print(f"[batch] Starting game {game.label} on {host_0}/{host_1}", flush=True)
+        try:
+            system_prompt = prompts[game.system_prompt_file]
+            agent_0, agent_1 = create_agents(config, system_prompt, agent_cls=AsyncOllamaAgent)
+            ipd_game = AsyncEpisodicIPDGame(
+                agent_0,
+                agent_1,
+                config,
+                system_prompt_text=system_prompt,
+                reflection_template_text=reflection_template
+            )
+            results = await ipd_game.play_game()
+            game_comment = f"{comment} [{game.label}]" if comment else game.label
+            path = save_results(results, str(output_dir / f"episodic_game_{game.label}.json"), game_comment)
+            report['completed'].append((game.label, str(path)))
+        except Exception as e:
+            print(f"[batch] Game {game.label} failed: {e}", flush=True)
+            report['failed'].append((game.label, str(e)))
+        finally:
+            await scheduler.release(host_0, host_1)
+
+    try:
+        await asyncio.gather(*(run_one(game) for game in games))
+    finally:
+        await aclose_async_sessions()
+
+    return report
+
+
+def main():
+    """Run a sweep of episodic IPD games"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Batch runner for Episodic IPD sweeps")
+    parser.add_argument("--spec", type=str, required=True,
+                       help="Path to sweep spec JSON (see sweep_spec_example.json)")
+    parser.add_argument("--hosts", type=str, default=None,
+                       help=f"Comma-separated Ollama hosts (default: {','.join(DEFAULT_HOSTS)})")
+    parser.add_argument("--per-host-limit", type=int, default=None,
+                       help="Max concurrent games per host (default: spec value or 1)")
+    parser.add_argument("--output-dir", type=str, default=None,
+                       help="Directory for results JSON (default: results/batch_<timestamp>)")
+    parser.add_argument("--reflection-template", type=str, default="reflection_prompt_template.txt",
+                       help="Path to reflection prompt template file")
+    parser.add_argument("--comment", type=str, default=None,
+                       help="Optional comment stored in every game's JSON")
+    parser.add_argument("--dry-run", action="store_true",
+                       help="Print the expanded games and host pinning without running")
+
+    args = parser.parse_args()
+
+    with open(args.spec, 'r') as f:
+        spec = json.load(f)
+
+    hosts = args.hosts.split(',') if args.hosts else spec.get('hosts', DEFAULT_HOSTS)
+    per_host_limit = args.per_host_limit or spec.get('per_host_limit', 1)
+
+    games = expand_sweep(spec)
+    models = list(dict.fromkeys(
+        model for game in games for model in (game.config.model_0, game.config.model_1)
+    ))
+    pinning = pin_models(models, hosts)
+
+    print(f"Sweep: {len(games)} games, {len(models)} models, {len(hosts)} hosts, "
+          f"{per_host_limit} game(s) per host", flush=True)
+    for model, model_hosts in pinning.items():
+        print(f"  {model} -> {', '.join(model_hosts)}", flush=True)
+
+    if args.dry_run:
+        for game in games:
+            print(f"  {game.label}", flush=True)
+        return
+
+    try:
+        reflection_template = load_reflection_template(args.reflection_template)
+    except FileNotFoundError:
+        reflection_template = ""  # Will use built-in templates
+
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+    else:
+        output_dir = Path(__file__).parent / "results" / f"batch_{time.strftime('%Y%m%d_%H%M%S')}"
+
+    scheduler = HostScheduler(pinning, per_host_limit)
+    start_time = time.time()
+    report = asyncio.run(run_batch(games, scheduler, output_dir, reflection_template, args.comment))
+
+    print(f"\nBatch complete in {time.time() - start_time:.1f} seconds: "
+          f"{len(report['completed'])} completed, {len(report['failed'])} failed", flush=True)
+    for label, error in report['failed']:
+        print(f"  FAILED {label}: {error}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
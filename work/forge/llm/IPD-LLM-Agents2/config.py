@@ -4,7 +4,7 @@ Defines hyperparameters for the simulation
 """
 import os                   # Added 3/30/2026 for Containerized Architecture @edc
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Optional
 
 
 @dataclass
@@ -19,6 +19,11 @@ class EpisodeConfig:
     reset_conversation_between_episodes: bool = True
     history_window_size: int = 10
     
+    # Bounded conversation context (None = unbounded; see OllamaAgent._apply_context_policy)
+    max_context_exchanges: Optional[int] = None   # Last N prompt/response exchanges kept
+    keep_reflections: int = 1                     # Latest reflections kept when truncating
+    context_token_budget: Optional[int] = None    # Estimated token cap on the context
+    
     # Agent parameters
     temperature: float = 0.7
 
@@ -38,6 +43,16 @@ class EpisodeConfig:
     reflection_token_limit: int = 1024   # Max tokens for reflection responses
     http_timeout: int = 60               # Seconds to wait for LLM response
     force_decision_retries: int = 2      # Retries for ambiguous decisions
+    structured_decisions: bool = False   # Constrain decisions to JSON {reasoning, action}
+    
+    # HTTP connection pooling (shared keep-alive session per Ollama host:port)
+    http_pool_size: int = 4              # Keep-alive connections per Ollama server
+    http_pool_idle_timeout: int = 300    # Seconds before idle connections are dropped
+    
+    # Prompt (KV) cache reuse on the Ollama server
+    kv_cache: bool = False               # Send keep_alive and a fixed num_ctx with every request
+    keep_alive: str = "30m"              # How long Ollama keeps the model loaded between requests
+    num_ctx: int = 8192                  # Fixed context window (tokens); must hold a whole episode
     
     # Reflection parameters
     reflection_prompt_type: Literal["minimal", "standard", "detailed"] = "standard"
@@ -50,8 +65,12 @@ class EpisodeConfig:
     punishment: int = 1  # P
     sucker: int = 0      # S
     
+    # Concurrency (both agents' requests in a round/reflection sent in parallel)
+    concurrent_agents: bool = False
+    
     # Output
     verbose: bool = True
+    keep_rounds_in_memory: bool = True   # False: rounds live only in the JSONL round log
     
     @property
     def total_rounds(self) -> int:
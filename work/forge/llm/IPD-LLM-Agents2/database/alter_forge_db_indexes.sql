@@ -0,0 +1,51 @@
+/******************************************************************************
+ * FORGE IPD2 Schema Migration - Filter Indexes
+ * Adds the pg_trgm extension, trigram GIN indexes for the ForgeDB username,
+ * filename, and comment filters, and rebuilds the ipd2.episodes unique key
+ * as a covering index
+ *
+ * New databases get these from setup_forge_db.sql; run this once against
+ * databases created before 20261017 (after alter_forge_db_summary_mvw.sql):
+ *   psql -h platinum -d forge -f alter_forge_db_indexes.sql
+ *
+ * pg_trgm ships with PostgreSQL (postgresql-contrib); creating it needs
+ * CREATE privilege on the database.
+ *
+ * Revision History:
+ *  20261017: Initial version
+ ******************************************************************************/
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+/******************************** Indexes *************************************/
+/* Match the ForgeDB query filters: LOWER(col) LIKE '%pattern%' is served by
+ * trigram GIN indexes on the same expression; timestamp ranges use the
+ * UNIQUE index on ipd2.results.timestamp.
+ */
+CREATE INDEX IF NOT EXISTS results_username_trgm_idx ON ipd2.results USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS results_filename_trgm_idx ON ipd2.results USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS results_comment_trgm_idx ON ipd2.results USING gin (LOWER(comment) gin_trgm_ops);
+
+/* Rebuild the episodes unique key as a covering index for the views' joins */
+ALTER TABLE ipd2.episodes
+  DROP CONSTRAINT IF EXISTS episodes_results_id_agent_idx_episode_key,
+  ADD CONSTRAINT episodes_results_id_agent_idx_episode_key
+        UNIQUE (results_id, agent_idx, episode)
+        INCLUDE (episode_id, score, cooperations, cooperation_rate);
+
+CREATE INDEX IF NOT EXISTS experiment_summary_mvw_username_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS experiment_summary_mvw_filename_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS experiment_summary_mvw_comment_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS episode_summary_mvw_username_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS episode_summary_mvw_filename_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS episode_summary_mvw_comment_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS rounds_summary_mvw_username_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS rounds_summary_mvw_filename_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS rounds_summary_mvw_comment_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+ANALYZE ipd2.results;
+ANALYZE ipd2.episodes;
+
+COMMIT;
@@ -0,0 +1,31 @@
+/******************************************************************************
+ * FORGE IPD2 Schema Migration - Ingest Manifest
+ * Adds the table forgedb.py uses to skip results files already imported
+ *
+ * New databases get this table from setup_forge_db.sql; run this once
+ * against databases created before it, then re-run
+ * setup_forge_db_grants.sql so researchers can read and write it:
+ *   psql -h platinum -d forge -f alter_forge_db_manifest.sql
+ *
+ * Files imported before the manifest existed have no row; the next import
+ * run finds them as duplicates and adds their rows then.
+ *
+ * Revision History:
+ *  20261017: Initial version
+ ******************************************************************************/
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ipd2.ingest_manifest (
+  filename                  VARCHAR(128) PRIMARY KEY
+  ,sha256                   CHAR(64) NOT NULL
+  ,size_bytes               BIGINT
+  ,mtime_ns                 BIGINT
+  ,results_id               INTEGER NOT NULL
+  ,ingest_dttm              TIMESTAMPTZ DEFAULT now()
+
+  ,FOREIGN KEY (results_id)
+        REFERENCES ipd2.results(results_id) ON DELETE CASCADE
+);
+
+COMMIT;
@@ -0,0 +1,90 @@
+/******************************************************************************
+ * FORGE IPD2 Schema Migration - Materialized Summary Views
+ * Adds experiment_summary_mvw, episode_summary_mvw, rounds_summary_mvw and
+ * the ipd2.refresh_summaries() function forgedb.py calls after imports
+ *
+ * New databases get these from setup_forge_db.sql; run this once against
+ * databases created before 20261017 (after alter_forge_db_telemetry.sql),
+ * as the schema owner, then re-run setup_forge_db_grants.sql:
+ *   psql -h platinum -d forge -f alter_forge_db_summary_mvw.sql
+ *
+ * Re-running it drops and rebuilds the materialized views, which also picks
+ * up changes to the views they select from.
+ *
+ * Revision History:
+ *  20261017: Initial version
+ *  20261017: Trigram filter indexes on the materialized views
+ ******************************************************************************/
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DROP MATERIALIZED VIEW IF EXISTS ipd2.experiment_summary_mvw;
+DROP MATERIALIZED VIEW IF EXISTS ipd2.episode_summary_mvw;
+DROP MATERIALIZED VIEW IF EXISTS ipd2.rounds_summary_mvw;
+
+/**************************** Materialized Views ******************************/
+/* Stored copies of the summary views so reads are index scans instead of
+ * re-pivoting agents on every query. forgedb.py refreshes them after each
+ * import through ipd2.refresh_summaries(); the unique indexes let the
+ * refresh run CONCURRENTLY, without blocking readers. The column lists are
+ * fixed when the materialized view is created: recreate it after changing
+ * the view it selects from.
+ */
+CREATE MATERIALIZED VIEW ipd2.experiment_summary_mvw AS
+    SELECT * FROM ipd2.experiment_summary_vw;
+
+CREATE UNIQUE INDEX experiment_summary_mvw_uk
+    ON ipd2.experiment_summary_mvw (results_id);
+CREATE INDEX experiment_summary_mvw_timestamp_idx
+    ON ipd2.experiment_summary_mvw (timestamp);
+CREATE INDEX experiment_summary_mvw_username_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX experiment_summary_mvw_filename_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX experiment_summary_mvw_comment_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+CREATE MATERIALIZED VIEW ipd2.episode_summary_mvw AS
+    SELECT * FROM ipd2.episode_summary_vw;
+
+CREATE UNIQUE INDEX episode_summary_mvw_uk
+    ON ipd2.episode_summary_mvw (results_id, episode);
+CREATE INDEX episode_summary_mvw_timestamp_idx
+    ON ipd2.episode_summary_mvw (timestamp, episode);
+CREATE INDEX episode_summary_mvw_username_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX episode_summary_mvw_filename_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX episode_summary_mvw_comment_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+CREATE MATERIALIZED VIEW ipd2.rounds_summary_mvw AS
+    SELECT * FROM ipd2.rounds_summary_vw;
+
+CREATE UNIQUE INDEX rounds_summary_mvw_uk
+    ON ipd2.rounds_summary_mvw (results_id, episode, round);
+CREATE INDEX rounds_summary_mvw_timestamp_idx
+    ON ipd2.rounds_summary_mvw (timestamp, episode, round);
+CREATE INDEX rounds_summary_mvw_username_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX rounds_summary_mvw_filename_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX rounds_summary_mvw_comment_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+/* Refreshing requires owning the materialized views; SECURITY DEFINER lets
+ * any researcher with EXECUTE refresh them after an import.
+ */
+CREATE OR REPLACE FUNCTION ipd2.refresh_summaries(concurrent BOOLEAN DEFAULT TRUE)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ipd2, pg_temp
+AS $$
+BEGIN
+    IF concurrent THEN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY ipd2.experiment_summary_mvw;
+        REFRESH MATERIALIZED VIEW CONCURRENTLY ipd2.episode_summary_mvw;
+        REFRESH MATERIALIZED VIEW CONCURRENTLY ipd2.rounds_summary_mvw;
+    ELSE
+        REFRESH MATERIALIZED VIEW ipd2.experiment_summary_mvw;
+        REFRESH MATERIALIZED VIEW ipd2.episode_summary_mvw;
+        REFRESH MATERIALIZED VIEW ipd2.rounds_summary_mvw;
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,135 @@
+/******************************************************************************
+ * FORGE IPD2 Schema Migration - LLM Call Telemetry
+ * Adds per-call latency and token columns to an existing ipd2 schema
+ *
+ * New databases get these columns from setup_forge_db.sql; run this once
+ * against databases created before 20261017:
+ *   psql -h platinum -d forge -f alter_forge_db_telemetry.sql
+ *
+ * Existing rows keep NULL telemetry (older results JSON files have none).
+ *
+ * Revision History:
+ *  20261017: Initial version
+ *  20261017: episodes.refl_prompt_eval_count / refl_eval_count are BIGINT like
+ *            the other token counts (converted if added as INTEGER earlier)
+ ******************************************************************************/
+
+BEGIN;
+
+ALTER TABLE ipd2.llm_agents
+  ADD COLUMN IF NOT EXISTS dec_calls                INTEGER,
+  ADD COLUMN IF NOT EXISTS dec_wall_seconds         DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_mean_wall_seconds    DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_max_wall_seconds     DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_http_seconds         DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_llm_requests         INTEGER,
+  ADD COLUMN IF NOT EXISTS dec_retries              INTEGER,
+  ADD COLUMN IF NOT EXISTS dec_prompt_eval_count    BIGINT,
+  ADD COLUMN IF NOT EXISTS dec_eval_count           BIGINT,
+  ADD COLUMN IF NOT EXISTS dec_eval_duration_ns     BIGINT,
+  ADD COLUMN IF NOT EXISTS dec_load_duration_ns     BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_calls               INTEGER,
+  ADD COLUMN IF NOT EXISTS refl_wall_seconds        DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS refl_mean_wall_seconds   DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS refl_max_wall_seconds    DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS refl_http_seconds        DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS refl_llm_requests        INTEGER,
+  ADD COLUMN IF NOT EXISTS refl_retries             INTEGER,
+  ADD COLUMN IF NOT EXISTS refl_prompt_eval_count   BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_eval_count          BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_eval_duration_ns    BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_load_duration_ns    BIGINT;
+
+ALTER TABLE ipd2.episodes
+  ADD COLUMN IF NOT EXISTS dec_calls                INTEGER,
+  ADD COLUMN IF NOT EXISTS dec_wall_seconds         DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_mean_wall_seconds    DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_max_wall_seconds     DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_http_seconds         DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS dec_llm_requests         INTEGER,
+  ADD COLUMN IF NOT EXISTS dec_retries              INTEGER,
+  ADD COLUMN IF NOT EXISTS dec_prompt_eval_count    BIGINT,
+  ADD COLUMN IF NOT EXISTS dec_eval_count           BIGINT,
+  ADD COLUMN IF NOT EXISTS dec_eval_duration_ns     BIGINT,
+  ADD COLUMN IF NOT EXISTS dec_load_duration_ns     BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_wall_seconds        DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS refl_http_seconds        DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS refl_llm_requests        INTEGER,
+  ADD COLUMN IF NOT EXISTS refl_retries             INTEGER,
+  ADD COLUMN IF NOT EXISTS refl_prompt_eval_count   BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_eval_count          BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_eval_duration_ns    BIGINT,
+  ADD COLUMN IF NOT EXISTS refl_load_duration_ns    BIGINT;
+
+ALTER TABLE ipd2.rounds
+  ADD COLUMN IF NOT EXISTS wall_seconds             DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS http_seconds             DOUBLE PRECISION,
+  ADD COLUMN IF NOT EXISTS llm_requests             INTEGER,
+  ADD COLUMN IF NOT EXISTS retries                  INTEGER,
+  ADD COLUMN IF NOT EXISTS prompt_eval_count        INTEGER,
+  ADD COLUMN IF NOT EXISTS eval_count               INTEGER,
+  ADD COLUMN IF NOT EXISTS eval_duration_ns         BIGINT,
+  ADD COLUMN IF NOT EXISTS load_duration_ns         BIGINT;
+
+-- Databases migrated by the first version of this script have these as INTEGER
+ALTER TABLE ipd2.episodes
+  ALTER COLUMN refl_prompt_eval_count TYPE BIGINT,
+  ALTER COLUMN refl_eval_count        TYPE BIGINT;
+
+/* New columns are appended to the end of the view, so it can be replaced in place */
+CREATE OR REPLACE VIEW ipd2.rounds_detail_vw AS
+SELECT
+    r.results_id
+    ,r.username
+    ,r.filename
+    ,r.comment -- 20260316: added new view @edc
+    ,r.timestamp
+
+    ,e.episode_id
+    
+    ,a.agent_idx
+    ,e.episode
+    ,rd.round
+
+    ,CONCAT('agent_',  a.agent_idx) AS agent
+    ,rd.action
+    ,rd.payoff
+    ,rd.ep_cumulative_score
+    ,rd.reasoning
+
+    ,e.score                        AS ep_score
+    ,e.cooperations                 AS ep_cooperations
+    ,e.cooperation_rate             AS ep_coop_rate
+    ,e.reflection                   AS ep_reflection
+
+    -- Decision call telemetry, 20261017
+    ,rd.wall_seconds
+    ,rd.http_seconds
+    ,rd.llm_requests
+    ,rd.retries
+    ,rd.prompt_eval_count
+    ,rd.eval_count
+    ,rd.eval_duration_ns
+    ,rd.load_duration_ns
+    
+FROM 
+    ipd2.results r
+    
+    JOIN ipd2.llm_agents a
+        ON a.results_id = r.results_id
+        
+    JOIN ipd2.episodes e
+        ON e.results_id = r.results_id
+        AND e.agent_idx = a.agent_idx
+
+    JOIN ipd2.rounds rd
+        ON rd.episode_id = e.episode_id
+    
+ORDER BY
+    r.timestamp
+    ,a.agent_idx
+    ,e.episode
+    ,rd.round
+;
+
+COMMIT;
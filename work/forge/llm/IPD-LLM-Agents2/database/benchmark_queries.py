@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+    ForgeDB query plan benchmark
+
+    Runs the SQL behind each ForgeDB get_*() method under
+    EXPLAIN (ANALYZE, BUFFERS) and reports planning/execution time, rows, and
+    which relations were read by sequential scan vs. index. Each statement
+    runs inside a transaction that is rolled back.
+
+    Usage:
+        python benchmark_queries.py
+        python benchmark_queries.py --username %hart% --repeat 5
+        python benchmark_queries.py --save baseline.json
+        python benchmark_queries.py --compare baseline.json   # flag regressions
+        python benchmark_queries.py --generate 2000 --username synthetic
+
+    Revision History:
+        20261017: Initial version
+        20261017: --generate loads a synthetic dataset (synthetic_results.py) first
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from datetime import datetime
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(script_dir)
+sys.path.append(parent_dir)
+
+from forgedb import ForgeDB
+
+# ForgeDB method -> view it queries
+METHODS = {
+    'get_raw_data':         'raw_data_vw',
+    'get_results':          'results_vw',
+    'get_summary':          'experiment_summary_vw',
+    'get_episode_summary':  'episode_summary_vw',
+    'get_rounds_summary':   'rounds_summary_vw',
+    'get_rounds_detail':    'rounds_detail_vw',
+}
+
+
+def load_synthetic(db, count, episodes=5, rounds=20, workers=1, seed=0):
+    """
+    Generate count synthetic results files and import them
+
+    The seed and timestamps are fixed, so re-running with the same arguments
+    produces identical files and the ingest manifest skips them.
+    """
+    # Imported here: it pulls in the whole game engine, which only --generate needs
+    from synthetic_results import generate_files
+    
+    with tempfile.TemporaryDirectory() as output_dir:
+        generate_files(output_dir, count, episodes, rounds, seed=seed, workers=workers,
+                       start=datetime(2026, 1, 1))
+        return db.get_files(output_dir, 'synthetic', bulk=True, workers=workers)
+
+
+def plan_scans(node, scans=None):
+    """Collect (node type, relation, index) for every scan node in a JSON plan."""
+    if scans is None:
+        scans = []
+    if 'Relation Name' in node or 'Index Name' in node:
+        scans.append((node['Node Type'], node.get('Relation Name'), node.get('Index Name')))
+    for child in node.get('Plans', []):
+        plan_scans(child, scans)
+    return scans
+
+
+def explain(db, sql, params):
+    """EXPLAIN ANALYZE one statement in a rolled-back transaction."""
+    try:
+        with db.conn.cursor() as cur:
+            cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+            plan = cur.fetchone()['QUERY PLAN'][0]
+    finally:
+        db.conn.rollback()
+    return plan
+
+
+def run_benchmark(db, filters, repeat=3):
+    """
+    Benchmark every get_*() method with the given filters
+
+    Returns:
+        {method: {'sql', 'planning_ms', 'execution_ms', 'rows', 'seq_scans', 'indexes'}}
+        with times as the median over repeat runs
+    """
+    results = {}
+    for method, view in METHODS.items():
+        sql, params = db.get_view_sql(view, **filters)
+
+        plans = [explain(db, sql, params) for _ in range(repeat)]
+        scans = plan_scans(plans[-1]['Plan'])
+
+        results[method] = {
+            'sql': sql,
+            'planning_ms': statistics.median(p['Planning Time'] for p in plans),
+            'execution_ms': statistics.median(p['Execution Time'] for p in plans),
+            'rows': plans[-1]['Plan'].get('Actual Rows'),
+            'seq_scans': sorted({rel for node, rel, idx in scans if node == 'Seq Scan'}),
+            'indexes': sorted({idx for node, rel, idx in scans if idx}),
+        }
+    return results
+
+
+def print_report(results, baseline=None, threshold=1.25, min_ms=1.0):
+    """
+    Print one line per method
+
+    With a baseline, a method is flagged when it is slower than threshold
+    times its baseline and by at least min_ms (ignores sub-millisecond noise).
+    """
+    print(f"{'method':<22} {'rows':>9} {'plan ms':>9} {'exec ms':>10}  scans")
+    regressions = []
+    for method, r in results.items():
+        line = (f"{method:<22} {r['rows'] or 0:>9} {r['planning_ms']:>9.2f} "
+                f"{r['execution_ms']:>10.2f}  ")
+        line += f"seq: {', '.join(r['seq_scans']) or '-'}; idx: {', '.join(r['indexes']) or '-'}"
+
+        if baseline and method in baseline:
+            before = baseline[method]['execution_ms']
+            ratio = r['execution_ms'] / before if before else 1.0
+            line += f"  ({ratio:.2f}x baseline)"
+            if ratio > threshold and r['execution_ms'] - before >= min_ms:
+                regressions.append(method)
+        print(line)
+
+    if baseline is not None:
+        if regressions:
+            print(f"\nREGRESSIONS (> {threshold:.2f}x baseline): {', '.join(regressions)}")
+        else:
+            print(f"\nNo regressions (threshold {threshold:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EXPLAIN ANALYZE the ForgeDB get_*() queries')
+    parser.add_argument('--username', default=None, help='username filter (LIKE pattern)')
+    parser.add_argument('--filename', default=None, help='filename filter (LIKE pattern)')
+    parser.add_argument('--comment', default=None, help='comment filter (LIKE pattern)')
+    parser.add_argument('--start-date', default=None, help='timestamp >= start date')
+    parser.add_argument('--end-date', default=None, help='timestamp < end date')
+    parser.add_argument('--limit', type=int, default=None, help='LIMIT rows')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per query; the median is reported')
+    parser.add_argument('--save', default=None, help='Write results to this JSON file')
+    parser.add_argument('--compare', default=None, help='Baseline JSON from an earlier --save')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Flag queries slower than this multiple of the baseline')
+    parser.add_argument('--min-ms', type=float, default=1.0,
+                        help='...and slower by at least this many milliseconds')
+    parser.add_argument('--generate', type=int, default=None,
+                        help='First load this many synthetic games (username "synthetic")')
+    parser.add_argument('--episodes', type=int, default=5, help='Episodes per synthetic game')
+    parser.add_argument('--rounds', type=int, default=20, help='Rounds per synthetic episode')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Processes for generating and loading synthetic games')
+    args = parser.parse_args()
+
+    filters = {
+        'username': args.username,
+        'filename': args.filename,
+        'comment': args.comment,
+        'start_date': args.start_date,
+        'end_date': args.end_date,
+        'limit': args.limit,
+    }
+
+    db = ForgeDB()
+    try:
+        if args.generate:
+            report = load_synthetic(db, args.generate, args.episodes, args.rounds, args.workers)
+            print(f"Synthetic games: {len(report['loaded'])} loaded, "
+                  f"{len(report['skipped'])} already loaded\n")
+        results = run_benchmark(db, filters, args.repeat)
+    finally:
+        db.close()
+
+    active = {k: v for k, v in filters.items() if v is not None}
+    print(f"Filters: {active or 'none'}\n")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            saved = json.load(f)
+        baseline = saved['results']
+        if saved['filters'] != active:
+            print(f"Warning: baseline was run with filters {saved['filters'] or 'none'}\n")
+
+    regressions = print_report(results, baseline, args.threshold, args.min_ms)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'filters': active, 'results': results}, f, indent=2)
+        print(f"\nSaved to {args.save}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
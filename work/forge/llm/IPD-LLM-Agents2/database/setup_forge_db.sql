@@ -11,10 +11,25 @@
  * Revision History:
  *  20260316: Added "comment" field to ipd2.results; updated all SQL views
  *  20260329: Moved GRANTS to separate SQL script.
+ *  20261017: Added LLM call telemetry columns to llm_agents, episodes, and
+ *            rounds; added them to rounds_detail_vw (see
+ *            alter_forge_db_telemetry.sql for existing databases)
+ *  20261017: Added ipd2.ingest_manifest (see alter_forge_db_manifest.sql
+ *            for existing databases)
+ *  20261017: Added materialized summary views and ipd2.refresh_summaries()
+ *            (see alter_forge_db_summary_mvw.sql for existing databases)
+ *  20261017: Added pg_trgm filter indexes; episodes unique key INCLUDEs
+ *            the columns the views read
+ *            (see alter_forge_db_indexes.sql for existing databases)
+ *  20261017: episodes.refl_prompt_eval_count / refl_eval_count are BIGINT
+ *            like the other token counts
  ******************************************************************************/
 
 CREATE SCHEMA ipd2;
 
+/* Trigram operator classes for the LIKE filter indexes */
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 /***************************** Create the Tables ******************************/
 CREATE TABLE ipd2.results (
   results_id                    SERIAL PRIMARY KEY
@@ -50,6 +65,30 @@ CREATE TABLE ipd2.llm_agents (
   ,total_cooperations       SMALLINT
   ,overall_cooperation_rate REAL
 
+  -- LLM call telemetry (20261017)
+  ,dec_calls                INTEGER
+  ,dec_wall_seconds         DOUBLE PRECISION
+  ,dec_mean_wall_seconds    DOUBLE PRECISION
+  ,dec_max_wall_seconds     DOUBLE PRECISION
+  ,dec_http_seconds         DOUBLE PRECISION
+  ,dec_llm_requests         INTEGER
+  ,dec_retries              INTEGER
+  ,dec_prompt_eval_count    BIGINT
+  ,dec_eval_count           BIGINT
+  ,dec_eval_duration_ns     BIGINT
+  ,dec_load_duration_ns     BIGINT
+  ,refl_calls               INTEGER
+  ,refl_wall_seconds        DOUBLE PRECISION
+  ,refl_mean_wall_seconds   DOUBLE PRECISION
+  ,refl_max_wall_seconds    DOUBLE PRECISION
+  ,refl_http_seconds        DOUBLE PRECISION
+  ,refl_llm_requests        INTEGER
+  ,refl_retries             INTEGER
+  ,refl_prompt_eval_count   BIGINT
+  ,refl_eval_count          BIGINT
+  ,refl_eval_duration_ns    BIGINT
+  ,refl_load_duration_ns    BIGINT
+
   ,PRIMARY KEY (results_id, agent_idx)
   ,FOREIGN KEY (results_id) 
         REFERENCES ipd2.results(results_id) ON DELETE CASCADE
@@ -65,13 +104,36 @@ CREATE TABLE ipd2.episodes (
   ,cooperation_rate         DOUBLE PRECISION
   ,reflection               TEXT
 
+  -- LLM call telemetry (20261017)
+  ,dec_calls                INTEGER
+  ,dec_wall_seconds         DOUBLE PRECISION
+  ,dec_mean_wall_seconds    DOUBLE PRECISION
+  ,dec_max_wall_seconds     DOUBLE PRECISION
+  ,dec_http_seconds         DOUBLE PRECISION
+  ,dec_llm_requests         INTEGER
+  ,dec_retries              INTEGER
+  ,dec_prompt_eval_count    BIGINT
+  ,dec_eval_count           BIGINT
+  ,dec_eval_duration_ns     BIGINT
+  ,dec_load_duration_ns     BIGINT
+  ,refl_wall_seconds        DOUBLE PRECISION
+  ,refl_http_seconds        DOUBLE PRECISION
+  ,refl_llm_requests        INTEGER
+  ,refl_retries             INTEGER
+  ,refl_prompt_eval_count   BIGINT
+  ,refl_eval_count          BIGINT
+  ,refl_eval_duration_ns    BIGINT
+  ,refl_load_duration_ns    BIGINT
+
   ,FOREIGN KEY (results_id) 
         REFERENCES ipd2.results(results_id) ON DELETE CASCADE
 
   ,FOREIGN KEY (results_id, agent_idx) 
         REFERENCES ipd2.llm_agents(results_id, agent_idx) ON DELETE CASCADE
 
+  -- INCLUDE makes this a covering index for the views' episode joins (20261017)
   ,UNIQUE (results_id, agent_idx, episode)
+        INCLUDE (episode_id, score, cooperations, cooperation_rate)
 );
 
 CREATE TABLE ipd2.rounds (
@@ -82,6 +144,16 @@ CREATE TABLE ipd2.rounds (
   ,ep_cumulative_score      SMALLINT
   ,reasoning                TEXT
 
+  -- LLM call telemetry (20261017)
+  ,wall_seconds             DOUBLE PRECISION
+  ,http_seconds             DOUBLE PRECISION
+  ,llm_requests             INTEGER
+  ,retries                  INTEGER
+  ,prompt_eval_count        INTEGER
+  ,eval_count               INTEGER
+  ,eval_duration_ns         BIGINT
+  ,load_duration_ns         BIGINT
+
   ,PRIMARY KEY (episode_id, round)
 
   ,FOREIGN KEY (episode_id) 
@@ -97,6 +169,28 @@ CREATE TABLE ipd2.research_log (
   ,remarks                  TEXT
   ,tags                     TEXT[]
 );
+
+/* One row per imported results file; lets the ETL skip files already loaded */
+CREATE TABLE ipd2.ingest_manifest (
+  filename                  VARCHAR(128) PRIMARY KEY
+  ,sha256                   CHAR(64) NOT NULL
+  ,size_bytes               BIGINT
+  ,mtime_ns                 BIGINT
+  ,results_id               INTEGER NOT NULL
+  ,ingest_dttm              TIMESTAMPTZ DEFAULT now()
+
+  ,FOREIGN KEY (results_id)
+        REFERENCES ipd2.results(results_id) ON DELETE CASCADE
+);
+
+/******************************** Indexes *************************************/
+/* Match the ForgeDB query filters: LOWER(col) LIKE '%pattern%' is served by
+ * trigram GIN indexes on the same expression; timestamp ranges use the
+ * UNIQUE index on ipd2.results.timestamp.
+ */
+CREATE INDEX results_username_trgm_idx ON ipd2.results USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX results_filename_trgm_idx ON ipd2.results USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX results_comment_trgm_idx ON ipd2.results USING gin (LOWER(comment) gin_trgm_ops);
   
  /********************************* SQL Views *********************************/
 CREATE OR REPLACE VIEW ipd2.raw_data_vw AS
@@ -359,6 +453,16 @@ SELECT
     ,e.cooperations                 AS ep_cooperations
     ,e.cooperation_rate             AS ep_coop_rate
     ,e.reflection                   AS ep_reflection
+
+    -- Decision call telemetry, 20261017
+    ,rd.wall_seconds
+    ,rd.http_seconds
+    ,rd.llm_requests
+    ,rd.retries
+    ,rd.prompt_eval_count
+    ,rd.eval_count
+    ,rd.eval_duration_ns
+    ,rd.load_duration_ns
     
 FROM 
     ipd2.results r
@@ -380,3 +484,65 @@ ORDER BY
     ,rd.round
 ;
 
+/**************************** Materialized Views ******************************/
+/* Stored copies of the summary views so reads are index scans instead of
+ * re-pivoting agents on every query. forgedb.py refreshes them after each
+ * import through ipd2.refresh_summaries(); the unique indexes let the
+ * refresh run CONCURRENTLY, without blocking readers. The column lists are
+ * fixed when the materialized view is created: recreate it after changing
+ * the view it selects from.
+ */
+CREATE MATERIALIZED VIEW ipd2.experiment_summary_mvw AS
+    SELECT * FROM ipd2.experiment_summary_vw;
+
+CREATE UNIQUE INDEX experiment_summary_mvw_uk
+    ON ipd2.experiment_summary_mvw (results_id);
+CREATE INDEX experiment_summary_mvw_timestamp_idx
+    ON ipd2.experiment_summary_mvw (timestamp);
+CREATE INDEX experiment_summary_mvw_username_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX experiment_summary_mvw_filename_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX experiment_summary_mvw_comment_trgm_idx ON ipd2.experiment_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+CREATE MATERIALIZED VIEW ipd2.episode_summary_mvw AS
+    SELECT * FROM ipd2.episode_summary_vw;
+
+CREATE UNIQUE INDEX episode_summary_mvw_uk
+    ON ipd2.episode_summary_mvw (results_id, episode);
+CREATE INDEX episode_summary_mvw_timestamp_idx
+    ON ipd2.episode_summary_mvw (timestamp, episode);
+CREATE INDEX episode_summary_mvw_username_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX episode_summary_mvw_filename_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX episode_summary_mvw_comment_trgm_idx ON ipd2.episode_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+CREATE MATERIALIZED VIEW ipd2.rounds_summary_mvw AS
+    SELECT * FROM ipd2.rounds_summary_vw;
+
+CREATE UNIQUE INDEX rounds_summary_mvw_uk
+    ON ipd2.rounds_summary_mvw (results_id, episode, round);
+CREATE INDEX rounds_summary_mvw_timestamp_idx
+    ON ipd2.rounds_summary_mvw (timestamp, episode, round);
+CREATE INDEX rounds_summary_mvw_username_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(username) gin_trgm_ops);
+CREATE INDEX rounds_summary_mvw_filename_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(filename) gin_trgm_ops);
+CREATE INDEX rounds_summary_mvw_comment_trgm_idx ON ipd2.rounds_summary_mvw USING gin (LOWER(comment) gin_trgm_ops);
+
+/* Refreshing requires owning the materialized views; SECURITY DEFINER lets
+ * any researcher with EXECUTE refresh them after an import.
+ */
+CREATE OR REPLACE FUNCTION ipd2.refresh_summaries(concurrent BOOLEAN DEFAULT TRUE)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ipd2, pg_temp
+AS $$
+BEGIN
+    IF concurrent THEN
+        REFRESH MATERIALIZED VIEW CONCURRENTLY ipd2.experiment_summary_mvw;
+        REFRESH MATERIALIZED VIEW CONCURRENTLY ipd2.episode_summary_mvw;
+        REFRESH MATERIALIZED VIEW CONCURRENTLY ipd2.rounds_summary_mvw;
+    ELSE
+        REFRESH MATERIALIZED VIEW ipd2.experiment_summary_mvw;
+        REFRESH MATERIALIZED VIEW ipd2.episode_summary_mvw;
+        REFRESH MATERIALIZED VIEW ipd2.rounds_summary_mvw;
+    END IF;
+END;
+$$;
@@ -11,6 +11,7 @@
  * Revision History:
  *  20260316: Added "comment" field to ipd2.results; updated all SQL views
  *  20260329: Created separate GRANTS SQL script file.
+ *  20261017: Grant EXECUTE on functions (ipd2.refresh_summaries)
  ******************************************************************************/
 
 GRANT USAGE ON SCHEMA ipd2 
@@ -23,3 +24,7 @@ GRANT ALL ON ALL TABLES IN SCHEMA ipd2
 /* Grant access to read and use SERIAL fields */
 GRANT USAGE, SELECT ON ALL SEQUENCES IN SCHEMA ipd2 
   TO techkgirl, dhart, ksorauf, priyankasaha205, theandyman;
+
+/* Grant use of functions (e.g., ipd2.refresh_summaries after imports) */
+GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA ipd2 
+  TO techkgirl, dhart, ksorauf, priyankasaha205, theandyman;
@@ -10,11 +10,13 @@ import time
 import socket
 import getpass
 import os                   # Added 3/30/2026 for Containerized Architecture @edc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
-from ollama_agent import OllamaAgent
+from ollama_agent import OllamaAgent, get_all_session_stats
 from prompts import (
     load_system_prompt,
     load_reflection_template,
@@ -24,6 +26,61 @@ from prompts import (
     extract_decision
 )
 from config import EpisodeConfig
+from round_log import JsonlRoundLog, load_episode_rounds
+
+
+# Bump when the checkpoint layout changes
+CHECKPOINT_VERSION = 1
+
+# Config fields that must match between a checkpoint and the resumed run
+CHECKPOINT_GAME_FIELDS = (
+    'num_episodes', 'rounds_per_episode', 'reset_conversation_between_episodes',
+    'history_window_size', 'temperature', 'model_0', 'model_1',
+    'reflection_prompt_type', 'include_statistics', 'show_other_agent_score',
+    'temptation', 'reward', 'punishment', 'sucker',
+    'max_context_exchanges', 'keep_reflections', 'context_token_budget',
+    'structured_decisions'
+)
+
+
+def write_json_atomic(path, data, indent=None):
+    """Write JSON to a temporary file and rename it over path"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# Telemetry fields summed when aggregating calls (see OllamaAgent.last_call_telemetry)
+TELEMETRY_SUMS = ('wall_seconds', 'http_seconds', 'requests', 'retries', 'http_errors',
+                  'forced_retries', 'prompt_eval_count', 'eval_count', 'eval_duration',
+                  'load_duration')
+
+
+def merge_telemetry(aggregates: List[Dict]) -> Dict:
+    """Combine telemetry aggregates (e.g., per episode) into one"""
+    aggregates = [agg for agg in aggregates if agg]
+    merged = {'calls': sum(agg['calls'] for agg in aggregates)}
+    for field in TELEMETRY_SUMS:
+        merged[field] = sum(agg.get(field, 0) for agg in aggregates)
+    merged['mean_wall_seconds'] = merged['wall_seconds'] / merged['calls'] if merged['calls'] else 0.0
+    merged['max_wall_seconds'] = max((agg['max_wall_seconds'] for agg in aggregates), default=0.0)
+    return merged
+
+
+def aggregate_telemetry(records: List[Optional[Dict]]) -> Dict:
+    """
+    Aggregate per-call telemetry records
+    
+    Returns:
+        Call count, the summed TELEMETRY_SUMS fields, and mean/max wall latency
+    """
+    return merge_telemetry([{**record, 'calls': 1, 'max_wall_seconds': record['wall_seconds']}
+                            for record in records if record])
 
 
 class EpisodicIPDGame:
@@ -35,7 +92,9 @@ class EpisodicIPDGame:
         agent_1: OllamaAgent,
         config: EpisodeConfig,
         system_prompt_text: str = "",
-        reflection_template_text: str = ""
+        reflection_template_text: str = "",
+        checkpoint_path: Optional[str] = None,
+        round_log: Optional[JsonlRoundLog] = None
     ):
         """
         Initialize episodic IPD game
@@ -44,12 +103,16 @@ class EpisodicIPDGame:
             agent_0: First agent
             agent_1: Second agent
             config: Game configuration
+            checkpoint_path: If set, game state is written here after every episode
+            round_log: If set, every round and episode summary is streamed to this JSONL log
         """
         self.agent_0 = agent_0
         self.agent_1 = agent_1
         self.config = config
         self.system_prompt_text = system_prompt_text
         self.reflection_template_text = reflection_template_text
+        self.checkpoint_path = checkpoint_path
+        self.round_log = round_log
         
         # Validate configuration
         config.validate()
@@ -57,6 +120,27 @@ class EpisodicIPDGame:
         # Overall game state
         self.total_scores = {0: 0, 1: 0}
         self.all_episodes = []  # List of episode data
+        self.prior_elapsed_seconds = 0.0  # Play time before a resume
+        
+        # Worker threads for concurrent agent requests (created on first use)
+        self._executor = None
+        
+    def _run_pair(self, call_0: Callable, call_1: Callable) -> Tuple:
+        """
+        Run one call per agent and return both results
+        
+        With config.concurrent_agents the two calls are sent in parallel and
+        joined, so the pair takes roughly as long as the slower call.
+        """
+        if not self.config.concurrent_agents:
+            return call_0(), call_1()
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ipd-agent")
+        
+        future_0 = self._executor.submit(call_0)
+        future_1 = self._executor.submit(call_1)
+        return future_0.result(), future_1.result()
         
     def play_round(
         self,
@@ -76,15 +160,36 @@ class EpisodicIPDGame:
             print(f"  Round {round_num + 1}/{self.config.rounds_per_episode}", end=" ", flush=True)
         
         # Get decisions from both agents (with forced decision retry)
-        action_0, reasoning_0 = self._get_agent_decision_with_retry(
-            self.agent_0, round_num, episode_num, episode_history_0, 
-            episode_scores[0], episode_scores[1], 0
+        (action_0, reasoning_0), (action_1, reasoning_1) = self._run_pair(
+            lambda: self._get_agent_decision_with_retry(
+                self.agent_0, round_num, episode_num, episode_history_0, 
+                episode_scores[0], episode_scores[1], 0
+            ),
+            lambda: self._get_agent_decision_with_retry(
+                self.agent_1, round_num, episode_num, episode_history_1,
+                episode_scores[1], episode_scores[0], 1
+            )
         )
-        action_1, reasoning_1 = self._get_agent_decision_with_retry(
-            self.agent_1, round_num, episode_num, episode_history_1,
-            episode_scores[1], episode_scores[0], 1
+        
+        round_data = self._record_round(
+            round_num, action_0, action_1, reasoning_0, reasoning_1,
+            episode_history_0, episode_history_1, episode_scores
         )
         
+        return action_0, action_1, round_data
+    
+    def _record_round(
+        self,
+        round_num: int,
+        action_0: str,
+        action_1: str,
+        reasoning_0: str,
+        reasoning_1: str,
+        episode_history_0: List[Dict],
+        episode_history_1: List[Dict],
+        episode_scores: Dict[int, int]
+    ) -> Dict:
+        """Apply payoffs for both actions, update histories and scores, and return round_data"""
         # Calculate payoffs
         payoff_0, payoff_1 = self.config.payoff_matrix[(action_0, action_1)]
         
@@ -110,6 +215,12 @@ class EpisodicIPDGame:
             'opp_payoff': payoff_0
         })
         
+        # Latency and token counts of both decision calls
+        telemetry_0 = self.agent_0.last_call_telemetry
+        telemetry_1 = self.agent_1.last_call_telemetry
+        self._episode_telemetry[0].append(telemetry_0)
+        self._episode_telemetry[1].append(telemetry_1)
+        
         # Record round details
         round_data = {
             'round': round_num + 1,
@@ -120,13 +231,23 @@ class EpisodicIPDGame:
             'agent_0_payoff': payoff_0,
             'agent_1_payoff': payoff_1,
             'agent_0_episode_score': episode_scores[0],
-            'agent_1_episode_score': episode_scores[1]
+            'agent_1_episode_score': episode_scores[1],
+            'agent_0_telemetry': telemetry_0,
+            'agent_1_telemetry': telemetry_1
         }
         
         if self.config.verbose:
             print(f"→ {action_0[0]}{action_1[0]} ({payoff_0},{payoff_1})", flush=True)
         
-        return action_0, action_1, round_data
+        return round_data
+    
+    def _store_round(self, round_details: List[Dict], episode_num: int, round_data: Dict):
+        """Stream a round to the round log and keep it in memory unless configured not to"""
+        if self.round_log is not None:
+            self.round_log.write({'type': 'round', 'episode': episode_num + 1, **round_data})
+        
+        if self.config.keep_rounds_in_memory or self.round_log is None:
+            round_details.append(round_data)
     
     def play_episode(self, episode_num: int) -> Dict:
         """
@@ -135,9 +256,7 @@ class EpisodicIPDGame:
         Returns:
             Episode data dictionary
         """
-        print(f"\n{'='*80}", flush=True)
-        print(f"PERIOD {episode_num + 1}/{self.config.num_episodes}", flush=True)
-        print(f"{'='*80}", flush=True)
+        self._start_episode(episode_num)
         
         # Episode-specific state
         episode_history_0 = []
@@ -152,9 +271,54 @@ class EpisodicIPDGame:
                 episode_history_0, episode_history_1,
                 episode_scores
             )
-            round_details.append(round_data)
+            self._store_round(round_details, episode_num, round_data)
         
-        # Calculate episode statistics
+        coop_0, coop_1 = self._report_episode(
+            episode_num, episode_history_0, episode_history_1, episode_scores
+        )
+        
+        # Get reflections from both agents
+        print(f"\nGetting reflections...", flush=True)
+        reflection_0, reflection_1 = self._run_pair(
+            lambda: self._get_reflection(
+                self.agent_0, episode_num, episode_history_0, 
+                episode_scores[0], episode_scores[1]
+            ),
+            lambda: self._get_reflection(
+                self.agent_1, episode_num, episode_history_1,
+                episode_scores[1], episode_scores[0]
+            )
+        )
+        
+        return self._finish_episode(
+            episode_num, round_details, episode_scores,
+            coop_0, coop_1, reflection_0, reflection_1
+        )
+    
+    def _start_episode(self, episode_num: int):
+        """Reset per-episode telemetry and print the episode banner"""
+        self._episode_telemetry = {0: [], 1: []}
+        self._print_episode_header(episode_num)
+    
+    def _print_episode_header(self, episode_num: int):
+        """Print the banner at the start of an episode"""
+        print(f"\n{'='*80}", flush=True)
+        print(f"PERIOD {episode_num + 1}/{self.config.num_episodes}", flush=True)
+        print(f"{'='*80}", flush=True)
+    
+    def _report_episode(
+        self,
+        episode_num: int,
+        episode_history_0: List[Dict],
+        episode_history_1: List[Dict],
+        episode_scores: Dict[int, int]
+    ) -> Tuple[int, int]:
+        """
+        Calculate and print episode statistics
+        
+        Returns:
+            (coop_0, coop_1) cooperation counts
+        """
         coop_0 = sum(1 for r in episode_history_0 if r['my_action'] == 'COOPERATE')
         coop_1 = sum(1 for r in episode_history_1 if r['my_action'] == 'COOPERATE')
         
@@ -162,17 +326,19 @@ class EpisodicIPDGame:
         print(f"  Agent 0: {episode_scores[0]} points ({coop_0}/{self.config.rounds_per_episode} cooperate)", flush=True)
         print(f"  Agent 1: {episode_scores[1]} points ({coop_1}/{self.config.rounds_per_episode} cooperate)", flush=True)
         
-        # Get reflections from both agents
-        print(f"\nGetting reflections...", flush=True)
-        reflection_0 = self._get_reflection(
-            self.agent_0, episode_num, episode_history_0, 
-            episode_scores[0], episode_scores[1]
-        )
-        reflection_1 = self._get_reflection(
-            self.agent_1, episode_num, episode_history_1,
-            episode_scores[1], episode_scores[0]
-        )
-        
+        return coop_0, coop_1
+    
+    def _finish_episode(
+        self,
+        episode_num: int,
+        round_details: List[Dict],
+        episode_scores: Dict[int, int],
+        coop_0: int,
+        coop_1: int,
+        reflection_0: str,
+        reflection_1: str
+    ) -> Dict:
+        """Manage agent context for the next episode and return the episode data"""
         # Manage context for next episode
         if self.config.reset_conversation_between_episodes:
             # Keep system prompt and reflections, clear tactical history
@@ -194,13 +360,17 @@ class EpisodicIPDGame:
                 'episode_score': episode_scores[0],
                 'cooperations': coop_0,
                 'cooperation_rate': coop_0 / self.config.rounds_per_episode,
-                'reflection': reflection_0
+                'reflection': reflection_0,
+                'decision_telemetry': aggregate_telemetry(self._episode_telemetry[0]),
+                'reflection_telemetry': self.agent_0.last_call_telemetry
             },
             'agent_1': {
                 'episode_score': episode_scores[1],
                 'cooperations': coop_1,
                 'cooperation_rate': coop_1 / self.config.rounds_per_episode,
-                'reflection': reflection_1
+                'reflection': reflection_1,
+                'decision_telemetry': aggregate_telemetry(self._episode_telemetry[1]),
+                'reflection_telemetry': self.agent_1.last_call_telemetry
             }
         }
         
@@ -213,6 +383,123 @@ class EpisodicIPDGame:
         Returns:
             Game results dictionary
         """
+        self._print_game_header()
+        self._log_game_start()
+        
+        start_time = time.time()
+        
+        # Play all episodes (continuing after the last checkpointed one)
+        try:
+            for episode_num in range(len(self.all_episodes), self.config.num_episodes):
+                episode_data = self.play_episode(episode_num)
+                self._complete_episode(episode_data, start_time)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+        
+        elapsed_time = self.prior_elapsed_seconds + time.time() - start_time
+        
+        results = self._build_results(elapsed_time)
+        
+        self._print_summary(results)
+        
+        return results
+    
+    def _log_game_start(self):
+        """Record the game configuration at the top of (each resumed segment of) the round log"""
+        if self.round_log is not None:
+            self.round_log.write({
+                'type': 'game',
+                'started_at': datetime.now().isoformat(),
+                'first_episode': len(self.all_episodes) + 1,
+                'config': asdict(self.config)
+            })
+    
+    def _complete_episode(self, episode_data: Dict, start_time: float):
+        """Store a finished episode, log its summary, and checkpoint the game"""
+        self.all_episodes.append(episode_data)
+        
+        if self.round_log is not None:
+            summary = {k: v for k, v in episode_data.items() if k != 'rounds'}
+            self.round_log.write({'type': 'episode', **summary})
+            self.round_log.sync()
+        
+        if self.checkpoint_path:
+            self.save_checkpoint(self.prior_elapsed_seconds + time.time() - start_time)
+    
+    def save_checkpoint(self, elapsed_seconds: float, path: Optional[str] = None):
+        """
+        Write game state after the last completed episode
+        
+        Args:
+            elapsed_seconds: Play time so far
+            path: Checkpoint file (default: self.checkpoint_path)
+        """
+        checkpoint = {
+            'checkpoint_version': CHECKPOINT_VERSION,
+            'saved_at': datetime.now().isoformat(),
+            'config': asdict(self.config),
+            'completed_episodes': len(self.all_episodes),
+            'elapsed_seconds': elapsed_seconds,
+            'total_scores': [self.total_scores[0], self.total_scores[1]],
+            'episodes': self.all_episodes,
+            'conversations': {
+                'agent_0': self.agent_0.conversation,
+                'agent_1': self.agent_1.conversation
+            },
+            'reflection_indices': {
+                'agent_0': self.agent_0.get_reflection_indices(),
+                'agent_1': self.agent_1.get_reflection_indices()
+            },
+            'prompt_eval_logs': {
+                'agent_0': self.agent_0.prompt_eval_log,
+                'agent_1': self.agent_1.prompt_eval_log
+            }
+        }
+        write_json_atomic(path or self.checkpoint_path, checkpoint)
+    
+    def load_checkpoint(self, path: Optional[str] = None) -> int:
+        """
+        Restore game state from a checkpoint so play_game() resumes after it
+        
+        Args:
+            path: Checkpoint file (default: self.checkpoint_path)
+            
+        Returns:
+            Number of completed episodes restored
+        """
+        path = path or self.checkpoint_path
+        with open(path, 'r') as f:
+            checkpoint = json.load(f)
+        
+        if checkpoint.get('checkpoint_version') != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version in {path}: "
+                             f"{checkpoint.get('checkpoint_version')}")
+        
+        saved_config = checkpoint['config']
+        mismatched = [field for field in CHECKPOINT_GAME_FIELDS
+                      if saved_config.get(field) != getattr(self.config, field)]
+        if mismatched:
+            raise ValueError(f"Checkpoint {path} was written with a different configuration: "
+                             + ", ".join(f"{field}={saved_config.get(field)!r}" for field in mismatched))
+        
+        self.all_episodes = checkpoint['episodes']
+        self.total_scores = {0: checkpoint['total_scores'][0], 1: checkpoint['total_scores'][1]}
+        self.prior_elapsed_seconds = checkpoint['elapsed_seconds']
+        reflection_indices = checkpoint.get('reflection_indices', {})
+        self.agent_0.restore_conversation(checkpoint['conversations']['agent_0'],
+                                          reflection_indices.get('agent_0'))
+        self.agent_1.restore_conversation(checkpoint['conversations']['agent_1'],
+                                          reflection_indices.get('agent_1'))
+        prompt_eval_logs = checkpoint.get('prompt_eval_logs', {})
+        self.agent_0.prompt_eval_log = prompt_eval_logs.get('agent_0', [])
+        self.agent_1.prompt_eval_log = prompt_eval_logs.get('agent_1', [])
+        
+        return len(self.all_episodes)
+    
+    def _print_game_header(self):
+        """Print the game configuration banner"""
         print(f"\n{'='*80}", flush=True)
         print(f"EPISODIC IPD SIMULATION", flush=True)
         print(f"{'='*80}", flush=True)
@@ -224,21 +511,38 @@ class EpisodicIPDGame:
         print(f"Agent 1: {self.agent_1.model}", flush=True)
         print(f"Temperature: {self.config.temperature}", flush=True)
         print(f"Reset between episodes: {self.config.reset_conversation_between_episodes}", flush=True)
+        if self.config.max_context_exchanges is not None or self.config.context_token_budget is not None:
+            print(f"Context bound: {self.config.max_context_exchanges} exchanges, "
+                  f"{self.config.keep_reflections} reflection(s), "
+                  f"{self.config.context_token_budget} token budget", flush=True)
+        print(f"Concurrent agents: {self.config.concurrent_agents}", flush=True)
+        if self.config.kv_cache:
+            print(f"KV cache: keep_alive={self.config.keep_alive}, num_ctx={self.config.num_ctx}", flush=True)
         print(f"{'='*80}", flush=True)
-        
-        start_time = time.time()
-        
-        # Play all episodes
-        for episode_num in range(self.config.num_episodes):
-            episode_data = self.play_episode(episode_num)
-            self.all_episodes.append(episode_data)
-        
-        elapsed_time = time.time() - start_time
-        
+    
+    def _agent_telemetry(self, agent_key: str) -> Dict:
+        """Aggregate an agent's decision and reflection telemetry over all episodes"""
+        return {
+            'decisions': merge_telemetry([ep[agent_key].get('decision_telemetry')
+                                          for ep in self.all_episodes]),
+            'reflections': aggregate_telemetry([ep[agent_key].get('reflection_telemetry')
+                                                for ep in self.all_episodes])
+        }
+    
+    def _build_results(self, elapsed_time: float) -> Dict:
+        """Assemble the game results dictionary written to the results JSON"""
         # Final summary
         total_coop_0 = sum(ep['agent_0']['cooperations'] for ep in self.all_episodes)
         total_coop_1 = sum(ep['agent_1']['cooperations'] for ep in self.all_episodes)
         
+        episodes = self.all_episodes
+        if self.round_log is not None and not self.config.keep_rounds_in_memory:
+            # Rounds were only streamed to disk; read them back for the final results
+            self.round_log.sync()
+            logged_rounds = load_episode_rounds(self.round_log.path)
+            episodes = [{**ep, 'rounds': logged_rounds.get(ep['episode'], [])}
+                        for ep in self.all_episodes]
+        
         results = {
             'timestamp': datetime.now().isoformat(),
             'hostname': socket.gethostname(),
@@ -262,7 +566,11 @@ class EpisodicIPDGame:
                 'decision_token_limit': self.config.decision_token_limit,
                 'reflection_token_limit': self.config.reflection_token_limit,
                 'http_timeout': self.config.http_timeout,
-                'force_decision_retries': self.config.force_decision_retries
+                'force_decision_retries': self.config.force_decision_retries,
+                'structured_decisions': self.config.structured_decisions,
+                'max_context_exchanges': self.config.max_context_exchanges,
+                'keep_reflections': self.config.keep_reflections,
+                'context_token_budget': self.config.context_token_budget
             },
             'elapsed_seconds': elapsed_time,
             'agent_0': {
@@ -270,17 +578,25 @@ class EpisodicIPDGame:
                 'total_score': self.total_scores[0],
                 'total_cooperations': total_coop_0,
                 'overall_cooperation_rate': total_coop_0 / self.config.total_rounds,
+                'telemetry': self._agent_telemetry('agent_0')
             },
             'agent_1': {
                 'model': self.agent_1.model,
                 'total_score': self.total_scores[1],
                 'total_cooperations': total_coop_1,
                 'overall_cooperation_rate': total_coop_1 / self.config.total_rounds,
+                'telemetry': self._agent_telemetry('agent_1')
             },
-            'episodes': self.all_episodes
+            'episodes': episodes
         }
         
-        self._print_summary(results)
+        if self.config.kv_cache:
+            results['prompt_cache'] = {
+                'keep_alive': self.config.keep_alive,
+                'num_ctx': self.config.num_ctx,
+                'agent_0': self.agent_0.get_prompt_cache_stats(),
+                'agent_1': self.agent_1.get_prompt_cache_stats()
+            }
         
         return results
     
@@ -296,10 +612,7 @@ class EpisodicIPDGame:
     ) -> Tuple[str, str]:
         """Get decision from an agent with retry logic for ambiguous responses"""
         
-        prompt = format_round_prompt(
-            round_num, episode_num, history, my_score, opp_score,
-            self.config.history_window_size
-        )
+        prompt = self._decision_prompt(round_num, episode_num, history, my_score, opp_score)
         
         # Use the new forced decision method
         decision, response = agent.generate_with_forced_decision(
@@ -307,6 +620,24 @@ class EpisodicIPDGame:
             extract_decision
         )
         
+        return self._resolve_decision(agent, decision, response)
+    
+    def _decision_prompt(
+        self,
+        round_num: int,
+        episode_num: int,
+        history: List[Dict],
+        my_score: int,
+        opp_score: int
+    ) -> str:
+        """Build the round prompt for one agent"""
+        return format_round_prompt(
+            round_num, episode_num, history, my_score, opp_score,
+            self.config.history_window_size
+        )
+    
+    def _resolve_decision(self, agent: OllamaAgent, decision: str, response: str) -> Tuple[str, str]:
+        """Apply the DEFECT fallback when an agent never produced a decision"""
         if decision is None:
             # Even forced retry failed - this is a critical error
             print(f"  ⚠️  CRITICAL: {agent.agent_id} failed to provide decision after all retries", flush=True)
@@ -328,16 +659,30 @@ class EpisodicIPDGame:
     ) -> str:
         """Get post-episode reflection from agent"""
         
-        prompt = format_episode_reflection_prompt(
+        prompt = self._reflection_prompt(episode_num, history, my_score, opp_score)
+        
+        # Reflections use higher token limit
+        reflection = agent.generate(prompt, is_reflection=True)
+        
+        return self._resolve_reflection(reflection)
+    
+    def _reflection_prompt(
+        self,
+        episode_num: int,
+        history: List[Dict],
+        my_score: int,
+        opp_score: int
+    ) -> str:
+        """Build the post-episode reflection prompt for one agent"""
+        return format_episode_reflection_prompt(
             episode_num, history, my_score, opp_score,
             self.config.rounds_per_episode,
             self.config.reflection_prompt_type,
             self.config.include_statistics
         )
-        
-        # Reflections use higher token limit
-        reflection = agent.generate(prompt, is_reflection=True)
-        
+    
+    def _resolve_reflection(self, reflection: str) -> str:
+        """Substitute a placeholder when an agent failed to reflect"""
         if reflection is None:
             return "Agent failed to provide reflection"
         
@@ -366,11 +711,29 @@ class EpisodicIPDGame:
                   f"({ep['agent_0']['cooperation_rate']*100:.0f}% coop), "
                   f"Agent 1: {ep['agent_1']['episode_score']} pts "
                   f"({ep['agent_1']['cooperation_rate']*100:.0f}% coop)", flush=True)
+        if 'prompt_cache' in results:
+            print(flush=True)
+            print("PROMPT CACHE:", flush=True)
+            for agent_key in ('agent_0', 'agent_1'):
+                stats = results['prompt_cache'][agent_key]
+                print(f"  {agent_key}: {stats['requests']} requests, "
+                      f"{stats['prompt_eval_tokens']} of ~{stats['prompt_tokens_estimate']} prompt tokens evaluated "
+                      f"(~{stats['cached_rate_estimate']*100:.0f}% from cache)", flush=True)
+        print(flush=True)
+        print("LLM CALLS:", flush=True)
+        for agent_key in ('agent_0', 'agent_1'):
+            decisions = results[agent_key]['telemetry']['decisions']
+            reflections = results[agent_key]['telemetry']['reflections']
+            print(f"  {agent_key}: decisions {decisions['mean_wall_seconds']:.2f}s mean / "
+                  f"{decisions['max_wall_seconds']:.2f}s max, {decisions['retries']} retries "
+                  f"({decisions['forced_retries']} forced), "
+                  f"{decisions['eval_count']} tokens generated; "
+                  f"reflections {reflections['mean_wall_seconds']:.2f}s mean", flush=True)
         print(f"{'='*80}\n", flush=True)
 
 
-def main():
-    """Run an episodic IPD game"""
+def build_arg_parser():
+    """Build the command line parser shared by the game entry points"""
     import argparse
 
     parser = argparse.ArgumentParser(description="Episodic IPD with LLM Agents")
@@ -393,6 +756,12 @@ def main():
     # End Containerized Architecture changes @edc, 3/30/2026 #######################################
 
     parser.add_argument("--no-reset", action="store_true", help="Don't reset context between episodes")
+    parser.add_argument("--max-context-exchanges", type=int, default=None,
+                       help="Keep only the last N prompt/response exchanges in agent context (default: unbounded)")
+    parser.add_argument("--keep-reflections", type=int, default=1,
+                       help="Latest reflections kept in context when truncating (default: 1)")
+    parser.add_argument("--context-token-budget", type=int, default=None,
+                       help="Drop oldest context until its estimated size fits N tokens (default: no budget)")
     parser.add_argument("--reflection-type", type=str, default="standard", 
                        choices=["minimal", "standard", "detailed"])
     parser.add_argument("--system-prompt", type=str, default="system_prompt.txt",
@@ -409,11 +778,46 @@ def main():
                        help="HTTP request timeout in seconds (default: 60)")
     parser.add_argument("--force-retries", type=int, default=2,
                        help="Retries for ambiguous decisions (default: 2)")
+    parser.add_argument("--structured", action="store_true",
+                       help="Constrain decisions to JSON {reasoning, action} with Ollama's format parameter")
+    parser.add_argument("--concurrent", action="store_true",
+                       help="Send both agents' decision and reflection requests in parallel")
+    parser.add_argument("--pool-size", type=int, default=4,
+                       help="Keep-alive HTTP connections per Ollama server (default: 4)")
+    parser.add_argument("--pool-idle-timeout", type=int, default=300,
+                       help="Seconds before idle pooled connections are dropped (default: 300)")
+    parser.add_argument("--kv-cache", action="store_true",
+                       help="Keep models loaded and pin the context size so Ollama reuses the cached prompt prefix")
+    parser.add_argument("--keep-alive", type=str, default="30m",
+                       help="With --kv-cache: how long Ollama keeps the model loaded (default: 30m)")
+    parser.add_argument("--num-ctx", type=int, default=8192,
+                       help="With --kv-cache: fixed context window in tokens (default: 8192)")
     parser.add_argument("--comment", type=str, default=None,
                        help="Optional comment/note about this job run")
+    parser.add_argument("--checkpoint", type=str, default=None,
+                       help="Checkpoint file written after every episode "
+                            "(default: <output>.checkpoint.json)")
+    parser.add_argument("--no-checkpoint", action="store_true",
+                       help="Don't write per-episode checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                       help="Resume from the checkpoint after its last completed episode")
+    parser.add_argument("--round-log", type=str, default=None,
+                       help="Append every round and episode summary to this JSONL file as it is played")
+    parser.add_argument("--round-log-fsync", type=float, default=5.0,
+                       help="Max seconds between round log fsyncs (default: 5)")
+    parser.add_argument("--no-keep-rounds", action="store_true",
+                       help="Keep rounds only in the round log; they are read back for the final JSON")
     
-    args = parser.parse_args()
+    return parser
+
+
+def load_prompts(args) -> Tuple[str, str]:
+    """
+    Load the system prompt and reflection template named on the command line
     
+    Returns:
+        (system_prompt, reflection_template)
+    """
     # Load system prompt from file or use default
     try:
         system_prompt = load_system_prompt(args.system_prompt)
@@ -427,10 +831,14 @@ def main():
         reflection_template = load_reflection_template(args.reflection_template)
         print(f"Loaded reflection template from: {args.reflection_template}", flush=True)
     except FileNotFoundError:
-        reflection_template = ""  # Will use built-in templates    
+        reflection_template = ""  # Will use built-in templates
     
-    # Create configuration
-    config = EpisodeConfig(
+    return system_prompt, reflection_template
+
+
+def config_from_args(args) -> EpisodeConfig:
+    """Build the game configuration from parsed command line arguments"""
+    return EpisodeConfig(
         num_episodes=args.episodes,
         rounds_per_episode=args.rounds,
         history_window_size=args.history_window,
@@ -442,15 +850,41 @@ def main():
         reset_conversation_between_episodes=not args.no_reset,
         reflection_prompt_type=args.reflection_type,
         verbose=not args.quiet,
+        concurrent_agents=args.concurrent,
         decision_token_limit=args.decision_tokens,
         reflection_token_limit=args.reflection_tokens,
         http_timeout=args.http_timeout,
-        force_decision_retries=args.force_retries
+        force_decision_retries=args.force_retries,
+        structured_decisions=args.structured,
+        http_pool_size=args.pool_size,
+        http_pool_idle_timeout=args.pool_idle_timeout,
+        keep_rounds_in_memory=not (args.no_keep_rounds and args.round_log),
+        max_context_exchanges=args.max_context_exchanges,
+        keep_reflections=args.keep_reflections,
+        context_token_budget=args.context_token_budget,
+        kv_cache=args.kv_cache,
+        keep_alive=args.keep_alive,
+        num_ctx=args.num_ctx
     )
+
+
+def create_agents(config: EpisodeConfig, system_prompt: str, agent_cls=OllamaAgent) -> Tuple:
+    """
+    Create both agents described by a configuration
     
-    # Create agents
-    print("Initializing agents...", flush=True)
-    agent_0 = OllamaAgent(
+    Args:
+        config: Game configuration
+        system_prompt: System prompt text given to both agents
+        agent_cls: Agent class to instantiate (OllamaAgent or AsyncOllamaAgent)
+        
+    Returns:
+        (agent_0, agent_1)
+    """
+    cache_options = {}
+    if config.kv_cache:
+        cache_options = {'keep_alive': config.keep_alive, 'num_ctx': config.num_ctx}
+    
+    agent_0 = agent_cls(
         agent_id="agent_0",
         model=config.model_0,
         host=config.host_0,
@@ -459,10 +893,17 @@ def main():
         decision_token_limit=config.decision_token_limit,
         reflection_token_limit=config.reflection_token_limit,
         http_timeout=config.http_timeout,
-        force_decision_retries=config.force_decision_retries
+        force_decision_retries=config.force_decision_retries,
+        pool_size=config.http_pool_size,
+        pool_idle_timeout=config.http_pool_idle_timeout,
+        max_context_exchanges=config.max_context_exchanges,
+        keep_reflections=config.keep_reflections,
+        context_token_budget=config.context_token_budget,
+        structured_decisions=config.structured_decisions,
+        **cache_options
     )
     
-    agent_1 = OllamaAgent(
+    agent_1 = agent_cls(
         agent_id="agent_1",
         model=config.model_1,
         host=config.host_1,
@@ -471,29 +912,98 @@ def main():
         decision_token_limit=config.decision_token_limit,
         reflection_token_limit=config.reflection_token_limit,
         http_timeout=config.http_timeout,
-        force_decision_retries=config.force_decision_retries
-    )
-    
-    # Create and play game
-    game = EpisodicIPDGame(
-        agent_0, 
-        agent_1, 
-        config, 
-        system_prompt_text=system_prompt, 
-        reflection_template_text=reflection_template
+        force_decision_retries=config.force_decision_retries,
+        pool_size=config.http_pool_size,
+        pool_idle_timeout=config.http_pool_idle_timeout,
+        max_context_exchanges=config.max_context_exchanges,
+        keep_reflections=config.keep_reflections,
+        context_token_budget=config.context_token_budget,
+        structured_decisions=config.structured_decisions,
+        **cache_options
     )
-    results = game.play_game()
     
-    # Inject comment into results metadata if provided
-    if args.comment:
-        results = {'comment': args.comment, **results}
+    return agent_0, agent_1
+
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def resolve_output_path(output: str = None) -> Path:
+    """Return the results JSON path (default: results/episodic_game_<timestamp>.json)"""
+    if output:
+        return Path(output)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return RESULTS_DIR / f"episodic_game_{timestamp}.json"
+
+
+def latest_checkpoint() -> Optional[Path]:
+    """Return the most recently written results/*.checkpoint.json, if any"""
+    checkpoints = list(RESULTS_DIR.glob("*.checkpoint.json"))
+    return max(checkpoints, key=lambda path: path.stat().st_mtime) if checkpoints else None
+
+
+def resolve_checkpoint_path(args) -> Optional[Path]:
+    """
+    Return the checkpoint file for a run, or None if checkpointing is off
     
-    # Save results
-    if args.output:
+    --checkpoint wins, then <output>.checkpoint.json. Without --output a new
+    run checkpoints to results/episodic_game_<start timestamp>.checkpoint.json,
+    and --resume picks up the newest checkpoint in results/.
+    """
+    if args.no_checkpoint and not args.resume:
+        return None
+    if args.checkpoint:
+        checkpoint_path = Path(args.checkpoint)
+    elif args.output:
         output_path = Path(args.output)
+        checkpoint_path = output_path.with_name(output_path.stem + ".checkpoint.json")
+    elif args.resume:
+        checkpoint_path = latest_checkpoint()
+        if checkpoint_path is None:
+            raise FileNotFoundError(f"No checkpoint to resume in {RESULTS_DIR}; pass --checkpoint or --output")
     else:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path(__file__).parent / "results" / f"episodic_game_{timestamp}.json"
+        checkpoint_path = RESULTS_DIR / f"episodic_game_{timestamp}.checkpoint.json"
+    
+    if not args.resume:
+        print(f"Checkpointing to: {checkpoint_path}", flush=True)
+    return checkpoint_path
+
+
+def open_round_log(args) -> Optional[JsonlRoundLog]:
+    """Open the JSONL round log named on the command line, if any"""
+    if not args.round_log:
+        return None
+    print(f"Streaming rounds to: {args.round_log}", flush=True)
+    return JsonlRoundLog(args.round_log, fsync_interval=args.round_log_fsync)
+
+
+def prepare_resume(game: EpisodicIPDGame, checkpoint_path: Path):
+    """Restore a game from its checkpoint before play_game()"""
+    if not checkpoint_path or not checkpoint_path.exists():
+        raise FileNotFoundError(f"Checkpoint file not found: {checkpoint_path}")
+    completed = game.load_checkpoint(str(checkpoint_path))
+    print(f"Resuming from {checkpoint_path}: {completed}/{game.config.num_episodes} episodes complete", flush=True)
+
+
+def save_results(results: Dict, output: str = None, comment: str = None) -> Path:
+    """
+    Write game results to JSON
+    
+    Args:
+        results: Results dictionary from play_game()
+        output: Output path (default: results/episodic_game_<timestamp>.json)
+        comment: Optional free-text note stored at the top of the JSON
+        
+    Returns:
+        Path the results were written to
+    """
+    # Inject comment into results metadata if provided
+    if comment:
+        results = {'comment': comment, **results}
+    
+    # Save results
+    output_path = resolve_output_path(output)
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
@@ -501,6 +1011,60 @@ def main():
         json.dump(results, f, indent=2)
     
     print(f"Results saved to: {output_path}", flush=True)
+    
+    return output_path
+
+
+def report_connection_stats():
+    """Print HTTP connection reuse for each Ollama server"""
+    for stats in get_all_session_stats():
+        print(f"Connection pool {stats['base_url']}: {stats['requests']} requests, "
+              f"{stats['connections_opened']} connections opened, "
+              f"{stats['reuse_rate']*100:.1f}% reused", flush=True)
+
+
+def main():
+    """Run an episodic IPD game"""
+    parser = build_arg_parser()
+    args = parser.parse_args()
+    
+    system_prompt, reflection_template = load_prompts(args)
+    
+    # Create configuration
+    config = config_from_args(args)
+    
+    # Create agents
+    print("Initializing agents...", flush=True)
+    agent_0, agent_1 = create_agents(config, system_prompt)
+    
+    checkpoint_path = resolve_checkpoint_path(args)
+    round_log = open_round_log(args)
+    
+    # Create and play game
+    game = EpisodicIPDGame(
+        agent_0, 
+        agent_1, 
+        config, 
+        system_prompt_text=system_prompt, 
+        reflection_template_text=reflection_template,
+        checkpoint_path=str(checkpoint_path) if checkpoint_path else None,
+        round_log=round_log
+    )
+    if args.resume:
+        prepare_resume(game, checkpoint_path)
+    try:
+        results = game.play_game()
+    finally:
+        if round_log is not None:
+            round_log.close()
+    
+    report_connection_stats()
+    
+    save_results(results, args.output, args.comment)
+    
+    # The results file supersedes the checkpoint
+    if checkpoint_path and checkpoint_path.exists():
+        checkpoint_path.unlink()
 
 
 if __name__ == "__main__":
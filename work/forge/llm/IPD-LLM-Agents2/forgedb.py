@@ -16,17 +16,40 @@
     Revision History:
         20260316: Added new DB field "comment", updated method load_json() @edc
         20260329: Updated for compatibility with containerized architecture @edc
+        20261017: load_json() loads LLM call telemetry into llm_agents, episodes, rounds
+        20261017: Added parse_results_file() and COPY-based load_json_bulk(), --bulk
+        20261017: load_batch() parses/loads in parallel with workers > 1, --workers
+        20261017: Added ipd2.ingest_manifest; load_batch()/get_files() skip files
+                  already loaded and report files changed since their import
+        20261017: Added iter_results(), iter_rounds_summary(), iter_rounds_detail()
+                  (chunked reads through a server-side cursor)
+        20261017: Query methods take as_arrow=True; added export_parquet()
+        20261017: Summary queries read materialized views; added refresh_summaries(),
+                  called after imports
 """
 
 import argparse
 import glob
+import hashlib
+import itertools
 import json
 import logging
 import os
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 
 import pandas as pd
 import psycopg
-from psycopg.rows import dict_row
+from psycopg.rows import dict_row, tuple_row
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -37,6 +60,260 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# LLM call telemetry: results JSON field -> column name suffix
+TELEMETRY_COLUMNS = {
+    'wall_seconds':         'wall_seconds',
+    'http_seconds':         'http_seconds',
+    'requests':             'llm_requests',
+    'retries':              'retries',
+    'prompt_eval_count':    'prompt_eval_count',
+    'eval_count':           'eval_count',
+    'eval_duration':        'eval_duration_ns',
+    'load_duration':        'load_duration_ns',
+}
+
+# Aggregated telemetry (per episode / per agent) adds call counts and latency stats
+TELEMETRY_AGGREGATE_COLUMNS = {
+    'calls':                'calls',
+    'mean_wall_seconds':    'mean_wall_seconds',
+    'max_wall_seconds':     'max_wall_seconds',
+    **TELEMETRY_COLUMNS
+}
+
+
+def telemetry_params(telemetry, prefix='', columns=TELEMETRY_COLUMNS):
+    """
+    Map a telemetry object from the results JSON to INSERT parameters.
+
+    Older JSON files have no telemetry; every column is then NULL.
+    """
+    telemetry = telemetry or {}
+    return {prefix + column: telemetry.get(field) for field, column in columns.items()}
+
+
+# Columns written for each staged row (the staged dicts use the same keys)
+AGENT_COLUMNS = (
+    ['agent_idx', 'host', 'agent_model', 'cfg_model', 'total_score',
+     'total_cooperations', 'overall_cooperation_rate']
+    + ['dec_' + col for col in TELEMETRY_AGGREGATE_COLUMNS.values()]
+    + ['refl_' + col for col in TELEMETRY_AGGREGATE_COLUMNS.values()]
+)
+EPISODE_COLUMNS = (
+    ['agent_idx', 'episode', 'score', 'cooperations', 'cooperation_rate', 'reflection']
+    + ['dec_' + col for col in TELEMETRY_AGGREGATE_COLUMNS.values()]
+    + ['refl_' + col for col in TELEMETRY_COLUMNS.values()]
+)
+ROUND_COLUMNS = (
+    ['round', 'action', 'payoff', 'ep_cumulative_score', 'reasoning']
+    + list(TELEMETRY_COLUMNS.values())
+)
+
+
+def parse_results_file(filepath, user_name='unknown'):
+    """
+    Parse a results JSON file into the rows load_json() writes.
+
+    Returns plain dicts and lists only, so the result can be sent between
+    processes:
+        {'filepath', 'results': {...},
+         'agents': [{...}],
+         'episodes': [{..., 'rounds': [{...}]}],   # episode-major, then agent
+         'manifest': {...}}                        # ipd2.ingest_manifest row
+    """
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    data = json.loads(content)
+    stat = os.stat(filepath)
+
+    # Capture the results filename
+    filename = os.path.basename(filepath)
+
+    # Set username for older JSON file versions
+    researcher = data.get('username', user_name)
+
+    results = {
+        # Session metadata
+        'filename':                 filename,
+        'timestamp':                data['timestamp'],
+        'hostname':                 data.get('hostname', None),
+        'username':                 researcher,
+        'elapsed_seconds':          data['elapsed_seconds'],
+
+        # Config fields
+        'num_episodes':             data['config']['num_episodes'],
+        'rounds_per_episode':       data['config']['rounds_per_episode'],
+        'total_rounds':             data['config']['total_rounds'],
+        'history_window_size':      data['config']['history_window_size'],
+        'temperature':              data['config']['temperature'],
+        'reset_between_episodes':   data['config']['reset_between_episodes'],
+        'reflection_type':          data['config']['reflection_type'],
+        'decision_token_limit':     data['config']['decision_token_limit'],
+        'reflection_token_limit':   data['config']['reflection_token_limit'],
+        'http_timeout':             data['config']['http_timeout'],
+        'force_decision_retries':   data['config']['force_decision_retries'],
+
+        # Prompts
+        'system_prompt':            data['prompts']['system_prompt'],
+        'reflection_template':      data['prompts']['reflection_template'],
+
+        # Raw JSON
+        'raw_json':                 json.dumps(data),
+
+        # Comments
+        'comment':                  data.get('comment', None)
+    }
+
+    # llm_agents rows (variable number of agents)
+    agents = []
+    agent_idx = 0
+    while f'agent_{agent_idx}' in data:
+        agent_key = f'agent_{agent_idx}'
+        telemetry = data[agent_key].get('telemetry', {})
+
+        agents.append({
+            'agent_idx':                agent_idx,
+            'host':                     data.get(f'host_{agent_idx}', None),
+            'agent_model':              data[agent_key]['model'],
+            'cfg_model':                data['config'][f'model_{agent_idx}'],
+            'total_score':              data[agent_key]['total_score'],
+            'total_cooperations':       data[agent_key]['total_cooperations'],
+            'overall_cooperation_rate': data[agent_key]['overall_cooperation_rate'],
+
+            # LLM call telemetry
+            **telemetry_params(telemetry.get('decisions'), 'dec_',
+                               TELEMETRY_AGGREGATE_COLUMNS),
+            **telemetry_params(telemetry.get('reflections'), 'refl_',
+                               TELEMETRY_AGGREGATE_COLUMNS)
+        })
+        agent_idx += 1
+
+    # episodes rows, each with its rounds
+    episodes = []
+    for episode_data in data['episodes']:
+        agent_idx = 0
+        while f'agent_{agent_idx}' in episode_data:
+            agent_key = f'agent_{agent_idx}'
+
+            rounds = []
+            for round_data in episode_data['rounds']:
+                rounds.append({
+                    'round':               round_data['round'],
+                    'action':              round_data[f'agent_{agent_idx}_action'],
+                    'payoff':              round_data[f'agent_{agent_idx}_payoff'],
+                    'ep_cumulative_score': round_data[f'agent_{agent_idx}_episode_score'],
+                    'reasoning':           round_data[f'agent_{agent_idx}_reasoning'],
+                    **telemetry_params(round_data.get(f'agent_{agent_idx}_telemetry'))
+                })
+
+            episodes.append({
+                'agent_idx':        agent_idx,
+                'episode':          episode_data['episode'],
+                'score':            episode_data[agent_key]['episode_score'],
+                'cooperations':     episode_data[agent_key]['cooperations'],
+                'cooperation_rate': episode_data[agent_key]['cooperation_rate'],
+                'reflection':       episode_data[agent_key]['reflection'],
+
+                # LLM call telemetry
+                **telemetry_params(episode_data[agent_key].get('decision_telemetry'),
+                                   'dec_', TELEMETRY_AGGREGATE_COLUMNS),
+                **telemetry_params(episode_data[agent_key].get('reflection_telemetry'),
+                                   'refl_'),
+                'rounds':           rounds
+            })
+            agent_idx += 1
+
+    return {
+        'filepath': filepath,
+        'results':  results,
+        'agents':   agents,
+        'episodes': episodes,
+        'manifest': {
+            'filename':   filename,
+            'sha256':     hashlib.sha256(content).hexdigest(),
+            'size_bytes': stat.st_size,
+            'mtime_ns':   stat.st_mtime_ns
+        }
+    }
+
+
+def file_sha256(filepath):
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Views export_parquet() accepts
+VIEWS = (
+    'raw_data_vw',
+    'results_vw',
+    'experiment_summary_vw',
+    'episode_summary_vw',
+    'rounds_summary_vw',
+    'rounds_detail_vw',
+)
+
+# Summary views served from their materialized copies:
+#   view -> (materialized view, ORDER BY of the original view)
+MATERIALIZED_VIEWS = {
+    'experiment_summary_vw':    ('experiment_summary_mvw', 'timestamp'),
+    'episode_summary_vw':       ('episode_summary_mvw', 'timestamp, episode'),
+    'rounds_summary_vw':        ('rounds_summary_mvw', 'timestamp, episode, round'),
+}
+
+# Postgres type OIDs that need converting before they go into Arrow
+JSON_OIDS = (114, 3802)         # json, jsonb -> serialized strings
+NUMERIC_OID = 1700              # numeric -> float64
+
+
+def _arrow_schema(description):
+    """Arrow schema for a cursor description (unknown Postgres types become strings)."""
+    types = {
+        16:   pa.bool_(),
+        20:   pa.int64(),
+        21:   pa.int16(),
+        23:   pa.int32(),
+        700:  pa.float32(),
+        701:  pa.float64(),
+        1700: pa.float64(),
+        1082: pa.date32(),
+        1114: pa.timestamp('us'),
+        1184: pa.timestamp('us', tz='UTC'),
+        1009: pa.list_(pa.string()),   # text[]
+    }
+    return pa.schema([(col.name, types.get(col.type_code, pa.string()))
+                      for col in description])
+
+
+def _arrow_batch(rows, description, schema):
+    """Transpose tuple rows straight into one Arrow array per column."""
+    columns = list(zip(*rows)) if rows else [() for _ in description]
+    arrays = []
+    for values, col, field in zip(columns, description, schema):
+        if col.type_code in JSON_OIDS:
+            values = [None if v is None else json.dumps(v) for v in values]
+        elif col.type_code == NUMERIC_OID:
+            values = [None if v is None else float(v) for v in values]
+        elif field.type == pa.string():
+            values = [None if v is None else str(v) for v in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow is required for Arrow/Parquet output: pip install pyarrow")
+
+
+def _timed_parse(filepath, user_name):
+    """parse_results_file() plus its elapsed seconds (runs in worker processes)."""
+    start = time.perf_counter()
+    staged = parse_results_file(filepath, user_name)
+    return staged, time.perf_counter() - start
+
+
 class ForgeDB:
     def __init__(self, dbname='forge', host='platinum',  user=None):
         """Initialize connection to the forge database."""
@@ -49,14 +326,21 @@ class ForgeDB:
         port = int(os.environ.get('FORGE_CONN_DB_PORT', '5432'))
         db_user = os.environ.get('FORGE_DB_USER', user)
         
-        self.conn = psycopg.connect(
-            host=host,
-            port=port,
-            dbname=dbname,
-            user=db_user,
-            row_factory=dict_row
-        )
+        self._conninfo = {
+            'host': host,
+            'port': port,
+            'dbname': dbname,
+            'user': db_user
+        }
+        self.conn = self._connect()
+
+        # Unique names for server-side cursors (see _iter_view)
+        self._cursor_ids = itertools.count(1)
     
+    def _connect(self):
+        """Open a new connection with the same settings as self.conn."""
+        return psycopg.connect(**self._conninfo, row_factory=dict_row)
+
     def close(self):
         """Close the database connection."""
         self.conn.close()
@@ -81,7 +365,7 @@ class ForgeDB:
             return cur.fetchall()
 
     def get_raw_data(self, start_date=None, end_date=None, username=None, filename=None, 
-                comment=None, limit=None ):
+                comment=None, limit=None, as_arrow=False):
         """
         Query Iterative Prisoner's Dilemma (IPD) game results and return as a pandas DataFrame.
 
@@ -95,6 +379,7 @@ class ForgeDB:
             filename:   Filter by name of the results JSON file (full or partial, 
                             % is wildcard, case insensitive)
             limit:      Maximum rows to return
+            as_arrow:   Return a pyarrow.Table instead of a DataFrame
 
         Example Usage:
             db.get_results(username='dhart')
@@ -106,10 +391,11 @@ class ForgeDB:
                 end_date='2026-01-26 17:00:00')
         """
         return self._query_view('raw_data_vw', start_date=start_date, end_date=end_date, 
-            username=username, filename=filename, comment=comment, limit=limit)
+            username=username, filename=filename, comment=comment, limit=limit,
+            as_arrow=as_arrow)
 
     def get_results(self, start_date=None, end_date=None, username=None, filename=None, 
-                comment=None, limit=None ):
+                comment=None, limit=None, as_arrow=False):
         """
         Query Iterative Prisoner's Dilemma (IPD) game results and return as a pandas DataFrame.
 
@@ -125,12 +411,14 @@ class ForgeDB:
             filename:   Filter by name of the results JSON file (full or partial, 
                             % is wildcard, case insensitive)
             limit:      Maximum rows to return
+            as_arrow:   Return a pyarrow.Table instead of a DataFrame
         """
         return self._query_view('results_vw', start_date=start_date, end_date=end_date, 
-            username=username, filename=filename, comment=comment, limit=limit)
+            username=username, filename=filename, comment=comment, limit=limit,
+            as_arrow=as_arrow)
 
     def get_summary(self, start_date=None, end_date=None, username=None, filename=None, 
-                comment=None, limit=None ):
+                comment=None, limit=None, as_arrow=False):
         """
             Query Iterative Prisoner's Dilemma (IPD) game results and return as a pandas DataFrame.
 
@@ -145,12 +433,14 @@ class ForgeDB:
                 filename:   Filter by name of the results JSON file (full or partial, 
                                 % is wildcard, case insensitive)
                 limit:      Maximum rows to return
+                as_arrow:   Return a pyarrow.Table instead of a DataFrame
         """
         return self._query_view('experiment_summary_vw', start_date=start_date, end_date=end_date, 
-            username=username, filename=filename, comment=comment, limit=limit)
+            username=username, filename=filename, comment=comment, limit=limit,
+            as_arrow=as_arrow)
 
     def get_episode_summary(self, start_date=None, end_date=None, username=None, filename=None, 
-                    comment=None, limit=None ):
+                    comment=None, limit=None, as_arrow=False):
         """
             Query Iterative Prisoner's Dilemma (IPD) game results and return as a pandas DataFrame.
 
@@ -165,12 +455,14 @@ class ForgeDB:
                 filename:   Filter by name of the results JSON file (full or partial, 
                                 % is wildcard, case insensitive)
                 limit:      Maximum rows to return
+                as_arrow:   Return a pyarrow.Table instead of a DataFrame
         """
         return self._query_view('episode_summary_vw', start_date=start_date, end_date=end_date, 
-            username=username, filename=filename, comment=comment, limit=limit)
+            username=username, filename=filename, comment=comment, limit=limit,
+            as_arrow=as_arrow)
 
     def get_rounds_summary(self, start_date=None, end_date=None, username=None, filename=None, 
-                comment=None, limit=None ):
+                comment=None, limit=None, as_arrow=False):
         """
             Query Iterative Prisoner's Dilemma (IPD) game results and return as a pandas DataFrame.
 
@@ -185,12 +477,14 @@ class ForgeDB:
                 filename:   Filter by name of the results JSON file (full or partial, 
                                 % is wildcard, case insensitive)
                 limit:      Maximum rows to return
+                as_arrow:   Return a pyarrow.Table instead of a DataFrame
         """
         return self._query_view('rounds_summary_vw', start_date=start_date, end_date=end_date, 
-            username=username, filename=filename, comment=comment, limit=limit)
+            username=username, filename=filename, comment=comment, limit=limit,
+            as_arrow=as_arrow)
 
     def get_rounds_detail(self, start_date=None, end_date=None, username=None, filename=None, 
-                comment=None, limit=None ):
+                comment=None, limit=None, as_arrow=False):
         """
             Query Iterative Prisoner's Dilemma (IPD) game results and return as a pandas DataFrame.
 
@@ -204,38 +498,179 @@ class ForgeDB:
                 filename:   Filter by name of the results JSON file (full or partial, 
                                 % is wildcard, case insensitive)
                 limit:      Maximum rows to return
+                as_arrow:   Return a pyarrow.Table instead of a DataFrame
         """
         return self._query_view('rounds_detail_vw', start_date=start_date, end_date=end_date, 
-            username=username, filename=filename, comment=comment, limit=limit)
+            username=username, filename=filename, comment=comment, limit=limit,
+            as_arrow=as_arrow)
     
-    def _query_view(self, view_name, start_date=None, end_date=None, username=None, filename=None, 
+    def iter_results(self, chunksize=50_000, start_date=None, end_date=None, username=None,
+                filename=None, comment=None, limit=None):
+        """
+            Stream get_results() rows as DataFrames of at most chunksize rows.
+
+            Rows are read through a server-side cursor, so only one chunk is
+            held in memory at a time. Accepts the same filters as get_results().
+
+            Example Usage:
+                for df in db.iter_results(username='dhart'):
+                    totals.append(df.groupby('results_id')['payoff'].sum())
+        """
+        return self._iter_view('results_vw', chunksize, start_date=start_date, end_date=end_date,
+            username=username, filename=filename, comment=comment, limit=limit)
+
+    def iter_rounds_summary(self, chunksize=50_000, start_date=None, end_date=None, username=None,
+                filename=None, comment=None, limit=None):
+        """
+            Stream get_rounds_summary() rows as DataFrames of at most chunksize rows.
+            Accepts the same filters as get_rounds_summary().
+        """
+        return self._iter_view('rounds_summary_vw', chunksize, start_date=start_date,
+            end_date=end_date, username=username, filename=filename, comment=comment, limit=limit)
+
+    def iter_rounds_detail(self, chunksize=50_000, start_date=None, end_date=None, username=None,
+                filename=None, comment=None, limit=None):
+        """
+            Stream get_rounds_detail() rows as DataFrames of at most chunksize rows.
+            Accepts the same filters as get_rounds_detail().
+
+            Example Usage:
+                for df in db.iter_rounds_detail(chunksize=100_000):
+                    counts = counts.add(df['action'].value_counts(), fill_value=0)
+        """
+        return self._iter_view('rounds_detail_vw', chunksize, start_date=start_date,
+            end_date=end_date, username=username, filename=filename, comment=comment, limit=limit)
+
+    def export_parquet(self, view, path, partition_cols=None, chunksize=100_000,
+                start_date=None, end_date=None, username=None, filename=None,
                 comment=None, limit=None):
-        try:
-            sql = f"SELECT * FROM ipd2.{view_name} WHERE 1=1"
-            params = {}
-            
-            if start_date is not None:
-                sql += " AND timestamp >= %(start_date)s"
-                params['start_date'] = start_date
-            
-            if end_date is not None:
-                sql += " AND timestamp < %(end_date)s"
-                params['end_date'] = end_date
-            
-            if username is not None:
-                sql += " AND LOWER(username) LIKE LOWER(%(username)s)"
-                params['username'] = username
+        """
+            Snapshot a view to Parquet for offline analysis.
 
-            if filename is not None:
-                sql += " AND LOWER(filename) LIKE LOWER(%(filename)s)"
-                params['filename'] = filename
+            The view is streamed in chunks (see iter_rounds_detail()), so exports
+            larger than memory are fine. JSONB columns (raw_json) are written as
+            JSON strings. Requires pyarrow.
 
-            if comment is not None:
-                sql += " AND LOWER(comment) LIKE LOWER(%(comment)s)"
-                params['comment'] = comment                
-                        
-            if limit is not None:
-                sql += f" LIMIT {limit}"
+            Parameters:
+                view:           View name, e.g. 'rounds_detail_vw' (see VIEWS)
+                path:           Output .parquet file, or a directory when
+                                    partition_cols is given
+                partition_cols: Columns to partition the dataset by, e.g.
+                                    ['username'] -> path/username=dhart/...
+                chunksize:      Rows fetched and written per chunk
+                (filters):      Same as get_results()
+
+            Returns:
+                Number of rows written
+
+            Example Usage:
+                db.export_parquet('rounds_detail_vw', 'exports/rounds', partition_cols=['username'])
+                df = pd.read_parquet('exports/rounds', filters=[('username', '=', 'dhart')])
+        """
+        _require_pyarrow()
+        if view not in VIEWS:
+            raise ValueError(f"Unknown view '{view}'; expected one of {', '.join(VIEWS)}")
+
+        batches = self._iter_view(view, chunksize, as_arrow=True, start_date=start_date,
+            end_date=end_date, username=username, filename=filename, comment=comment,
+            limit=limit)
+
+        row_count = 0
+        if partition_cols:
+            for i, batch in enumerate(batches):
+                pq.write_to_dataset(
+                    pa.Table.from_batches([batch]),
+                    path,
+                    partition_cols=partition_cols,
+                    basename_template=f"part-{i:05d}-{{i}}.parquet"
+                )
+                row_count += batch.num_rows
+        else:
+            writer = None
+            try:
+                for batch in batches:
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, batch.schema)
+                    writer.write_batch(batch)
+                    row_count += batch.num_rows
+            finally:
+                if writer is not None:
+                    writer.close()
+
+        logging.info(f"Exported {row_count} rows of {view} to {path}")
+        return row_count
+
+    def get_view_sql(self, view_name, start_date=None, end_date=None, username=None,
+                filename=None, comment=None, limit=None):
+        """
+            Return the (sql, params) a get_*() method runs, without running it.
+
+            Useful for EXPLAIN and benchmarking (see database/benchmark_queries.py).
+
+            Parameters:
+                view_name:  ipd2 view the get_*() method reads, e.g. 'results_vw' or
+                                'rounds_detail_vw' (summary views map to their
+                                materialized copies)
+                start_date, end_date, username, filename, comment, limit:
+                            Same filters as the get_*() methods
+        """
+        return self._build_view_sql(view_name, start_date=start_date, end_date=end_date,
+            username=username, filename=filename, comment=comment, limit=limit)
+
+    def _build_view_sql(self, view_name, start_date=None, end_date=None, username=None,
+                filename=None, comment=None, limit=None):
+        """
+        Return (sql, params) selecting from an ipd2 view with the standard filters.
+
+        Summary views are read from their materialized copies (see
+        MATERIALIZED_VIEWS), in the original view's order.
+        """
+        view_name, order_by = MATERIALIZED_VIEWS.get(view_name, (view_name, None))
+        sql = f"SELECT * FROM ipd2.{view_name} WHERE 1=1"
+        params = {}
+        
+        if start_date is not None:
+            sql += " AND timestamp >= %(start_date)s"
+            params['start_date'] = start_date
+        
+        if end_date is not None:
+            sql += " AND timestamp < %(end_date)s"
+            params['end_date'] = end_date
+        
+        if username is not None:
+            sql += " AND LOWER(username) LIKE LOWER(%(username)s)"
+            params['username'] = username
+
+        if filename is not None:
+            sql += " AND LOWER(filename) LIKE LOWER(%(filename)s)"
+            params['filename'] = filename
+
+        if comment is not None:
+            sql += " AND LOWER(comment) LIKE LOWER(%(comment)s)"
+            params['comment'] = comment                
+        
+        if order_by is not None:
+            sql += f" ORDER BY {order_by}"
+                    
+        if limit is not None:
+            sql += f" LIMIT {limit}"
+
+        return sql, params
+
+    def _query_view(self, view_name, start_date=None, end_date=None, username=None, filename=None, 
+                comment=None, limit=None, as_arrow=False):
+        try:
+            sql, params = self._build_view_sql(view_name, start_date=start_date,
+                end_date=end_date, username=username, filename=filename, comment=comment,
+                limit=limit)
+            
+            if as_arrow:
+                _require_pyarrow()
+                with self.conn.cursor(row_factory=tuple_row) as cur:
+                    cur.execute(sql, params)
+                    schema = _arrow_schema(cur.description)
+                    batch = _arrow_batch(cur.fetchall(), cur.description, schema)
+                return pa.Table.from_batches([batch], schema=schema)
             
             with self.conn.cursor() as cur:
                 cur.execute(sql, params)
@@ -250,6 +685,54 @@ class ForgeDB:
             print(err_msg)
             raise
 
+    def _iter_view(self, view_name, chunksize=50_000, as_arrow=False, **filters):
+        """
+        Yield a view's rows as DataFrames of at most chunksize rows.
+
+        Uses a named (server-side) cursor: Postgres keeps the result set and
+        hands over chunksize rows per fetch. Rows come back as tuples and
+        are placed straight into the DataFrame, skipping per-row dicts.
+        With as_arrow=True each chunk is a pyarrow.RecordBatch, all with the
+        same schema.
+        """
+        if as_arrow:
+            _require_pyarrow()
+        finished = False
+        try:
+            sql, params = self._build_view_sql(view_name, **filters)
+            
+            cursor_name = f"{view_name}_{next(self._cursor_ids)}"
+            with self.conn.cursor(name=cursor_name, row_factory=tuple_row) as cur:
+                cur.itersize = chunksize
+                cur.execute(sql, params)
+                columns = [col.name for col in cur.description]
+                if as_arrow:
+                    schema = _arrow_schema(cur.description)
+                
+                while True:
+                    rows = cur.fetchmany(chunksize)
+                    if not rows:
+                        break
+                    if as_arrow:
+                        yield _arrow_batch(rows, cur.description, schema)
+                    else:
+                        yield pd.DataFrame.from_records(rows, columns=columns)
+            finished = True
+        
+        except Exception as e:
+            err_msg = f"_iter_view({view_name}) failed - {e}"
+            logging.error(err_msg)
+            print(err_msg)
+            raise
+        
+        finally:
+            # End the read transaction the cursor lived in, also when the caller
+            # stopped iterating early (GeneratorExit is not an Exception)
+            if finished:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+
 
     # ==========================================================================
     # Methods for using and updating the research log
@@ -433,6 +916,57 @@ class ForgeDB:
     # ==========================================================================
     # Methods for importing results JSON files into the database
     # ==========================================================================
+    def _insert_results(self, cur, staged):
+        """Insert the ipd2.results row of a staged file and return its results_id."""
+        cur.execute("""
+            INSERT INTO ipd2.results (
+                filename
+                ,timestamp
+                ,hostname
+                ,username
+                ,elapsed_seconds
+                ,cfg_num_episodes
+                ,cfg_round_per_episode
+                ,cfg_total_rounds
+                ,cfg_history_window_size
+                ,cfg_temperature
+                ,cfg_reset_between_episodes
+                ,cfg_reflection_type
+                ,cfg_decision_token_limit
+                ,cfg_reflection_token_limit
+                ,cfg_http_timeout
+                ,cfg_force_decision_retries
+                ,system_prompt
+                ,reflection_template
+                ,raw_json
+                ,comment
+            ) VALUES (
+                %(filename)s
+                ,%(timestamp)s
+                ,%(hostname)s
+                ,%(username)s
+                ,%(elapsed_seconds)s
+                ,%(num_episodes)s
+                ,%(rounds_per_episode)s
+                ,%(total_rounds)s
+                ,%(history_window_size)s
+                ,%(temperature)s
+                ,%(reset_between_episodes)s
+                ,%(reflection_type)s
+                ,%(decision_token_limit)s
+                ,%(reflection_token_limit)s
+                ,%(http_timeout)s
+                ,%(force_decision_retries)s
+                ,%(system_prompt)s
+                ,%(reflection_template)s
+                ,%(raw_json)s
+                ,%(comment)s
+            ) RETURNING results_id
+            """, staged['results'])
+
+        # Retrieve the serialized key generated for the results table
+        return cur.fetchone()['results_id']
+
     def load_json(self, filepath, user_name='unknown'):
         """
         Import a JSON file into the database.
@@ -440,241 +974,438 @@ class ForgeDB:
         The INSERT uses parameterized queries where %(name)s placeholders
         are replaced with values from a dictionary. This prevents SQL
         injection and handles type conversion automatically.
+
+        For large backfills see load_json_bulk(), which writes the same rows
+        with COPY.
         """
+        result = self._load_file(self.conn, filepath, user_name)
+        if result is not None:
+            self.refresh_summaries()
+        return result
 
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+    def load_json_bulk(self, filepath, user_name='unknown'):
+        """
+        Import a JSON file into the database using COPY.
 
-                # Capture the results filename
-                filename = os.path.basename(filepath)
+        Same rows and return value as load_json(), but the llm_agents,
+        episodes, and rounds rows are each streamed with a single
+        COPY ... FROM STDIN instead of one INSERT per row, so a 50x20 game
+        takes a handful of round-trips instead of ~2,100. Episode IDs are
+        reserved from the episodes sequence up front so rounds can reference
+        them. Everything runs in one transaction; a duplicate file still
+        fails on the results INSERT and is skipped.
+        """
+        result = self._load_file(self.conn, filepath, user_name, bulk=True)
+        if result is not None:
+            self.refresh_summaries()
+        return result
 
-                # Set username for older JSON file versions
-                researcher = data.get('username', user_name)
-            
-            # Insert into results table, retrieve serialized results_id from insert
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO ipd2.results (
-                        filename
-                        ,timestamp
-                        ,hostname
-                        ,username
-                        ,elapsed_seconds
-                        ,cfg_num_episodes
-                        ,cfg_round_per_episode
-                        ,cfg_total_rounds
-                        ,cfg_history_window_size
-                        ,cfg_temperature
-                        ,cfg_reset_between_episodes
-                        ,cfg_reflection_type
-                        ,cfg_decision_token_limit
-                        ,cfg_reflection_token_limit
-                        ,cfg_http_timeout
-                        ,cfg_force_decision_retries
-                        ,system_prompt
-                        ,reflection_template
-                        ,raw_json
-                        ,comment
-                    ) VALUES (
-                        %(filename)s
-                        ,%(timestamp)s
-                        ,%(hostname)s
-                        ,%(username)s
-                        ,%(elapsed_seconds)s
-                        ,%(num_episodes)s
-                        ,%(rounds_per_episode)s
-                        ,%(total_rounds)s
-                        ,%(history_window_size)s
-                        ,%(temperature)s
-                        ,%(reset_between_episodes)s
-                        ,%(reflection_type)s
-                        ,%(decision_token_limit)s
-                        ,%(reflection_token_limit)s
-                        ,%(http_timeout)s
-                        ,%(force_decision_retries)s
-                        ,%(system_prompt)s
-                        ,%(reflection_template)s
-                        ,%(raw_json)s
-                        ,%(comment)s
-                    ) RETURNING results_id
-                    """, 
-                    {
-                        # Session metadata
-                        'filename':                 filename,
-                        'timestamp':                data['timestamp'],
-                        'hostname':                 data.get('hostname', None),
-                        'username':                 researcher,
-                        'elapsed_seconds':          data['elapsed_seconds'],
-                        
-                        # Config fields
-                        'num_episodes':             data['config']['num_episodes'],
-                        'rounds_per_episode':       data['config']['rounds_per_episode'],
-                        'total_rounds':             data['config']['total_rounds'],
-                        'history_window_size':      data['config']['history_window_size'],
-                        'temperature':              data['config']['temperature'],
-                        'reset_between_episodes':   data['config']['reset_between_episodes'],
-                        'reflection_type':          data['config']['reflection_type'],
-                        'decision_token_limit':     data['config']['decision_token_limit'],
-                        'reflection_token_limit':   data['config']['reflection_token_limit'],
-                        'http_timeout':             data['config']['http_timeout'],
-                        'force_decision_retries':   data['config']['force_decision_retries'],
-                        
-                        # Prompts
-                        'system_prompt':            data['prompts']['system_prompt'],
-                        'reflection_template':      data['prompts']['reflection_template'],
-                        
-                        # Raw JSON
-                        'raw_json':                 json.dumps(data),
+    def _load_file(self, conn, filepath, user_name='unknown', bulk=False, staged=None):
+        """
+        Write one results file on conn in a single transaction.
 
-                        # Comments
-                        'comment':                  data.get('comment', None)
+        staged is the parse_results_file() result when the file has already
+        been parsed (e.g., by a worker process); otherwise the file is parsed here.
+        Returns (results_id, username), or None for a duplicate file.
+        """
 
-                    })
-                
-                # Retrieve the serialized key generated for the results table
-                results_id = cur.fetchone()['results_id']
+        try:
+            if staged is None:
+                staged = parse_results_file(filepath, user_name)
             
-                # Insert into llm_agents table (variable number of agents)
-                agent_idx = 0
-                while f'agent_{agent_idx}' in data:
-                    agent_key = f'agent_{agent_idx}'
-                    host_key = f'host_{agent_idx}'
-                    model_key = f'model_{agent_idx}'
-                    
-                    cur.execute("""
-                        INSERT INTO ipd2.llm_agents (
-                            results_id
-                            ,agent_idx
-                            ,host
-                            ,agent_model
-                            ,cfg_model
-                            ,total_score
-                            ,total_cooperations
-                            ,overall_cooperation_rate
-                        ) VALUES (
-                            %(results_id)s
-                            ,%(agent_idx)s
-                            ,%(host)s
-                            ,%(agent_model)s
-                            ,%(cfg_model)s
-                            ,%(total_score)s
-                            ,%(total_cooperations)s
-                            ,%(overall_cooperation_rate)s
-                        )
-                    """,
-                    {
-                        'results_id':              results_id,
-                        'agent_idx':               agent_idx,
-                        'host':                    data.get(host_key, None),
-                        'agent_model':             data[agent_key]['model'],
-                        'cfg_model':               data['config'][model_key],
-                        'total_score':             data[agent_key]['total_score'],
-                        'total_cooperations':      data[agent_key]['total_cooperations'],
-                        'overall_cooperation_rate': data[agent_key]['overall_cooperation_rate']
-                    })
-                    
-                    agent_idx += 1
-
-                # Insert into episodes table
-                for episode_data in data['episodes']:
-                    episode_num = episode_data['episode']
-                    
-                    # Loop through agents for this episode
-                    agent_idx = 0
-                    while f'agent_{agent_idx}' in episode_data:
-                        agent_key = f'agent_{agent_idx}'
-                        
-                        cur.execute("""
-                            INSERT INTO ipd2.episodes (
-                                results_id
-                                ,agent_idx
-                                ,episode
-                                ,score
-                                ,cooperations
-                                ,cooperation_rate
-                                ,reflection
-                            ) VALUES (
-                                %(results_id)s
-                                ,%(agent_idx)s
-                                ,%(episode)s
-                                ,%(score)s
-                                ,%(cooperations)s
-                                ,%(cooperation_rate)s
-                                ,%(reflection)s
-                            ) RETURNING episode_id
-                        """,
-                        {
-                            'results_id':       results_id,
-                            'agent_idx':        agent_idx,
-                            'episode':          episode_num,
-                            'score':            episode_data[agent_key]['episode_score'],
-                            'cooperations':     episode_data[agent_key]['cooperations'],
-                            'cooperation_rate': episode_data[agent_key]['cooperation_rate'],
-                            'reflection':       episode_data[agent_key]['reflection']
-                        })
-                        
-                        episode_id = cur.fetchone()['episode_id']
-                        
-                        # Insert rounds for this episode/agent
-                        for round_data in episode_data['rounds']:
-                            action_key = f'agent_{agent_idx}_action'
-                            reasoning_key = f'agent_{agent_idx}_reasoning'
-                            payoff_key = f'agent_{agent_idx}_payoff'
-                            ep_score_key = f'agent_{agent_idx}_episode_score'
-                            
-                            cur.execute("""
-                                INSERT INTO ipd2.rounds (
-                                    episode_id
-                                    ,round
-                                    ,action
-                                    ,payoff
-                                    ,ep_cumulative_score
-                                    ,reasoning
-                                ) VALUES (
-                                    %(episode_id)s
-                                    ,%(round)s
-                                    ,%(action)s
-                                    ,%(payoff)s
-                                    ,%(ep_cumulative_score)s
-                                    ,%(reasoning)s
-                                )
-                            """,
-                            {
-                                'episode_id':          episode_id,
-                                'round':               round_data['round'],
-                                'action':              round_data[action_key],
-                                'payoff':              round_data[payoff_key],
-                                'ep_cumulative_score': round_data[ep_score_key],
-                                'reasoning':           round_data[reasoning_key]
-                            })
-                        
-                        agent_idx += 1
+            with conn.cursor() as cur:
+                if bulk:
+                    results_id = self._copy_staged(cur, staged)
+                else:
+                    results_id = self._insert_staged(cur, staged)
+                self._record_manifest(cur, staged['manifest'], results_id)
 
-            self.conn.commit()
+            conn.commit()
+            researcher = staged['results']['username']
             logging.info(
-                f"Loaded {filepath} -> results_id={results_id}, user={researcher}")
+                f"{'Bulk loaded' if bulk else 'Loaded'} {filepath} -> "
+                f"results_id={results_id}, user={researcher}")
             return (results_id, researcher)
         
         # Prevent duplicate test results from import
         except psycopg.errors.UniqueViolation as e:
-            self.conn.rollback()
+            conn.rollback()
             err_msg = f"Duplicate file skipped: {filepath} - {e}"
             logging.warning(err_msg)
             print(err_msg)
+            self._adopt_manifest(conn, staged['manifest'])
             return None
         
         # Unexpected exception occurred
         except Exception as e:
-            self.conn.rollback()
+            conn.rollback()
             err_msg = f"Failed to load {filepath} - {e}"
             logging.error(err_msg)
             print(err_msg)
             raise
 
-    def load_batch(self, source, pattern='*.json', user_name='unknown'):
+    def _insert_staged(self, cur, staged):
+        """Write a parse_results_file() result one INSERT per row (caller commits)."""
+        # Insert into results table, retrieve serialized results_id from insert
+        results_id = self._insert_results(cur, staged)
+        
+        # Insert into llm_agents table (variable number of agents)
+        for agent in staged['agents']:
+            cur.execute("""
+                INSERT INTO ipd2.llm_agents (
+                    results_id
+                    ,agent_idx
+                    ,host
+                    ,agent_model
+                    ,cfg_model
+                    ,total_score
+                    ,total_cooperations
+                    ,overall_cooperation_rate
+                    ,dec_calls
+                    ,dec_wall_seconds
+                    ,dec_mean_wall_seconds
+                    ,dec_max_wall_seconds
+                    ,dec_http_seconds
+                    ,dec_llm_requests
+                    ,dec_retries
+                    ,dec_prompt_eval_count
+                    ,dec_eval_count
+                    ,dec_eval_duration_ns
+                    ,dec_load_duration_ns
+                    ,refl_calls
+                    ,refl_wall_seconds
+                    ,refl_mean_wall_seconds
+                    ,refl_max_wall_seconds
+                    ,refl_http_seconds
+                    ,refl_llm_requests
+                    ,refl_retries
+                    ,refl_prompt_eval_count
+                    ,refl_eval_count
+                    ,refl_eval_duration_ns
+                    ,refl_load_duration_ns
+                ) VALUES (
+                    %(results_id)s
+                    ,%(agent_idx)s
+                    ,%(host)s
+                    ,%(agent_model)s
+                    ,%(cfg_model)s
+                    ,%(total_score)s
+                    ,%(total_cooperations)s
+                    ,%(overall_cooperation_rate)s
+                    ,%(dec_calls)s
+                    ,%(dec_wall_seconds)s
+                    ,%(dec_mean_wall_seconds)s
+                    ,%(dec_max_wall_seconds)s
+                    ,%(dec_http_seconds)s
+                    ,%(dec_llm_requests)s
+                    ,%(dec_retries)s
+                    ,%(dec_prompt_eval_count)s
+                    ,%(dec_eval_count)s
+                    ,%(dec_eval_duration_ns)s
+                    ,%(dec_load_duration_ns)s
+                    ,%(refl_calls)s
+                    ,%(refl_wall_seconds)s
+                    ,%(refl_mean_wall_seconds)s
+                    ,%(refl_max_wall_seconds)s
+                    ,%(refl_http_seconds)s
+                    ,%(refl_llm_requests)s
+                    ,%(refl_retries)s
+                    ,%(refl_prompt_eval_count)s
+                    ,%(refl_eval_count)s
+                    ,%(refl_eval_duration_ns)s
+                    ,%(refl_load_duration_ns)s
+                )
+            """,
+            {'results_id': results_id, **agent})
+
+        # Insert into episodes table
+        for episode in staged['episodes']:
+            cur.execute("""
+                INSERT INTO ipd2.episodes (
+                    results_id
+                    ,agent_idx
+                    ,episode
+                    ,score
+                    ,cooperations
+                    ,cooperation_rate
+                    ,reflection
+                    ,dec_calls
+                    ,dec_wall_seconds
+                    ,dec_mean_wall_seconds
+                    ,dec_max_wall_seconds
+                    ,dec_http_seconds
+                    ,dec_llm_requests
+                    ,dec_retries
+                    ,dec_prompt_eval_count
+                    ,dec_eval_count
+                    ,dec_eval_duration_ns
+                    ,dec_load_duration_ns
+                    ,refl_wall_seconds
+                    ,refl_http_seconds
+                    ,refl_llm_requests
+                    ,refl_retries
+                    ,refl_prompt_eval_count
+                    ,refl_eval_count
+                    ,refl_eval_duration_ns
+                    ,refl_load_duration_ns
+                ) VALUES (
+                    %(results_id)s
+                    ,%(agent_idx)s
+                    ,%(episode)s
+                    ,%(score)s
+                    ,%(cooperations)s
+                    ,%(cooperation_rate)s
+                    ,%(reflection)s
+                    ,%(dec_calls)s
+                    ,%(dec_wall_seconds)s
+                    ,%(dec_mean_wall_seconds)s
+                    ,%(dec_max_wall_seconds)s
+                    ,%(dec_http_seconds)s
+                    ,%(dec_llm_requests)s
+                    ,%(dec_retries)s
+                    ,%(dec_prompt_eval_count)s
+                    ,%(dec_eval_count)s
+                    ,%(dec_eval_duration_ns)s
+                    ,%(dec_load_duration_ns)s
+                    ,%(refl_wall_seconds)s
+                    ,%(refl_http_seconds)s
+                    ,%(refl_llm_requests)s
+                    ,%(refl_retries)s
+                    ,%(refl_prompt_eval_count)s
+                    ,%(refl_eval_count)s
+                    ,%(refl_eval_duration_ns)s
+                    ,%(refl_load_duration_ns)s
+                ) RETURNING episode_id
+            """,
+            {'results_id': results_id, **episode})
+            
+            episode_id = cur.fetchone()['episode_id']
+            
+            # Insert rounds for this episode/agent
+            for round_row in episode['rounds']:
+                cur.execute("""
+                    INSERT INTO ipd2.rounds (
+                        episode_id
+                        ,round
+                        ,action
+                        ,payoff
+                        ,ep_cumulative_score
+                        ,reasoning
+                        ,wall_seconds
+                        ,http_seconds
+                        ,llm_requests
+                        ,retries
+                        ,prompt_eval_count
+                        ,eval_count
+                        ,eval_duration_ns
+                        ,load_duration_ns
+                    ) VALUES (
+                        %(episode_id)s
+                        ,%(round)s
+                        ,%(action)s
+                        ,%(payoff)s
+                        ,%(ep_cumulative_score)s
+                        ,%(reasoning)s
+                        ,%(wall_seconds)s
+                        ,%(http_seconds)s
+                        ,%(llm_requests)s
+                        ,%(retries)s
+                        ,%(prompt_eval_count)s
+                        ,%(eval_count)s
+                        ,%(eval_duration_ns)s
+                        ,%(load_duration_ns)s
+                    )
+                """,
+                {'episode_id': episode_id, **round_row})
+
+        return results_id
+
+    def _copy_staged(self, cur, staged):
+        """Write a parse_results_file() result with COPY (caller commits)."""
+        results_id = self._insert_results(cur, staged)
+
+        # Reserve one episode_id per staged episode
+        cur.execute("""
+            SELECT nextval(pg_get_serial_sequence('ipd2.episodes', 'episode_id')) AS episode_id
+            FROM generate_series(1, %(n)s)
+            """, {'n': len(staged['episodes'])})
+        episode_ids = [row['episode_id'] for row in cur.fetchall()]
+
+        with cur.copy(f"COPY ipd2.llm_agents (results_id, {', '.join(AGENT_COLUMNS)}) FROM STDIN") as copy:
+            for agent in staged['agents']:
+                copy.write_row([results_id] + [agent[col] for col in AGENT_COLUMNS])
+
+        with cur.copy(f"COPY ipd2.episodes (episode_id, results_id, {', '.join(EPISODE_COLUMNS)}) FROM STDIN") as copy:
+            for episode_id, episode in zip(episode_ids, staged['episodes']):
+                copy.write_row([episode_id, results_id] + [episode[col] for col in EPISODE_COLUMNS])
+
+        with cur.copy(f"COPY ipd2.rounds (episode_id, {', '.join(ROUND_COLUMNS)}) FROM STDIN") as copy:
+            for episode_id, episode in zip(episode_ids, staged['episodes']):
+                for round_row in episode['rounds']:
+                    copy.write_row([episode_id] + [round_row[col] for col in ROUND_COLUMNS])
+
+        return results_id
+
+    def refresh_summaries(self, concurrently=True):
+        """
+        Rebuild the materialized summary views from the current tables.
+
+        Called automatically after load_json(), load_json_bulk(), and once
+        per load_batch(); call it directly after deleting data. With
+        concurrently=True readers are not blocked while the views rebuild.
+        A failed refresh is logged and leaves the previous contents in place.
+
+        Returns:
+            True if the views were refreshed
+        """
+        try:
+            start = time.perf_counter()
+            with self.conn.cursor() as cur:
+                cur.execute("SELECT ipd2.refresh_summaries(%(concurrent)s)",
+                            {'concurrent': concurrently})
+            self.conn.commit()
+            logging.info(f"Refreshed summary views in {time.perf_counter() - start:.2f}s")
+            return True
+        
+        except Exception as e:
+            self.conn.rollback()
+            err_msg = f"Summary view refresh failed - {e}"
+            logging.warning(err_msg)
+            print(err_msg)
+            return False
+
+    def _record_manifest(self, cur, manifest, results_id):
+        """Record a loaded file's content hash, size, and mtime."""
+        cur.execute("""
+            INSERT INTO ipd2.ingest_manifest (
+                filename
+                ,sha256
+                ,size_bytes
+                ,mtime_ns
+                ,results_id
+            ) VALUES (
+                %(filename)s
+                ,%(sha256)s
+                ,%(size_bytes)s
+                ,%(mtime_ns)s
+                ,%(results_id)s
+            )
+            ON CONFLICT (filename) DO UPDATE SET
+                sha256 = EXCLUDED.sha256
+                ,size_bytes = EXCLUDED.size_bytes
+                ,mtime_ns = EXCLUDED.mtime_ns
+                ,results_id = EXCLUDED.results_id
+                ,ingest_dttm = now()
+            """, {**manifest, 'results_id': results_id})
+
+    def _adopt_manifest(self, conn, manifest):
+        """
+        Add a manifest row for a duplicate file loaded before the manifest
+        existed, so the next run skips it without parsing.
+        """
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    INSERT INTO ipd2.ingest_manifest (
+                        filename
+                        ,sha256
+                        ,size_bytes
+                        ,mtime_ns
+                        ,results_id
+                    )
+                    SELECT
+                        filename
+                        ,%(sha256)s
+                        ,%(size_bytes)s
+                        ,%(mtime_ns)s
+                        ,results_id
+                    FROM ipd2.results
+                    WHERE filename = %(filename)s
+                    ON CONFLICT (filename) DO NOTHING
+                    """, manifest)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logging.warning(f"Could not add manifest entry for {manifest['filename']} - {e}")
+
+    def _filter_manifest(self, filepaths, results):
+        """
+        Drop files the ingest manifest shows are already loaded.
+
+        One indexed lookup covers every file. A file whose size and mtime
+        match its manifest row is skipped without being read; if they differ
+        the file is hashed, and only a different hash counts as a change.
+        Skipped files go to results['skipped'], changed files to
+        results['changed'] as (filepath, results_id); neither is reloaded.
+
+        Returns:
+            The filepaths that still need loading, in their original order
+        """
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                SELECT
+                    filename
+                    ,sha256
+                    ,size_bytes
+                    ,mtime_ns
+                    ,results_id
+                FROM ipd2.ingest_manifest
+                WHERE filename = ANY(%(filenames)s)
+                """, {'filenames': [os.path.basename(p) for p in filepaths]})
+            manifest = {row['filename']: row for row in cur.fetchall()}
+
+        pending = []
+        touched = []
+        for filepath in filepaths:
+            entry = manifest.get(os.path.basename(filepath))
+            if entry is None:
+                pending.append(filepath)
+                continue
+
+            stat = os.stat(filepath)
+            if (stat.st_size, stat.st_mtime_ns) != (entry['size_bytes'], entry['mtime_ns']):
+                if file_sha256(filepath) != entry['sha256']:
+                    err_msg = (f"Changed since import (results_id {entry['results_id']}), "
+                               f"not reloaded: {filepath}")
+                    logging.warning(err_msg)
+                    print(err_msg)
+                    results['changed'].append((filepath, entry['results_id']))
+                    continue
+
+                # Same content, new mtime (e.g., copied or touched)
+                touched.append({'filename': entry['filename'],
+                                'size_bytes': stat.st_size,
+                                'mtime_ns': stat.st_mtime_ns})
+
+            results['skipped'].append(filepath)
+
+        with self.conn.cursor() as cur:
+            if touched:
+                cur.executemany("""
+                    UPDATE ipd2.ingest_manifest
+                    SET size_bytes = %(size_bytes)s
+                        ,mtime_ns = %(mtime_ns)s
+                    WHERE filename = %(filename)s
+                    """, touched)
+        self.conn.commit()
+
+        skipped = len(filepaths) - len(pending) - len(results['changed'])
+        if skipped:
+            logging.info(f"Manifest: {skipped} files already loaded")
+
+        return pending
+
+    def load_batch(self, source, pattern='*.json', user_name='unknown', bulk=False, workers=1):
         """ Load JSON files from a directory or a list of filepaths.
             To be used in CLI environment only.
+            bulk=True loads each file with load_json_bulk().
+            workers > 1 parses files in a process pool and loads them over a
+            pool of that many connections; files then commit in completion
+            order rather than sorted order.
+            The report's 'timings' holds (filepath, parse_seconds, load_seconds).
+            Files already recorded in ipd2.ingest_manifest are skipped
+            without parsing; 'changed' lists (filepath, results_id) for files
+            whose contents differ from what was loaded.
         """
         
         if isinstance(source, list):
@@ -684,51 +1415,150 @@ class ForgeDB:
         
         if not filepaths:
             logging.warning(f"No files to process")
-            return {'loaded': [], 'skipped': [], 'failed': []}
+            return {'loaded': [], 'skipped': [], 'changed': [], 'failed': [], 'timings': []}
         
         logging.info(f"Processing {len(filepaths)} files")
         
         results = {
             'loaded': [],
             'skipped': [],
-            'failed': []
+            'changed': [],
+            'failed': [],
+            'timings': []
         }
         
-        for filepath in sorted(filepaths):
-            try:
-                result = self.load_json(filepath, user_name)
-                
-                if result is not None:
-                    results['loaded'].append((filepath, result[0], result[1]))
-                else:
-                    results['skipped'].append(filepath)
-                    
-            except Exception as e:
-                err_msg = f"Failed to load {filepath} - {e}"
-                print(err_msg)
-                results['failed'].append((filepath, str(e)))
+        # Skip files already in the ingest manifest without parsing them
+        filepaths = self._filter_manifest(sorted(filepaths), results)
+        
+        if workers > 1 and len(filepaths) > 1:
+            self._load_parallel(sorted(filepaths), user_name, bulk, workers, results)
+        else:
+            for filepath in sorted(filepaths):
+                try:
+                    staged, parse_seconds = _timed_parse(filepath, user_name)
+                    start = time.perf_counter()
+                    result = self._load_file(self.conn, filepath, user_name, bulk, staged)
+                    self._record_load(results, filepath, result, parse_seconds,
+                                      time.perf_counter() - start)
+                        
+                except Exception as e:
+                    self._record_failure(results, filepath, e)
+        
+        # One refresh for the whole batch
+        if results['loaded']:
+            self.refresh_summaries()
         
         logging.info(f"Batch complete: {len(results['loaded'])} loaded, "
                     f"{len(results['skipped'])} skipped, "
+                    f"{len(results['changed'])} changed, "
                     f"{len(results['failed'])} failed")
         
         return results
+
+    def _load_parallel(self, filepaths, user_name, bulk, workers, results):
+        """
+        Parse in worker processes and load over a pool of connections.
+
+        Each parsed file is handed to a loader thread as soon as it is ready;
+        a loader takes a connection from the pool for the length of one
+        file's transaction. At most 2 * workers files are parsed or loading
+        at once, so parsed files cannot pile up in memory ahead of the
+        slower inserts.
+        """
+        workers = min(workers, len(filepaths))
+        pool = queue.Queue()
+        for _ in range(workers):
+            pool.put(self._connect())
+
+        def load(filepath, staged, parse_seconds):
+            conn = pool.get()
+            try:
+                start = time.perf_counter()
+                result = self._load_file(conn, filepath, user_name, bulk, staged)
+                return result, parse_seconds, time.perf_counter() - start
+            finally:
+                pool.put(conn)
+
+        # One slot per file from parse submission until its load finishes
+        slots = threading.BoundedSemaphore(2 * workers)
+        remaining = iter(filepaths)
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as parsers, \
+                    ThreadPoolExecutor(max_workers=workers) as loaders:
+                parse_futures = {}
+                load_futures = {}
+
+                def submit_parses():
+                    while slots.acquire(blocking=False):
+                        filepath = next(remaining, None)
+                        if filepath is None:
+                            slots.release()
+                            return
+                        parse_futures[parsers.submit(_timed_parse, filepath, user_name)] = filepath
+
+                submit_parses()
+                while parse_futures or load_futures:
+                    done, _ = wait([*parse_futures, *load_futures], return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future in parse_futures:
+                            filepath = parse_futures.pop(future)
+                            try:
+                                staged, parse_seconds = future.result()
+                            except Exception as e:
+                                self._record_failure(results, filepath, e)
+                                slots.release()
+                                continue
+                            load_futures[loaders.submit(load, filepath, staged, parse_seconds)] = filepath
+                        else:
+                            filepath = load_futures.pop(future)
+                            try:
+                                self._record_load(results, filepath, *future.result())
+                            except Exception as e:
+                                self._record_failure(results, filepath, e)
+                            slots.release()
+                    submit_parses()
+        finally:
+            while not pool.empty():
+                pool.get().close()
+
+    @staticmethod
+    def _record_failure(results, filepath, error):
+        """Log a file that failed to parse or load and add it to a load_batch() report."""
+        err_msg = f"Failed to load {filepath} - {error}"
+        logging.error(err_msg)
+        print(err_msg)
+        results['failed'].append((filepath, str(error)))
+
+    @staticmethod
+    def _record_load(results, filepath, result, parse_seconds, load_seconds):
+        """Add one file's outcome and timing to a load_batch() report."""
+        if result is not None:
+            results['loaded'].append((filepath, result[0], result[1]))
+        else:
+            results['skipped'].append(filepath)
+        results['timings'].append((filepath, parse_seconds, load_seconds))
     
-    def get_files(self, path, user_name='unknown'):
+    def get_files(self, path, user_name='unknown', bulk=False, workers=1):
         """ Load a file, directory, or glob pattern.
             To be used in CLI environment only.
         """
         
         if os.path.isfile(path):
-            return self.load_json(path, user_name)
+            report = {'skipped': [], 'changed': []}
+            if not self._filter_manifest([path], report):
+                if report['skipped']:
+                    print(f"Already loaded, skipped: {path}")
+                return None
+            return self.load_json_bulk(path, user_name) if bulk else self.load_json(path, user_name)
         
         elif os.path.isdir(path):
-            return self.load_batch(path, user_name=user_name)
+            return self.load_batch(path, user_name=user_name, bulk=bulk, workers=workers)
         
         elif '*' in path or '?' in path:
             dirpath = os.path.dirname(path) or '.'
             pattern = os.path.basename(path)
-            return self.load_batch(dirpath, pattern, user_name)
+            return self.load_batch(dirpath, pattern, user_name, bulk, workers)
         
         else:
             logging.error(f"Path not found: {path}")
@@ -739,6 +1569,8 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Load IPD game data into PostgreSQL')
     parser.add_argument('--import', dest='import_path', nargs='*', help='File(s), directory, or pattern to load')
     parser.add_argument('--username', dest='user_name', default='unknown', help='Default username for older files missing username field')
+    parser.add_argument('--workers', type=int, default=1, help='Parse and load this many files in parallel (default: 1)')
+    parser.add_argument('--bulk', action='store_true', help='Load with COPY instead of row-by-row INSERTs (faster for large backfills)')
     
     args = parser.parse_args()
     
@@ -746,15 +1578,18 @@ if __name__ == '__main__':
         db = ForgeDB()
         
         if len(args.import_path) == 1:
-            result = db.get_files(args.import_path[0], args.user_name)
+            result = db.get_files(args.import_path[0], args.user_name, args.bulk, args.workers)
             
             if isinstance(result, tuple):
                 print(f"Loaded: results_id {result[0]}, user {result[1]}")
             elif isinstance(result, dict):
-                print(f"Loaded: {len(result['loaded'])}, Skipped: {len(result['skipped'])}, Failed: {len(result['failed'])}")
+                print(f"Loaded: {len(result['loaded'])}, Skipped: {len(result['skipped'])}, "
+                      f"Changed: {len(result['changed'])}, Failed: {len(result['failed'])}")
         else:
-            results = db.load_batch(args.import_path, user_name=args.user_name)
-            print(f"Loaded: {len(results['loaded'])}, Skipped: {len(results['skipped'])}, Failed: {len(results['failed'])}")
+            results = db.load_batch(args.import_path, user_name=args.user_name, bulk=args.bulk,
+                                    workers=args.workers)
+            print(f"Loaded: {len(results['loaded'])}, Skipped: {len(results['skipped'])}, "
+                  f"Changed: {len(results['changed'])}, Failed: {len(results['failed'])}")
         
         db.close()
     else:
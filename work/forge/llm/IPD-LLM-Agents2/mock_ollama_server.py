@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Mock Ollama server for offline game, retry, and concurrency testing
+Implements /api/chat and /api/generate (non-streaming) with configurable
+latency, strategy-driven or scripted decisions, ambiguous answers (to exercise
+generate_with_forced_decision), injected failures, structured output
+("format"), num_predict truncation, and a per-model prompt prefix cache so
+prompt_eval_count behaves like a server with KV cache reuse.
+
+Responses are deterministic: each one is drawn from a random source seeded with
+--seed, the request content, and how many times that request has been seen, so
+concurrent games get the same answers in any order and a retried request can
+succeed after an injected failure.
+
+Usage:
+    python mock_ollama_server.py --port 11500
+    python mock_ollama_server.py --port 11500 --latency lognormal:1.2,0.35 --ambiguous-rate 0.05 --error-rate 0.01
+    OLLAMA_PORT=11500 python episodic_ipd_game.py --host-0 localhost --host-1 localhost --model-0 scripted:tit_for_tat
+
+    # In a test or benchmark script
+    with MockOllamaServer(MockSettings(latency='fixed:0')) as server:
+        agent = OllamaAgent("agent_0", "scripted:pavlov", host="127.0.0.1", port=server.port)
+"""
+
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from ollama_agent import estimate_tokens
+from synthetic_results import STRATEGIES, fake_reasoning, fake_reflection
+
+
+# History lines of round prompts ("Round 3: You cooperated, Other defectd (You: +0, Other: +5)")
+# and reflection prompts ("Round 3: You COOPERATE, Other DEFECT (+0, +5)"); see prompts.py
+ROUND_LINE = re.compile(
+    r"Round (\d+): You (cooperate|defect)d?, Other (cooperate|defect)d? "
+    r"\((?:You: )?\+(\d+), (?:Other: )?\+(\d+)\)",
+    re.IGNORECASE
+)
+PERIOD_COMPLETE = re.compile(r"PERIOD \d+ COMPLETE")
+MY_SCORE = re.compile(r"Your points(?: this period)?: (\d+)")
+OPP_SCORE = re.compile(r"Other's points(?: this period)?: (\d+)")
+
+
+def parse_latency(spec: str):
+    """
+    Parse a latency distribution into a sampler taking a random.Random
+
+    Specs (seconds): "fixed:0.5", "uniform:0.2,1.0", "normal:1.0,0.2",
+    "lognormal:1.2,0.35" (median, sigma), "exponential:0.8" (mean)
+    """
+    kind, _, args = spec.partition(':')
+    try:
+        values = [float(v) for v in args.split(',')] if args else []
+        if kind == 'fixed':
+            (seconds,) = values
+            return lambda rng: seconds
+        if kind == 'uniform':
+            low, high = values
+            return lambda rng: rng.uniform(low, high)
+        if kind == 'normal':
+            mean, sigma = values
+            return lambda rng: max(rng.gauss(mean, sigma), 0.0)
+        if kind == 'lognormal':
+            median, sigma = values
+            return lambda rng: rng.lognormvariate(math.log(max(median, 1e-6)), sigma)
+        if kind == 'exponential':
+            (mean,) = values
+            return lambda rng: rng.expovariate(1 / mean) if mean > 0 else 0.0
+    except ValueError:
+        pass
+    raise ValueError(f"Bad latency spec {spec!r}; use fixed:S, uniform:LO,HI, normal:MEAN,SD, "
+                     f"lognormal:MEDIAN,SIGMA, or exponential:MEAN")
+
+
+@dataclass
+class MockSettings:
+    """Behavior of a MockOllamaServer (see the command line options for details)"""
+    strategy: str = 'tit_for_tat'            # Default strategy for models not mapped below
+    model_strategies: Dict[str, str] = field(default_factory=dict)  # model -> strategy
+    script: Dict[str, List[str]] = field(default_factory=dict)      # model or "*" -> per-round responses
+    latency: str = 'lognormal:1.2,0.35'      # Decision latency distribution
+    reflection_latency: str = 'lognormal:6.0,0.35'
+    ambiguous_rate: float = 0.0              # Decision answers with no clear action
+    error_rate: float = 0.0                  # HTTP 500 responses
+    hang_rate: float = 0.0                   # Requests that stall for hang_seconds (client timeouts)
+    hang_seconds: float = 120.0
+    drop_rate: float = 0.0                   # Connections closed without a response
+    parallel: int = 4                        # Requests processed at once (others queue, like OLLAMA_NUM_PARALLEL)
+    cache_slots: int = 4                     # Cached conversations per model (prompt prefix reuse)
+    reasoning_words: int = 40
+    reflection_words: int = 160
+    seed: int = 0
+
+
+class MockOllama:
+    """Request handling and state shared by all connections of one server"""
+
+    def __init__(self, settings: MockSettings):
+        self.settings = settings
+        for strategy in [settings.strategy, *settings.model_strategies.values()]:
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown strategy {strategy!r}; choose from {', '.join(STRATEGIES)}")
+        self.decision_latency = parse_latency(settings.latency)
+        self.reflection_latency = parse_latency(settings.reflection_latency)
+        self.slots = threading.Semaphore(max(settings.parallel, 1))
+
+        self._lock = threading.Lock()
+        self._seen = {}           # request digest -> times received
+        self._caches = {}         # model -> OrderedDict of slots: full digest -> prefix digests
+        self.stats = {'requests': 0, 'decisions': 0, 'reflections': 0, 'ambiguous': 0,
+                      'errors': 0, 'hangs': 0, 'drops': 0, 'truncated': 0}
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _request_rng(self, payload: Dict) -> random.Random:
+        """Random source for one request: seed + request content + repeat count"""
+        digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+        with self._lock:
+            attempt = self._seen.get(digest, 0)
+            self._seen[digest] = attempt + 1
+        return random.Random(f"{self.settings.seed}:{digest}:{attempt}")
+
+    def strategy_for(self, model: str) -> str:
+        """Strategy for a model: explicit mapping, then "scripted:<strategy>" names, then the default"""
+        if model in self.settings.model_strategies:
+            return self.settings.model_strategies[model]
+        name = model.split(':', 1)[1] if model.startswith('scripted:') else None
+        return name if name in STRATEGIES else self.settings.strategy
+
+    def prompt_eval_count(self, model: str, messages: List[Dict], reply: str) -> int:
+        """
+        Tokens the server would evaluate for these messages
+
+        Each of the model's cache_slots holds one earlier conversation (prompt
+        plus reply); only the messages after the longest cached prefix are
+        counted. The conversation then replaces the slot it matched, or the
+        least recently used one.
+        """
+        prefixes = []
+        digest = hashlib.sha256()
+        for message in [*messages, {'role': 'assistant', 'content': reply}]:
+            digest.update(json.dumps(message, sort_keys=True).encode())
+            prefixes.append(digest.hexdigest())
+
+        with self._lock:
+            cache = self._caches.setdefault(model, OrderedDict())
+            matched, cached = None, 0
+            for key, slot in cache.items():
+                hit = next((i for i in range(len(messages), 0, -1) if prefixes[i - 1] in slot), 0)
+                if hit > cached:
+                    matched, cached = key, hit
+            if matched is not None:
+                del cache[matched]
+            cache[prefixes[-1]] = set(prefixes)
+            while len(cache) > max(self.settings.cache_slots, 1):
+                cache.popitem(last=False)
+
+        return max(estimate_tokens(messages[cached:]), 1)
+
+    def respond(self, payload: Dict, messages: List[Dict]) -> Tuple[int, Optional[Dict]]:
+        """
+        Build the reply to one request
+
+        Returns:
+            (HTTP status, body); body None means drop the connection
+        """
+        self._count('requests')
+        rng = self._request_rng(payload)
+        settings = self.settings
+        model = payload.get('model', '')
+
+        # Injected failures are decided before any work is done
+        roll = rng.random()
+        if roll < settings.drop_rate:
+            self._count('drops')
+            return 0, None
+        roll -= settings.drop_rate
+        if roll < settings.error_rate:
+            self._count('errors')
+            return 500, {'error': 'mock server: injected failure'}
+        roll -= settings.error_rate
+        hang = roll < settings.hang_rate
+
+        prompt = messages[-1]['content'] if messages else ''
+        is_reflection = bool(PERIOD_COMPLETE.search(prompt))
+        structured = payload.get('format') is not None
+
+        with self.slots:
+            started = time.perf_counter()
+            if is_reflection:
+                self._count('reflections')
+                content = self._reflection(rng, prompt)
+                delay = self.reflection_latency(rng)
+            else:
+                self._count('decisions')
+                content = self._decision(rng, model, messages, structured)
+                delay = self.decision_latency(rng)
+
+            if hang:
+                self._count('hangs')
+                delay = settings.hang_seconds
+
+            # Honor num_predict (about 4 characters per token)
+            num_predict = (payload.get('options') or {}).get('num_predict')
+            done_reason = 'stop'
+            if num_predict and len(content) // 4 > num_predict:
+                content = content[:num_predict * 4]
+                done_reason = 'length'
+                self._count('truncated')
+
+            prompt_eval_count = self.prompt_eval_count(model, messages, content)
+            time.sleep(delay)
+            total = time.perf_counter() - started
+
+        eval_count = max(len(content) // 4, 1)
+        load_duration = int(rng.uniform(5e6, 30e6))
+        body = {
+            'model': model,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'done': True,
+            'done_reason': done_reason,
+            'total_duration': int(total * 1e9),
+            'load_duration': load_duration,
+            'prompt_eval_count': prompt_eval_count,
+            'prompt_eval_duration': int(total * 0.15e9),
+            'eval_count': eval_count,
+            'eval_duration': int(total * 0.8e9),
+        }
+        if 'messages' in payload:
+            body['message'] = {'role': 'assistant', 'content': content}
+        else:
+            body['response'] = content
+        return 200, body
+
+    def _history(self, messages: List[Dict]) -> List[Dict]:
+        """The agent's episode history, as far as the latest round prompt shows it"""
+        for message in reversed(messages):
+            if message['role'] != 'user':
+                continue
+            rounds = ROUND_LINE.findall(message['content'])
+            if rounds or 'ROUND' in message['content']:
+                return [{'my_action': mine.upper(), 'opp_action': theirs.upper(),
+                         'my_payoff': int(my_payoff), 'opp_payoff': int(opp_payoff)}
+                        for _, mine, theirs, my_payoff, opp_payoff in rounds]
+        return []
+
+    def _round_number(self, messages: List[Dict]) -> int:
+        """Round number of the latest round prompt (1-based; 1 if none)"""
+        for message in reversed(messages):
+            match = re.search(r"ROUND (\d+)", message['content']) if message['role'] == 'user' else None
+            if match:
+                return int(match.group(1))
+        return 1
+
+    def _decision(self, rng: random.Random, model: str, messages: List[Dict], structured: bool) -> str:
+        """Reasoning plus an action (or an ambiguous answer) in the requested format"""
+        history = self._history(messages)
+        script = self.settings.script.get(model, self.settings.script.get('*'))
+
+        if rng.random() < self.settings.ambiguous_rate:
+            self._count('ambiguous')
+            if structured:
+                # What a response cut off by num_predict looks like
+                return '{"reasoning": "I need to weigh the risk of being exploited against'
+            return (f"{fake_reasoning(rng, history, 'COOPERATE', self.settings.reasoning_words)}\n"
+                    f"On the other hand, defecting might protect my score, so I am not sure yet.")
+
+        if script:
+            entry = script[(self._round_number(messages) - 1) % len(script)]
+            action = entry.strip().upper()
+            if action not in ('COOPERATE', 'DEFECT'):
+                return entry  # Scripted free text is returned verbatim
+        else:
+            action = STRATEGIES[self.strategy_for(model)](history, rng)
+
+        reasoning = fake_reasoning(rng, history, action, self.settings.reasoning_words)
+        if structured:
+            return json.dumps({'reasoning': reasoning, 'action': action})
+        return f"{reasoning}\n\n{action}"
+
+    def _reflection(self, rng: random.Random, prompt: str) -> str:
+        """A reflection on the period described by the prompt"""
+        history = [{'my_action': mine.upper(), 'opp_action': theirs.upper()}
+                   for _, mine, theirs, _, _ in ROUND_LINE.findall(prompt)]
+        my_score = MY_SCORE.search(prompt)
+        opp_score = OPP_SCORE.search(prompt)
+        return fake_reflection(
+            rng, history,
+            int(my_score.group(1)) if my_score else 0,
+            int(opp_score.group(1)) if opp_score else 0,
+            self.settings.reflection_words
+        )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP/1.1 keep-alive handler so client connection pooling is exercised"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _send_json(self, status: int, body) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        mock = self.server.mock
+        if self.path == '/api/tags':
+            models = sorted({*mock.settings.model_strategies, *mock._caches})
+            self._send_json(200, {'models': [{'name': m, 'model': m} for m in models]})
+        elif self.path == '/api/version':
+            self._send_json(200, {'version': 'mock'})
+        elif self.path == '/':
+            data = b'Ollama is running'
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self._send_json(404, {'error': f'unknown endpoint {self.path}'})
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self._send_json(400, {'error': 'invalid JSON'})
+            return
+
+        if self.path == '/api/chat':
+            messages = payload.get('messages') or []
+        elif self.path == '/api/generate':
+            messages = [{'role': 'user', 'content': payload.get('prompt', '')}]
+            if payload.get('system'):
+                messages.insert(0, {'role': 'system', 'content': payload['system']})
+        else:
+            self._send_json(404, {'error': f'unknown endpoint {self.path}'})
+            return
+
+        status, body = self.server.mock.respond(payload, messages)
+        if body is None:
+            self.close_connection = True
+            return
+        self._send_json(status, body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class MockOllamaServer:
+    """
+    Threaded mock Ollama HTTP server
+
+    Use as a context manager (or start()/stop()) to run it in a background
+    thread; port 0 picks a free port, available as .port once started.
+    """
+
+    def __init__(self, settings: Optional[MockSettings] = None, host: str = '127.0.0.1',
+                 port: int = 0, verbose: bool = False):
+        self.mock = MockOllama(settings or MockSettings())
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.mock = self.mock
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self.httpd.server_address[1]
+
+    @property
+    def stats(self) -> Dict:
+        return dict(self.mock.stats)
+
+    def start(self) -> 'MockOllamaServer':
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted"""
+        self.httpd.serve_forever()
+
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    """Run the mock server"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Mock Ollama server for offline IPD testing")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=11500, help="Port to listen on")
+    parser.add_argument("--strategy", type=str, default="tit_for_tat",
+                        help=f"Default decision strategy ({', '.join(STRATEGIES)}); "
+                             f"models named scripted:<strategy> use that strategy")
+    parser.add_argument("--model-strategy", action="append", default=[], metavar="MODEL=STRATEGY",
+                        help="Strategy for one model (repeatable)")
+    parser.add_argument("--script", type=str, default=None,
+                        help='JSON file {"<model>" or "*": [per-round responses]}; COOPERATE/DEFECT '
+                             'entries get generated reasoning, other text is returned verbatim')
+    parser.add_argument("--latency", type=str, default="lognormal:1.2,0.35",
+                        help="Decision latency: fixed:S, uniform:LO,HI, normal:MEAN,SD, "
+                             "lognormal:MEDIAN,SIGMA, exponential:MEAN (seconds)")
+    parser.add_argument("--reflection-latency", type=str, default="lognormal:6.0,0.35",
+                        help="Reflection latency (same forms as --latency)")
+    parser.add_argument("--ambiguous-rate", type=float, default=0.0,
+                        help="Fraction of decisions with no clear action (triggers forced retries)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--hang-rate", type=float, default=0.0,
+                        help="Fraction of requests that stall for --hang-seconds")
+    parser.add_argument("--hang-seconds", type=float, default=120.0, help="Stall length for --hang-rate")
+    parser.add_argument("--drop-rate", type=float, default=0.0,
+                        help="Fraction of requests whose connection is closed without a response")
+    parser.add_argument("--parallel", type=int, default=4,
+                        help="Requests processed at once; the rest queue (like OLLAMA_NUM_PARALLEL)")
+    parser.add_argument("--cache-slots", type=int, default=4, help="Cached prompt prefixes per model")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed, same responses)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+
+    args = parser.parse_args()
+
+    script = {}
+    if args.script:
+        with open(args.script, 'r') as f:
+            script = json.load(f)
+
+    settings = MockSettings(
+        strategy=args.strategy,
+        model_strategies=dict(entry.split('=', 1) for entry in args.model_strategy),
+        script=script,
+        latency=args.latency,
+        reflection_latency=args.reflection_latency,
+        ambiguous_rate=args.ambiguous_rate,
+        error_rate=args.error_rate,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+        drop_rate=args.drop_rate,
+        parallel=args.parallel,
+        cache_slots=args.cache_slots,
+        seed=args.seed
+    )
+    server = MockOllamaServer(settings, args.host, args.port, args.verbose)
+    print(f"Mock Ollama listening on http://{args.host}:{server.port} "
+          f"(strategy {settings.strategy}, latency {settings.latency})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Stats: {server.stats}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Lazy, shared registry of the analysis models
+Each model is built by its loader on first get(), kept for later callers,
+and can be released to free its memory. Importing this module does not
+import torch or transformers.
+"""
+
+import gc
+import sys
+import threading
+from typing import Callable, Dict, Optional
+
+
+# Inference backends a loader may be asked for: PyTorch, dynamically quantized int8 (CPU), ONNX Runtime (CPU)
+BACKENDS = ('torch', 'int8', 'onnx')
+
+
+def resolve_device(device: Optional[str] = None) -> str:
+    """Return the torch device to run on: the one given, else CUDA if available, else CPU"""
+    if device in (None, 'auto'):
+        import torch
+        return 'cuda' if torch.cuda.is_available() else 'cpu'
+    return device
+
+
+class ModelRegistry:
+    """
+    Models keyed by name, loaded on first use
+
+    Loaders are called as loader(spec, device, backend), where spec is the
+    entry for that name in specs (e.g., {'model': ..., 'revision': ...}) and
+    backend is one of BACKENDS.
+    """
+
+    def __init__(self, specs: Dict[str, Dict], loaders: Dict[str, Callable], device: Optional[str] = None,
+                 backend: str = 'torch'):
+        """
+        Args:
+            specs: {name: spec} passed to the loaders
+            loaders: {name: loader(spec, device, backend) -> model}
+            device: 'cpu', 'cuda', 'cuda:1', ... (default: CUDA if available, resolved on first load)
+            backend: One of BACKENDS
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+        self.specs = specs
+        self.loaders = dict(loaders)
+        self._device = device
+        self.backend = backend
+        self._models = {}
+        self._lock = threading.Lock()
+
+    @property
+    def device(self) -> str:
+        """Device the models are (or will be) loaded on"""
+        self._device = resolve_device(self._device)
+        return self._device
+
+    def set_device(self, device: Optional[str] = None):
+        """Use another device; models already loaded elsewhere are released and reloaded on next use"""
+        device = resolve_device(device)
+        if self._device is not None and device != self._device:
+            self.release_all()
+        self._device = device
+
+    def set_backend(self, backend: str):
+        """Use another backend; loaded models are released and reloaded on next use"""
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+        if backend != self.backend:
+            self.release_all()
+        self.backend = backend
+
+    def get(self, name: str):
+        """Return the model, loading it if needed"""
+        model = self._models.get(name)
+        if model is None:
+            with self._lock:
+                model = self._models.get(name)
+                if model is None:
+                    model = self.loaders[name](self.specs[name], self.device, self.backend)
+                    self._models[name] = model
+        return model
+
+    def is_loaded(self, name: str) -> bool:
+        """True if the model is in memory"""
+        return name in self._models
+
+    def release(self, name: str):
+        """Drop the model so its memory can be freed (it reloads on next get())"""
+        with self._lock:
+            released = self._models.pop(name, None) is not None
+        if released:
+            self._free_memory()
+
+    def release_all(self):
+        """Drop every loaded model"""
+        with self._lock:
+            released = bool(self._models)
+            self._models.clear()
+        if released:
+            self._free_memory()
+
+    @staticmethod
+    def _free_memory():
+        gc.collect()
+        # Only touch torch if a loader already imported it
+        torch = sys.modules.get('torch')
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
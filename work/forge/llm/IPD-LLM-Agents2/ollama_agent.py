@@ -4,12 +4,211 @@ Enhanced with retry logic for ambiguous responses
 Parameters now configurable via EpisodeConfig
 """
 
+import json
 import requests
+from requests.adapters import HTTPAdapter
 import os                   # Added 3/30/2026 for Containerized Architecture @edc
+import threading
 from typing import Optional
 import time
 
 
+class OllamaSession:
+    """
+    Pooled keep-alive HTTP session for a single Ollama server
+
+    One instance is shared by every agent pointed at the same host:port (see
+    get_session), so consecutive rounds reuse open TCP connections instead of
+    opening a new one per request. The underlying requests.Session is rebuilt
+    if it has been idle longer than idle_timeout seconds.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 4, idle_timeout: float = 300):
+        """
+        Args:
+            base_url: Ollama server URL (e.g., "http://tungsten:11434")
+            pool_size: Max keep-alive connections held open to the server
+            idle_timeout: Seconds of inactivity before pooled connections are dropped
+        """
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._session = None
+        self._last_used = 0.0
+        self._in_flight = 0
+
+        # Connection reuse statistics
+        self.requests_sent = 0
+        self.sessions_created = 0
+        self._retired_connections = 0   # Connections opened by sessions already closed
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _open_connections(self, session: requests.Session) -> int:
+        """Count TCP connections opened so far by a session's connection pools"""
+        pools = session.get_adapter(self.base_url).poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    def _retire_session(self):
+        """Close the current session (caller must hold the lock)"""
+        self._retired_connections += self._open_connections(self._session)
+        self._session.close()
+        self._session = None
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST through the pooled session (same signature as requests.post)"""
+        with self._lock:
+            now = time.monotonic()
+            if (self._session is not None and self._in_flight == 0
+                    and now - self._last_used > self.idle_timeout):
+                self._retire_session()
+            if self._session is None:
+                self._session = self._new_session()
+                self.sessions_created += 1
+            self._last_used = now
+            self._in_flight += 1
+            self.requests_sent += 1
+            session = self._session
+
+        try:
+            return session.post(url, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._last_used = time.monotonic()
+
+    def stats(self) -> dict:
+        """Return connection reuse statistics for this server"""
+        with self._lock:
+            opened = self._retired_connections
+            if self._session is not None:
+                opened += self._open_connections(self._session)
+            requests_sent = self.requests_sent
+            sessions_created = self.sessions_created
+
+        reused = max(requests_sent - opened, 0)
+        return {
+            'base_url': self.base_url,
+            'pool_size': self.pool_size,
+            'requests': requests_sent,
+            'connections_opened': opened,
+            'connections_reused': reused,
+            'reuse_rate': reused / requests_sent if requests_sent else 0.0,
+            'sessions_created': sessions_created
+        }
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._retire_session()
+
+
+# Shared sessions, one per Ollama host:port
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(host: str, port: int, pool_size: int = 4, idle_timeout: float = 300) -> OllamaSession:
+    """
+    Return the shared OllamaSession for host:port, creating it on first use
+
+    Pool settings are taken from the first caller for a given server.
+    """
+    base_url = f"http://{host}:{port}"
+    with _sessions_lock:
+        if base_url not in _sessions:
+            _sessions[base_url] = OllamaSession(base_url, pool_size, idle_timeout)
+        return _sessions[base_url]
+
+
+def get_all_session_stats() -> list[dict]:
+    """Return connection reuse statistics for every shared session"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+    return [session.stats() for session in sessions]
+
+
+def close_sessions():
+    """Close and forget all shared sessions"""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+# Per-call telemetry fields summed over every HTTP request made by one call
+# (Ollama durations are in nanoseconds, as reported by the server)
+TELEMETRY_COUNTERS = ('http_seconds', 'requests', 'http_errors', 'forced_retries',
+                      'prompt_eval_count', 'eval_count', 'eval_duration', 'load_duration')
+
+# Seconds to wait before retrying a failed HTTP request
+RETRY_DELAY_SECONDS = 2
+
+
+def estimate_tokens(messages: list[dict]) -> int:
+    """Rough token count of chat messages (about 4 characters per token)"""
+    return sum(len(message['content']) for message in messages) // 4
+
+
+# Follow-up prompt used when a decision response cannot be parsed
+FORCE_DECISION_PROMPT = """Your previous response did not clearly specify COOPERATE or DEFECT.
+
+You MUST choose exactly one action. This is a fundamental requirement of the game.
+
+Respond with ONLY your reasoning (2-3 sentences) followed by exactly one word on its own line:
+COOPERATE
+or
+DEFECT
+
+What is your decision?"""
+
+
+# Ollama structured output schema for decisions (structured_decisions mode);
+# the server constrains generation to this JSON so every response parses
+DECISION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "reasoning": {"type": "string"},
+        "action": {"type": "string", "enum": ["COOPERATE", "DEFECT"]}
+    },
+    "required": ["reasoning", "action"]
+}
+
+# Appended to decision prompts in structured_decisions mode
+STRUCTURED_DECISION_INSTRUCTION = """
+
+Respond in JSON with "reasoning" (2-3 sentences) and "action" ("COOPERATE" or "DEFECT")."""
+
+
+def structured_decision_to_text(content: str) -> str:
+    """
+    Convert a structured decision response to the plain text format
+    
+    Returns:
+        "reasoning\nACTION" (the layout extract_decision expects), or the
+        content unchanged if it is not a valid decision object (e.g., truncated
+        by the token limit)
+    """
+    try:
+        decision = json.loads(content)
+        action = decision['action'].strip().upper()
+        reasoning = str(decision.get('reasoning', '')).strip()
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return content
+    if action not in ('COOPERATE', 'DEFECT'):
+        return content
+    return f"{reasoning}\n{action}" if reasoning else action
+
+
 class OllamaAgent:
     """An agent that uses Ollama LLM for decision-making in IPD"""
     
@@ -30,7 +229,15 @@ class OllamaAgent:
         decision_token_limit: int = 256,
         reflection_token_limit: int = 1024,
         http_timeout: int = 60,
-        force_decision_retries: int = 2
+        force_decision_retries: int = 2,
+        pool_size: int = 4,
+        pool_idle_timeout: float = 300,
+        keep_alive: Optional[str] = None,
+        num_ctx: Optional[int] = None,
+        max_context_exchanges: Optional[int] = None,
+        keep_reflections: int = 1,
+        context_token_budget: Optional[int] = None,
+        structured_decisions: bool = False
     ):
         """
         Initialize an Ollama agent
@@ -46,6 +253,18 @@ class OllamaAgent:
             reflection_token_limit: Max tokens for reflection responses (default: 1024)
             http_timeout: Seconds to wait for HTTP response (default: 60)
             force_decision_retries: Number of retries for ambiguous decisions (default: 2)
+            pool_size: Keep-alive connections pooled per Ollama server (default: 4)
+            pool_idle_timeout: Seconds before idle pooled connections are dropped (default: 300)
+            keep_alive: How long Ollama keeps the model loaded after a request, e.g. "30m"
+                        (default: None = server default)
+            num_ctx: Fixed context window in tokens (default: None = model default)
+            max_context_exchanges: Keep only the last N prompt/response exchanges in
+                                   context (default: None = unbounded)
+            keep_reflections: Most recent reflections kept in context when truncating (default: 1)
+            context_token_budget: Drop the oldest messages until the estimated context
+                                  fits this many tokens (default: None = no budget)
+            structured_decisions: Constrain decision responses to DECISION_SCHEMA with
+                                  Ollama's format parameter (default: False)
         """
         self.agent_id = agent_id
         self.model = model
@@ -58,6 +277,29 @@ class OllamaAgent:
         self.reflection_token_limit = reflection_token_limit
         self.http_timeout = http_timeout
         self.force_decision_retries = force_decision_retries
+        self.structured_decisions = structured_decisions
+        
+        # Prompt cache (KV-cache) friendliness: keep the model resident and the
+        # context size fixed so the server can reuse the evaluated prefix
+        self.keep_alive = keep_alive
+        self.num_ctx = num_ctx
+        self.prompt_eval_log = []   # One entry per successful request
+        
+        # Bounded context policy (system prompt and the pending prompt are always kept)
+        self.max_context_exchanges = max_context_exchanges
+        self.keep_reflections = keep_reflections
+        self.context_token_budget = context_token_budget
+        self.messages_truncated = 0
+        self._reflections = []          # Reflection message groups, oldest first
+        self._pending_reflection = None
+        
+        # Telemetry for the most recent decision or reflection call
+        self.last_call_telemetry = None
+        self._call = None
+        self._call_depth = 0
+        
+        # Keep-alive HTTP session shared with other agents on the same server
+        self.session = self._create_session(host, port, pool_size, pool_idle_timeout)
         
         # Conversation history (for in-context learning)
         self.conversation = []
@@ -67,12 +309,17 @@ class OllamaAgent:
                 "content": system_prompt
             })
     
+    def _create_session(self, host: str, port: int, pool_size: int, pool_idle_timeout: float):
+        """Return the HTTP session used to reach the Ollama server"""
+        return get_session(host, port, pool_size, pool_idle_timeout)
+    
     def generate(
         self, 
         prompt: str, 
         max_retries: int = 3,
         num_predict: int = None,
-        is_reflection: bool = False
+        is_reflection: bool = False,
+        response_format: Optional[dict] = None
     ) -> Optional[str]:
         """
         Generate a response from the LLM
@@ -82,19 +329,117 @@ class OllamaAgent:
             max_retries: Number of times to retry on failure
             num_predict: Maximum tokens to generate (uses configured limits if None)
             is_reflection: If True, use reflection token limit
+            response_format: JSON schema the response must follow (Ollama "format")
             
         Returns:
             Generated text, or None if all retries fail
         """
+        url, payload = self._prepare_request(prompt, num_predict, is_reflection, response_format)
+        
+        self._begin_call()
+        try:
+            # Try to get response with retries
+            for attempt in range(max_retries):
+                started = time.perf_counter()
+                try:
+                    response = self.session.post(url, json=payload, timeout=self.http_timeout)
+                    return self._parse_response(response, started)
+                    
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    if not self._retry_after_error(e, attempt, max_retries, started):
+                        return None
+                    time.sleep(RETRY_DELAY_SECONDS)
+            
+            return None
+        finally:
+            self._end_call()
+    
+    def _parse_response(self, response, started: float) -> str:
+        """
+        Check an HTTP response, record it and return the assistant's text
+        
+        Raises the HTTP library's error for an error status, or ValueError
+        for a body that is not valid JSON (both are retried by generate()).
+        """
+        response.raise_for_status()
+        result = response.json()
+        self._record_request(time.perf_counter() - started, result)
+        return self._handle_response(result)
+    
+    def _retry_after_error(self, error: Exception, attempt: int, max_retries: int, started: float) -> bool:
+        """Record a failed request; True if generate() has attempts left"""
+        self._record_request(time.perf_counter() - started)
+        print(f"  ⚠️  {self.agent_id} API error (attempt {attempt + 1}/{max_retries}): {error}")
+        return attempt < max_retries - 1
+    
+    def _begin_call(self):
+        """Start timing a call; nested calls (e.g., forced-decision retries) join the outer one"""
+        if self._call_depth == 0:
+            self._call = {counter: 0 for counter in TELEMETRY_COUNTERS}
+            self._call['started'] = time.perf_counter()
+        self._call_depth += 1
+    
+    def _record_request(self, seconds: float, result: Optional[dict] = None):
+        """Add one HTTP request (and Ollama's counters if it succeeded) to the current call"""
+        self._call['http_seconds'] += seconds
+        self._call['requests'] += 1
+        if result is None:
+            self._call['http_errors'] += 1
+            return
+        for counter in ('prompt_eval_count', 'eval_count', 'eval_duration', 'load_duration'):
+            self._call[counter] += result.get(counter, 0)
+    
+    def _end_call(self):
+        """Finish the current call and publish its telemetry as last_call_telemetry"""
+        self._call_depth -= 1
+        if self._call_depth > 0:
+            return
+        call = self._call
+        started = call.pop('started')
+        self.last_call_telemetry = {
+            'wall_seconds': time.perf_counter() - started,
+            'http_seconds': call['http_seconds'],
+            'requests': call['requests'],
+            'retries': max(call['requests'] - 1, 0),
+            'http_errors': call['http_errors'],
+            'forced_retries': call['forced_retries'],
+            'prompt_eval_count': call['prompt_eval_count'],
+            'eval_count': call['eval_count'],
+            'eval_duration': call['eval_duration'],
+            'load_duration': call['load_duration']
+        }
+        self._call = None
+    
+    def _prepare_request(
+        self,
+        prompt: str,
+        num_predict: Optional[int],
+        is_reflection: bool,
+        response_format: Optional[dict] = None
+    ) -> tuple[str, dict]:
+        """
+        Add the user prompt to the conversation and build the /api/chat request
+        
+        Returns:
+            (url, payload) tuple
+        """
         # Use configured token limits if not explicitly specified
         if num_predict is None:
             num_predict = self.reflection_token_limit if is_reflection else self.decision_token_limit
         
         # Add user message to conversation
-        self.conversation.append({
+        message = {
             "role": "user",
             "content": prompt
-        })
+        }
+        self.conversation.append(message)
+        
+        self._pending_reflection = None
+        if is_reflection:
+            self._pending_reflection = [message]
+            self._reflections.append(self._pending_reflection)
+        
+        self._apply_context_policy()
         
         # Prepare API request
         url = f"{self.base_url}/api/chat"
@@ -108,31 +453,89 @@ class OllamaAgent:
             }
         }
         
-        # Try to get response with retries
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(url, json=payload, timeout=self.http_timeout)
-                response.raise_for_status()
-                
-                result = response.json()
-                assistant_message = result['message']['content']
-                
-                # Add assistant response to conversation history
-                self.conversation.append({
-                    "role": "assistant",
-                    "content": assistant_message
-                })
-                
-                return assistant_message
-                
-            except requests.exceptions.RequestException as e:
-                print(f"  ⚠️  {self.agent_id} API error (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2)  # Wait before retry
-                else:
-                    return None
+        # Changing num_ctx between requests reloads the model and discards the
+        # cache, and overflowing it makes Ollama drop the oldest messages, which
+        # shifts the prefix every round - so it is pinned for the agent's lifetime
+        if self.num_ctx:
+            payload["options"]["num_ctx"] = self.num_ctx
+        if self.keep_alive:
+            payload["keep_alive"] = self.keep_alive
+        if response_format is not None:
+            payload["format"] = response_format
+        return url, payload
+    
+    def _handle_response(self, result: dict) -> str:
+        """Record a successful /api/chat result in the conversation and return its text"""
+        assistant_message = result['message']['content']
+        
+        # Tokens the server actually evaluated vs. the size of the prompt sent;
+        # a cache hit shows up as prompt_eval_count far below prompt_tokens
+        self.prompt_eval_log.append({
+            'prompt_tokens': estimate_tokens(self.conversation),
+            'prompt_eval_count': result.get('prompt_eval_count', 0)
+        })
+        
+        # Add assistant response to conversation history
+        message = {
+            "role": "assistant",
+            "content": assistant_message
+        }
+        self.conversation.append(message)
+        if self._pending_reflection is not None:
+            self._pending_reflection.append(message)
+            self._pending_reflection = None
         
-        return None
+        return assistant_message
+    
+    def _apply_context_policy(self):
+        """
+        Trim the conversation to the configured context bounds
+        
+        Keeps the system prompt, the pending prompt, the last keep_reflections
+        reflections, and the last max_context_exchanges exchanges (a user message
+        and the assistant replies that follow it), then drops the oldest
+        exchanges - and finally the oldest kept reflections - until the
+        estimated size fits context_token_budget.
+        """
+        if self.max_context_exchanges is None and self.context_token_budget is None:
+            return
+        
+        head = self.conversation[:1] if self.conversation and self.conversation[0]['role'] == 'system' else []
+        pending = self.conversation[-1:]
+        body = self.conversation[len(head):-1]
+        
+        reflections = self._reflections[-self.keep_reflections:] if self.keep_reflections > 0 else []
+        pinned = {id(m) for group in reflections for m in group}
+        
+        exchanges = []
+        for message in body:
+            if id(message) in pinned:
+                continue
+            if message['role'] != 'assistant' or not exchanges:
+                exchanges.append([message])
+            else:
+                exchanges[-1].append(message)
+        
+        if self.max_context_exchanges is not None:
+            exchanges = exchanges[-self.max_context_exchanges:] if self.max_context_exchanges > 0 else []
+        
+        if self.context_token_budget is not None:
+            reflections = [[m for m in group if m is not pending[0]] for group in reflections]
+            fixed = estimate_tokens(head) + estimate_tokens(pending)
+            size = (fixed + sum(estimate_tokens(g) for g in exchanges)
+                    + sum(estimate_tokens(g) for g in reflections))
+            while size > self.context_token_budget and (exchanges or reflections):
+                dropped = exchanges.pop(0) if exchanges else reflections.pop(0)
+                size -= estimate_tokens(dropped)
+        
+        keep = {id(m) for m in head + pending}
+        keep.update(id(m) for group in exchanges + reflections for m in group)
+        
+        conversation = [m for m in self.conversation if id(m) in keep]
+        self.messages_truncated += len(self.conversation) - len(conversation)
+        self.conversation = conversation
+        self._reflections = [group for group in self._reflections
+                             if any(id(m) in keep for m in group)]
     
     def generate_with_forced_decision(
         self, 
@@ -149,8 +552,36 @@ class OllamaAgent:
         Returns:
             (decision, full_response) tuple
         """
+        self._begin_call()
+        try:
+            return self._generate_decision(prompt, extract_decision_fn)
+        finally:
+            self._end_call()
+    
+    def _generate_decision(
+        self,
+        prompt: str,
+        extract_decision_fn
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Run _decision_exchange with blocking generate() calls"""
+        exchange = self._decision_exchange(prompt, extract_decision_fn)
+        try:
+            request_prompt, request_args = next(exchange)
+            while True:
+                request_prompt, request_args = exchange.send(self.generate(request_prompt, **request_args))
+        except StopIteration as done:
+            return done.value
+    
+    def _decision_exchange(self, prompt: str, extract_decision_fn):
+        """
+        Decision request plus forced-decision retries (see generate_with_forced_decision)
+        
+        Written once for the sync and async agents: a generator that yields
+        (prompt, generate() kwargs) for each request, is sent generate()'s
+        result, and returns the (decision, full_response) tuple.
+        """
         # First attempt with full prompt
-        response = self.generate(prompt, num_predict=self.decision_token_limit)
+        response = self._decision_response((yield self._decision_request(prompt)))
         
         if response is None:
             return None, None
@@ -163,20 +594,9 @@ class OllamaAgent:
         # Response was ambiguous - retry with forced decision prompt
         for retry in range(self.force_decision_retries):
             print(f"  ⚠️  {self.agent_id} gave ambiguous response, forcing decision (attempt {retry + 1}/{self.force_decision_retries})")
+            self._call['forced_retries'] += 1
             
-            # Create a forcing prompt
-            force_prompt = """Your previous response did not clearly specify COOPERATE or DEFECT.
-
-You MUST choose exactly one action. This is a fundamental requirement of the game.
-
-Respond with ONLY your reasoning (2-3 sentences) followed by exactly one word on its own line:
-COOPERATE
-or
-DEFECT
-
-What is your decision?"""
-            
-            response = self.generate(force_prompt, num_predict=self.decision_token_limit)
+            response = self._decision_response((yield self._decision_request(FORCE_DECISION_PROMPT)))
             
             if response is None:
                 continue
@@ -189,6 +609,29 @@ What is your decision?"""
         # All retries failed
         return None, response
     
+    def _decision_request(self, prompt: str) -> tuple[str, dict]:
+        """(prompt text, generate() kwargs) for a decision request"""
+        return self._decision_prompt_text(prompt), self._decision_request_args()
+    
+    def _decision_prompt_text(self, prompt: str) -> str:
+        """Return a decision prompt, with the JSON instruction in structured mode"""
+        if self.structured_decisions:
+            return prompt + STRUCTURED_DECISION_INSTRUCTION
+        return prompt
+    
+    def _decision_request_args(self) -> dict:
+        """Keyword arguments to generate() for a decision request"""
+        args = {'num_predict': self.decision_token_limit}
+        if self.structured_decisions:
+            args['response_format'] = DECISION_SCHEMA
+        return args
+    
+    def _decision_response(self, response: Optional[str]) -> Optional[str]:
+        """Convert a structured decision response to text (no-op in free-text mode)"""
+        if response is None or not self.structured_decisions:
+            return response
+        return structured_decision_to_text(response)
+    
     def reset_conversation(self, keep_system_prompt: bool = True):
         """
         Reset the conversation history
@@ -203,6 +646,7 @@ What is your decision?"""
             }]
         else:
             self.conversation = []
+        self._reflections = []
     
     def add_reflection_to_context(self, reflection_text: str):
         """
@@ -211,14 +655,62 @@ What is your decision?"""
         Args:
             reflection_text: The reflection to add to context
         """
-        self.conversation.append({
+        message = {
             "role": "user",
             "content": reflection_text
-        })
+        }
+        self.conversation.append(message)
+        self._reflections.append([message])
+    
+    def get_reflection_indices(self) -> list[list[int]]:
+        """Return the conversation positions of each tracked reflection (for checkpoints)"""
+        positions = {id(m): i for i, m in enumerate(self.conversation)}
+        return [[positions[id(m)] for m in group if id(m) in positions]
+                for group in self._reflections]
+    
+    def restore_conversation(self, conversation: list[dict], reflection_indices: list[list[int]] = None):
+        """
+        Replace the conversation, e.g. from a checkpoint
+        
+        Args:
+            conversation: Messages to restore
+            reflection_indices: Output of get_reflection_indices() for that conversation
+        """
+        self.conversation = conversation
+        self._reflections = [[conversation[i] for i in group]
+                             for group in (reflection_indices or [])]
+        self._pending_reflection = None
+    
+    def get_context_tokens(self) -> int:
+        """Return the estimated token size of the current conversation"""
+        return estimate_tokens(self.conversation)
     
     def get_conversation_length(self) -> int:
         """Return the number of messages in conversation history"""
         return len(self.conversation)
     
+    def get_connection_stats(self) -> dict:
+        """Return connection reuse statistics for this agent's Ollama server"""
+        return self.session.stats()
+    
+    def get_prompt_cache_stats(self) -> dict:
+        """
+        Summarize prompt evaluation across this agent's requests
+        
+        Returns:
+            Dictionary with request count, estimated prompt tokens sent, tokens
+            the server evaluated, the implied cached fraction, and the
+            per-request prompt_eval_count values
+        """
+        prompt_tokens = sum(entry['prompt_tokens'] for entry in self.prompt_eval_log)
+        evaluated = sum(entry['prompt_eval_count'] for entry in self.prompt_eval_log)
+        return {
+            'requests': len(self.prompt_eval_log),
+            'prompt_tokens_estimate': prompt_tokens,
+            'prompt_eval_tokens': evaluated,
+            'cached_rate_estimate': max(1 - evaluated / prompt_tokens, 0.0) if prompt_tokens else 0.0,
+            'prompt_eval_counts': [entry['prompt_eval_count'] for entry in self.prompt_eval_log]
+        }
+    
     def __repr__(self) -> str:
         return f"OllamaAgent(id={self.agent_id}, model={self.model}, conv_length={len(self.conversation)})"
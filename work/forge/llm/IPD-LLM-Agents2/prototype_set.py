@@ -0,0 +1,112 @@
+"""
+Prototype sentences compiled into a normalized embedding matrix
+Reflections are scored against every prototype with one matrix multiply.
+A compiled set can be saved (.npz) and loaded without re-encoding; a set
+of sentences can be read from a JSON file {name: sentence}.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+# Moral sophistication levels used by reflection_analysis_with_bert
+DEFAULT_PROTOTYPES = {
+    'Level 0 - Reactive': "They defected so I defected back",
+    'Level 1 - Simple Moral': "That wasn't fair to me",
+    'Level 2 - Moral Reasoning': "Cooperation is fair because it benefits both of us equally and builds trust",
+    'Level 3 - Complex Moral': "While defecting might maximize my short-term points, sustained mutual cooperation through consistent reciprocity creates better long-term outcomes for both participants and builds lasting trust"
+}
+
+
+def normalize_rows(matrix) -> np.ndarray:
+    """Scale each row to unit length (float32; zero rows stay zero)"""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class PrototypeSet:
+    """
+    Named prototype sentences and their unit-length embeddings
+
+    Attributes:
+        names: Prototype names (e.g., sophistication levels), in order
+        sentences: One sentence per name
+        embeddings: (len(names), dim) float32 matrix of unit rows
+        model, revision: Encoder the embeddings came from
+    """
+
+    def __init__(self, names: List[str], sentences: List[str], embeddings, model: str, revision: str):
+        self.names = list(names)
+        self.sentences = list(sentences)
+        self.embeddings = normalize_rows(embeddings)
+        self.model = model
+        self.revision = revision
+
+    @classmethod
+    def compile(cls, prototypes: Dict[str, str], encode: Callable, model: str, revision: str) -> 'PrototypeSet':
+        """
+        Encode {name: sentence} once
+
+        Args:
+            encode: Function taking a list of sentences and returning one embedding per sentence
+            model, revision: Encoder identity, stored so a saved set can be checked against it
+        """
+        names = list(prototypes)
+        sentences = [prototypes[name] for name in names]
+        return cls(names, sentences, np.stack(encode(sentences)), model, revision)
+
+    @classmethod
+    def from_file(cls, path: str, encode: Callable, model: str, revision: str) -> 'PrototypeSet':
+        """
+        Read a prototype set for this encoder
+
+        A .npz written by save() is used as is if it came from the same
+        model and revision, otherwise its sentences are re-encoded. Any
+        other file is read as JSON {name: sentence} and encoded.
+        """
+        if Path(path).suffix == '.npz':
+            prototypes = cls.load(path)
+            if (prototypes.model, prototypes.revision) == (model, revision):
+                return prototypes
+            print(f"Warning: {path} was compiled with {prototypes.model}@{prototypes.revision}; re-encoding")
+            return cls.compile(dict(zip(prototypes.names, prototypes.sentences)), encode, model, revision)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            prototypes = json.load(f)
+        if not isinstance(prototypes, dict) or not prototypes or \
+                not all(isinstance(s, str) for s in prototypes.values()):
+            raise ValueError(f"{path}: expected a JSON object mapping names to sentences")
+        return cls.compile(prototypes, encode, model, revision)
+
+    def save(self, path: str):
+        """Write names, sentences, embeddings and encoder identity to a .npz file"""
+        # Write through a file object so numpy does not append a second .npz suffix
+        with open(path, 'wb') as f:
+            np.savez(f, names=np.array(self.names), sentences=np.array(self.sentences),
+                     embeddings=self.embeddings, model=np.array(self.model), revision=np.array(self.revision))
+
+    @classmethod
+    def load(cls, path: str) -> 'PrototypeSet':
+        """Read a set written by save()"""
+        with np.load(path) as data:
+            return cls(data['names'].tolist(), data['sentences'].tolist(), data['embeddings'],
+                       str(data['model']), str(data['revision']))
+
+    def similarities(self, embeddings) -> np.ndarray:
+        """
+        Cosine similarity of each embedding to each prototype
+
+        Args:
+            embeddings: (n, dim) array, or a single (dim,) vector
+
+        Returns:
+            (n, len(names)) array
+        """
+        return normalize_rows(np.atleast_2d(embeddings)) @ self.embeddings.T
+
+    def __len__(self) -> int:
+        return len(self.names)
@@ -4,52 +4,208 @@ Uses zero-shot classification and semantic similarity
 """
 
 import json
+import hashlib
+import importlib.util
 from pathlib import Path
 from collections import defaultdict
-from transformers import pipeline
-from sentence_transformers import SentenceTransformer, util
-import torch
+import numpy as np
 import warnings
 
+from model_registry import ModelRegistry, BACKENDS
+from prototype_set import PrototypeSet, DEFAULT_PROTOTYPES
+from score_cache import ScoreCache, DEFAULT_CACHE_PATH, cached_outputs
+
 # Import shared utility functions
 from functions import (
     load_game_files, load_json_file, extract_config, get_prompt_type,
     create_output_directory, save_figure, apply_plot_styling,
-    calculate_mean_trajectory, get_episode_range, print_progress
+    calculate_mean_trajectory, get_episode_range, print_progress,
+    extract_reflections_batch
 )
 
 warnings.filterwarnings('ignore', message='.*position_ids.*')
 
 try:
     import matplotlib.pyplot as plt
-    import numpy as np
     from matplotlib.lines import Line2D
     HAS_MATPLOTLIB = True
 except ImportError:
     HAS_MATPLOTLIB = False
     print("Warning: matplotlib not installed")
 
-print("Loading BERT models... (this may take a minute first time)")
+# Optional ONNX Runtime backend (--backend onnx); only looked up here, imported when used
+HAS_ONNX = all(importlib.util.find_spec(name) is not None for name in ('onnxruntime', 'optimum'))
 
-# Load zero-shot classifier
-classifier = pipeline(
-    "zero-shot-classification", 
-    model="typeform/distilbert-base-uncased-mnli",
-    device=0 if torch.cuda.is_available() else -1,
-    batch_size=8
-)
+# Reflections per forward pass (zero-shot pairs, sentiment texts, encoder sentences)
+DEFAULT_BATCH_SIZE = 32
 
-# Sentiment model (distilbert fine-tuned on SST-2)
-sentiment_model = pipeline(
-    "sentiment-analysis",
-    model="distilbert-base-uncased-finetuned-sst-2-english",
-    device=0 if torch.cuda.is_available() else -1
-)
+# Models used by the scorers; pin 'revision' (a hub commit or tag) for reproducible scores
+MODEL_SPECS = {
+    'zero_shot': {'model': "typeform/distilbert-base-uncased-mnli", 'revision': None},
+    'sentiment': {'model': "distilbert-base-uncased-finetuned-sst-2-english", 'revision': None},
+    'similarity': {'model': "all-MiniLM-L6-v2", 'revision': None},
+}
+
+
+def _check_backend(backend, device):
+    if backend == 'torch':
+        return
+    if not str(device).startswith('cpu'):
+        raise ValueError(f"The {backend} backend runs on CPU only (got device '{device}')")
+    if backend == 'onnx' and not HAS_ONNX:
+        raise ImportError("The onnx backend needs ONNX Runtime: pip install optimum[onnxruntime]")
+
+
+def _quantize(model):
+    # int8 weights for every Linear layer; activations are quantized on the fly per batch
+    import torch
+    with warnings.catch_warnings():
+        # Eager-mode quantization warns that it is moving to torchao; it still works
+        warnings.simplefilter('ignore', DeprecationWarning)
+        warnings.filterwarnings('ignore', message='.*quantize_per_tensor.*')
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _load_pipeline(task, spec, device, backend):
+    from transformers import pipeline
+    _check_backend(backend, device)
+    print(f"Loading {task} model ({spec['model']}, {backend}) on {device}...")
+    
+    if backend == 'onnx':
+        # Exported to ONNX when loaded
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer
+        model = ORTModelForSequenceClassification.from_pretrained(spec['model'], revision=spec['revision'],
+                                                                  export=True)
+        tokenizer = AutoTokenizer.from_pretrained(spec['model'], revision=spec['revision'])
+        return pipeline(task, model=model, tokenizer=tokenizer)
+    
+    pipe = pipeline(task, model=spec['model'], revision=spec['revision'], device=device)
+    if backend == 'int8':
+        pipe.model = _quantize(pipe.model)
+    return pipe
+
+
+def _load_zero_shot(spec, device, backend):
+    return _load_pipeline("zero-shot-classification", spec, device, backend)
+
+
+def _load_sentiment(spec, device, backend):
+    # Sentiment model (distilbert fine-tuned on SST-2)
+    return _load_pipeline("sentiment-analysis", spec, device, backend)
+
+
+def _load_similarity(spec, device, backend):
+    # Sentence transformer for semantic similarity
+    from sentence_transformers import SentenceTransformer
+    _check_backend(backend, device)
+    print(f"Loading sentence model ({spec['model']}, {backend}) on {device}...")
+    
+    if backend == 'onnx':
+        return SentenceTransformer(spec['model'], revision=spec['revision'], device=device, backend='onnx')
+    
+    model = SentenceTransformer(spec['model'], revision=spec['revision'], device=device)
+    return _quantize(model) if backend == 'int8' else model
+
+
+# Models load on first use, so callers that only need sentiment never load the others
+MODELS = ModelRegistry(MODEL_SPECS, {
+    'zero_shot': _load_zero_shot,
+    'sentiment': _load_sentiment,
+    'similarity': _load_similarity,
+})
 
-# Load sentence transformer for semantic similarity
-similarity_model = SentenceTransformer('all-MiniLM-L6-v2')
 
-print("✓ Models loaded!\n")
+def load_models(device=None):
+    """
+    Load (or reload on another device) the zero-shot, sentiment and sentence models now
+    instead of on first use.
+    
+    Args:
+        device: 'cpu', 'cuda', 'cuda:1', ... (default: CUDA if available)
+    """
+    MODELS.set_device(device)
+    for name in MODEL_SPECS:
+        MODELS.get(name)
+    print("✓ Models loaded!\n")
+
+
+def _hub_commit(key):
+    """
+    Hub commit of a MODEL_SPECS entry, read without loading the model
+    
+    Looks up the local Hugging Face cache (refs -> snapshots/<commit>) for
+    the model's config.json. Falls back to loading the model only if it is
+    not in the cache yet, which means it is about to be downloaded anyway.
+    """
+    spec = MODEL_SPECS[key]
+    if Path(spec['model']).is_dir():
+        return 'unknown'
+    
+    from huggingface_hub import try_to_load_from_cache
+    repo_ids = [spec['model']]
+    if key == 'similarity' and '/' not in spec['model']:
+        # SentenceTransformer resolves short names under sentence-transformers/
+        repo_ids.append(f"sentence-transformers/{spec['model']}")
+    for repo_id in repo_ids:
+        path = try_to_load_from_cache(repo_id, 'config.json')
+        if isinstance(path, str):
+            return Path(path).parent.name
+    
+    model = MODELS.get(key)
+    config = model[0].auto_model.config if key == 'similarity' else model.model.config
+    return getattr(config, '_commit_hash', None) or 'unknown'
+
+
+# Resolved revisions, by (MODEL_SPECS key, backend)
+_revisions = {}
+
+
+def model_revision(key):
+    """
+    Revision recorded with cached scores for a MODEL_SPECS entry
+
+    The pinned revision if set, else the hub commit of the model in the
+    local Hugging Face cache, else 'unknown' (e.g., a local directory).
+    Backends other than torch are appended (e.g., 'abc123:int8'), since
+    their scores differ slightly from the PyTorch ones. Resolving it does
+    not load the model, so fully cached runs load none.
+    """
+    if (key, MODELS.backend) not in _revisions:
+        revision = MODEL_SPECS[key]['revision'] or _hub_commit(key)
+        if MODELS.backend != 'torch':
+            revision = f"{revision}:{MODELS.backend}"
+        _revisions[key, MODELS.backend] = revision
+    return _revisions[key, MODELS.backend]
+
+
+# Score cache (see score_cache.py); opened on first use, None when disabled
+SCORE_CACHE_PATH = DEFAULT_CACHE_PATH
+score_cache = None
+
+
+def use_score_cache(path=DEFAULT_CACHE_PATH):
+    """Cache scores in this SQLite file from now on (None disables the cache)"""
+    global SCORE_CACHE_PATH, score_cache
+    if score_cache is not None:
+        score_cache.close()
+    SCORE_CACHE_PATH = path
+    score_cache = None
+
+
+def get_score_cache():
+    """Return the open ScoreCache, or None if caching is disabled"""
+    global score_cache
+    if score_cache is None and SCORE_CACHE_PATH:
+        score_cache = ScoreCache(SCORE_CACHE_PATH)
+    return score_cache
+
+
+def _cached(key, kind, texts, compute, embeddings=False):
+    """Outputs of the MODEL_SPECS[key] model for texts, through the score cache"""
+    cache = get_score_cache()
+    revision = model_revision(key) if cache is not None else None
+    return cached_outputs(cache, MODEL_SPECS[key]['model'], revision, kind, texts, compute, embeddings)
 
 
 # Define categories for zero-shot classification
@@ -69,6 +225,15 @@ MORAL_THEMES = [
     "exploitation and selfishness"
 ]
 
+# Every reflection is paired with all 17 hypotheses in one pass; categories and
+# themes are then each softmaxed over their own entailment logits
+ZERO_SHOT_LABELS = MORAL_CATEGORIES + MORAL_THEMES
+HYPOTHESIS_TEMPLATE = "This example is {}."
+
+# Reflections longer than the model's input are split into overlapping chunks
+# (this many tokens shared between neighbours); chunk logits are averaged
+CHUNK_STRIDE = 64
+
 def get_moral_valence(category):
     """
     Determine if a moral category is positive or negative.
@@ -86,94 +251,245 @@ def get_moral_valence(category):
     else:
         return 'unknown'
 
-def bert_sentiment_score(text):
-    """Calculate sentiment score from -1 to +1"""
-    result = sentiment_model(text)[0]
-    label = result['label']
-    score = result['score']
-    
-    return score if label == "POSITIVE" else -score
+def _as_batch(texts):
+    """Return (list of texts, True if a single string was passed)"""
+    if isinstance(texts, str):
+        return [texts], True
+    return list(texts), False
 
-def bert_moral_density(text):
-    """Calculate moral density percentage"""
-    result = classifier(text, MORAL_THEMES)
-    scores = result['scores']
-    return (sum(scores) / len(scores)) * 100
+def _entailment_logits(texts, batch_size):
+    """
+    NLI entailment logit of every (text, hypothesis) pair, shape (len(texts), len(ZERO_SHOT_LABELS))
+    
+    Pairs are tokenized with the premise truncated first; a premise that does
+    not fit is split into overlapping chunks instead of being cut off, and
+    its logits are the mean over chunks. Texts are tokenized a slice at a
+    time, so memory does not grow with the number of texts.
+    """
+    import torch
+    
+    zero_shot = MODELS.get('zero_shot')
+    model, tokenizer = zero_shot.model, zero_shot.tokenizer
+    max_length = min(tokenizer.model_max_length, model.config.max_position_embeddings)
+    hypotheses = [HYPOTHESIS_TEMPLATE.format(label) for label in ZERO_SHOT_LABELS]
+    texts_per_slice = max(batch_size // len(hypotheses), 1)
+    
+    averaged = []
+    for first in range(0, len(texts), texts_per_slice):
+        chunk = texts[first:first + texts_per_slice]
+        premises = [text for text in chunk for _ in hypotheses]
+        inputs = tokenizer(premises, hypotheses * len(chunk), truncation='only_first', max_length=max_length,
+                           stride=CHUNK_STRIDE, return_overflowing_tokens=tokenizer.is_fast,
+                           padding=True, return_tensors='pt')
+        # Row -> (text, hypothesis) pair; without a fast tokenizer long premises are just truncated
+        pair_ids = inputs['overflow_to_sample_mapping'] if tokenizer.is_fast else torch.arange(len(premises))
+        
+        logits = []
+        with torch.inference_mode():
+            for start in range(0, len(pair_ids), batch_size):
+                rows = slice(start, start + batch_size)
+                length = int(inputs['attention_mask'][rows].sum(dim=1).max())
+                batch = {name: inputs[name][rows, :length].to(model.device) for name in tokenizer.model_input_names}
+                logits.append(model(**batch).logits[:, zero_shot.entailment_id].float().cpu())
+        logits = torch.cat(logits)
+        
+        # Average the chunks of each pair
+        totals = torch.zeros(len(premises)).index_add_(0, pair_ids, logits)
+        counts = torch.zeros(len(premises)).index_add_(0, pair_ids, torch.ones(len(pair_ids)))
+        averaged.append((totals / counts).reshape(len(chunk), len(hypotheses)))
+    return torch.cat(averaged).numpy()
 
-def classify_reflection(reflection_text):
-    """Classify reflection into moral reasoning categories"""
-    result = classifier(reflection_text, MORAL_CATEGORIES)
+def zero_shot_scores(texts, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Zero-shot results for MORAL_CATEGORIES and MORAL_THEMES from one NLI pass
     
-    return {
+    Returns:
+        (categories, themes): lists aligned with texts of {'labels', 'scores'}
+        dicts, labels sorted by score as the zero-shot pipeline returns them
+    """
+    texts = list(texts)
+    if not texts:
+        return [], []
+    
+    # Template and labels are part of the key: other hypotheses give other logits
+    kind = 'nli_entailment:' + hashlib.sha256(
+        json.dumps([HYPOTHESIS_TEMPLATE, ZERO_SHOT_LABELS, CHUNK_STRIDE]).encode()).hexdigest()[:16]
+    logits = np.array(_cached('zero_shot', kind, texts,
+                              lambda batch: _entailment_logits(batch, batch_size).tolist()), dtype=np.float32)
+    
+    def label_set(labels, columns):
+        # Softmax of the entailment logits over this label set (multi_label=False)
+        exp = np.exp(columns - columns.max(axis=1, keepdims=True))
+        scores = exp / exp.sum(axis=1, keepdims=True)
+        results = []
+        for row in scores:
+            order = list(reversed(row.argsort()))
+            results.append({'labels': [labels[i] for i in order], 'scores': row[order].tolist()})
+        return results
+    
+    n = len(MORAL_CATEGORIES)
+    return (label_set(MORAL_CATEGORIES, logits[:, :n]),
+            label_set(MORAL_THEMES, logits[:, n:]))
+
+def _moral_densities(results):
+    return [(sum(r['scores']) / len(r['scores'])) * 100 for r in results]
+
+def _classifications(results):
+    return [{
         'top_category': result['labels'][0],
         'confidence': result['scores'][0],
         'all_scores': dict(zip(result['labels'], result['scores']))
-    }
+    } for result in results]
 
-def calculate_moral_sophistication(reflection_text):
-    """Calculate moral sophistication using semantic similarity"""
+def bert_sentiment_score(texts, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Calculate sentiment score from -1 to +1
     
-    prototypes = {
-        'Level 0 - Reactive': "They defected so I defected back",
-        'Level 1 - Simple Moral': "That wasn't fair to me",
-        'Level 2 - Moral Reasoning': "Cooperation is fair because it benefits both of us equally and builds trust",
-        'Level 3 - Complex Moral': "While defecting might maximize my short-term points, sustained mutual cooperation through consistent reciprocity creates better long-term outcomes for both participants and builds lasting trust"
-    }
+    Args:
+        texts: A reflection, or a list of reflections scored in batches
+        batch_size: Texts per forward pass
+        
+    Returns:
+        float for a single text, list of floats for a list
+    """
+    batch, single = _as_batch(texts)
     
-    reflection_embedding = similarity_model.encode(reflection_text, convert_to_tensor=True)
+    def compute(batch):
+        results = MODELS.get('sentiment')(batch, batch_size=batch_size, truncation=True)
+        return [r['score'] if r['label'] == "POSITIVE" else -r['score'] for r in results]
     
-    similarities = {}
-    for level, prototype_text in prototypes.items():
-        prototype_embedding = similarity_model.encode(prototype_text, convert_to_tensor=True)
-        similarity = util.cos_sim(reflection_embedding, prototype_embedding)[0][0].item()
-        similarities[level] = similarity
+    scores = _cached('sentiment', 'sentiment', batch, compute) if batch else []
     
-    best_match = max(similarities.items(), key=lambda x: x[1])
+    return scores[0] if single else scores
+
+def bert_moral_density(texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Calculate moral density percentage (float, or list of floats for a list of texts)"""
+    batch, single = _as_batch(texts)
+    densities = _moral_densities(zero_shot_scores(batch, batch_size)[1])
+    
+    return densities[0] if single else densities
+
+def classify_reflection(reflection_texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Classify reflection(s) into moral reasoning categories (dict, or list of dicts)"""
+    batch, single = _as_batch(reflection_texts)
+    classifications = _classifications(zero_shot_scores(batch, batch_size)[0])
+    
+    return classifications[0] if single else classifications
+
+def _encode(texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Sentence embeddings (float32 arrays) for texts, through the score cache"""
+    def compute(batch):
+        return list(MODELS.get('similarity').encode(batch, batch_size=batch_size, convert_to_numpy=True))
+    
+    return _cached('similarity', 'embedding', texts, compute, embeddings=True)
+
+
+# Sophistication prototypes: DEFAULT_PROTOTYPES, or a .json/.npz file (see use_prototypes)
+PROTOTYPES_PATH = None
+prototype_set = None
+
+
+def use_prototypes(path=None):
+    """Score sophistication against the prototype set in this file from now on (None: defaults)"""
+    global PROTOTYPES_PATH, prototype_set
+    PROTOTYPES_PATH = path
+    prototype_set = None
+
+
+def get_prototype_set():
+    """Return the compiled PrototypeSet, encoding its sentences on first use"""
+    global prototype_set
+    # Recompile after a backend change: embeddings from another backend are not comparable
+    if prototype_set is None or prototype_set.revision != model_revision('similarity'):
+        model, revision = MODEL_SPECS['similarity']['model'], model_revision('similarity')
+        if PROTOTYPES_PATH:
+            prototype_set = PrototypeSet.from_file(PROTOTYPES_PATH, _encode, model, revision)
+        else:
+            prototype_set = PrototypeSet.compile(DEFAULT_PROTOTYPES, _encode, model, revision)
+    return prototype_set
+
+def calculate_moral_sophistication(reflection_texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Calculate moral sophistication using semantic similarity (dict, or list of dicts)"""
+    batch, single = _as_batch(reflection_texts)
+    if not batch:
+        return []
+    
+    # One encoder pass per batch of uncached reflections, one matmul against the compiled prototypes
+    prototypes = get_prototype_set()
+    similarity_matrix = prototypes.similarities(np.stack(_encode(batch, batch_size))).tolist()
+    
+    sophistications = []
+    for row in similarity_matrix:
+        similarities = dict(zip(prototypes.names, row))
+        best_match = max(similarities.items(), key=lambda x: x[1])
+        sophistications.append({
+            'sophistication_level': best_match[0],
+            'confidence': best_match[1],
+            'all_similarities': similarities
+        })
+    
+    return sophistications[0] if single else sophistications
+
+def score_reflections(reflections, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Run all four BERT scorers over a list of reflections in batches.
     
+    Returns:
+        dict of lists aligned with reflections: 'classification',
+        'sophistication', 'sentiment', 'moral_density'
+    """
+    categories, themes = zero_shot_scores(reflections, batch_size)
     return {
-        'sophistication_level': best_match[0],
-        'confidence': best_match[1],
-        'all_similarities': similarities
+        'classification': _classifications(categories),
+        'sophistication': calculate_moral_sophistication(reflections, batch_size),
+        'sentiment': bert_sentiment_score(reflections, batch_size),
+        'moral_density': _moral_densities(themes)
     }
 
-def analyze_game_file(filepath, game_id=None):
-    """Analyze all reflections in a game file with optimized batching"""
-    data = load_json_file(filepath)
-    config = extract_config(data)
-    window = config['window']
-    
-    temperature = data.get('config', {}).get('temperature', 1.0)
-    prompt_type = get_prompt_type(filepath)
+def collect_reflections(filepath):
+    """
+    Read a game file and list its reflections for batch scoring.
     
-    all_reflections = []
-    reflection_info = []
+    Returns:
+        (game, reflections, reflection_info): game holds window, temperature
+        and prompt_type; reflection_info has one entry per reflection
+    """
+    data = load_json_file(filepath)
+    window = extract_config(data)['window']
+    game = {
+        'window': window,
+        'temperature': data.get('config', {}).get('temperature', 1.0),
+        'prompt_type': get_prompt_type(filepath)
+    }
+    reflections, reflection_info = extract_reflections_batch(data, window)
     
-    for episode in data['episodes']:
-        ep_num = episode['episode']
-        coop_0 = episode['agent_0']['cooperation_rate']
-        coop_1 = episode['agent_1']['cooperation_rate']
-        
-        for agent_key in ['agent_0', 'agent_1']:
-            all_reflections.append(episode[agent_key]['reflection'])
-            reflection_info.append({
-                'episode': ep_num,
-                'agent': agent_key,
-                'coop_0': coop_0,
-                'coop_1': coop_1
-            })
+    return game, reflections, reflection_info
+
+def analyze_game_file(filepath, game_id=None, batch_size=DEFAULT_BATCH_SIZE, collected=None, scores=None):
+    """
+    Analyze all reflections in a game file with batched inference
     
-    print(f"  Processing {len(all_reflections)} reflections...")
+    Args:
+        filepath: Game JSON file
+        game_id: Identifier stored in every row
+        batch_size: Texts per forward pass
+        collected: collect_reflections(filepath) output, if already read
+        scores: score_reflections() output for this file's reflections, if
+                already scored (e.g., together with other files)
+    """
+    game, all_reflections, reflection_info = collected or collect_reflections(filepath)
+    window = game['window']
+    temperature = game['temperature']
+    prompt_type = game['prompt_type']
     
-    all_classifications = []
-    all_sophistications = []
-    all_sentiments = []
-    all_moral_densities = []
+    if scores is None:
+        print(f"  Processing {len(all_reflections)} reflections...")
+        scores = score_reflections(all_reflections, batch_size)
     
-    for refl in all_reflections:
-        all_classifications.append(classify_reflection(refl))
-        all_sophistications.append(calculate_moral_sophistication(refl))
-        all_sentiments.append(bert_sentiment_score(refl))
-        all_moral_densities.append(bert_moral_density(refl))
+    all_classifications = scores['classification']
+    all_sophistications = scores['sophistication']
+    all_sentiments = scores['sentiment']
+    all_moral_densities = scores['moral_density']
     
     results = []
     episode_metrics = []
@@ -651,8 +967,7 @@ def save_statistics(all_results, data_by_window, output_dir):
                         sophistication[level] = sophistication.get(level, 0) + 1
                     
                     f.write("\nMoral Sophistication Distribution:\n")
-                    for level in ['Level 0 - Reactive', 'Level 1 - Simple Moral', 
-                                'Level 2 - Moral Reasoning', 'Level 3 - Complex Moral']:
+                    for level in get_prototype_set().names:
                         count = sophistication.get(level, 0)
                         pct = (count / len(agent_refl)) * 100
                         f.write(f"  {level:<35} {count:>3} ({pct:>5.1f}%)\n")
@@ -722,21 +1037,35 @@ def create_game_bar_chart(categories_0, categories_1, n_refl_0, n_refl_1,
     save_figure(fig, output_dir / f'bert_categories_game{game_num}.png')
     plt.close()
 
-def add_bert_sentiment_to_games(json_files, output_dir=None):
+def add_bert_sentiment_to_games(json_files, output_dir=None, batch_size=DEFAULT_BATCH_SIZE):
     """
     Calculate BERT sentiment for existing game files and optionally save updated versions.
     Can be imported and used by other scripts without loading models twice.
+    Reflections from all files are scored together in batches.
     Args:
         json_files: List of JSON file paths
         output_dir: Optional directory to save updated JSON files with sentiment data
+        batch_size: Reflections per forward pass
         
     Returns:
         dict: Mapping of filename to sentiment data
     """
+    games = [(filepath, load_json_file(filepath)) for filepath in json_files]
+    
+    # (episode dict, agent_key) for every non-empty reflection, in file order
+    targets = [(episode, agent_key)
+               for _, data in games
+               for episode in data['episodes']
+               for agent_key in ['agent_0', 'agent_1']
+               if episode[agent_key].get('reflection', '')]
+    sentiments = bert_sentiment_score([episode[agent_key]['reflection'] for episode, agent_key in targets],
+                                      batch_size)
+    scored = {(id(episode), agent_key): sentiment
+              for (episode, agent_key), sentiment in zip(targets, sentiments)}
+    
     results = {}
     
-    for filepath in json_files:
-        data = load_json_file(filepath)
+    for filepath, data in games:
         file_key = Path(filepath).name
         results[file_key] = {'episodes': []}
         
@@ -744,9 +1073,8 @@ def add_bert_sentiment_to_games(json_files, output_dir=None):
             ep_sentiments = {}
             
             for agent_key in ['agent_0', 'agent_1']:
-                reflection = episode[agent_key].get('reflection', '')
-                if reflection:
-                    sentiment = bert_sentiment_score(reflection)
+                if (id(episode), agent_key) in scored:
+                    sentiment = scored[(id(episode), agent_key)]
                     ep_sentiments[agent_key] = sentiment
                     
                     # Optionally add to episode data
@@ -769,31 +1097,35 @@ def add_bert_sentiment_to_games(json_files, output_dir=None):
     
     return results
 
-def calculate_prompt_sentiment_means(json_files):
+def calculate_prompt_sentiment_means(json_files, batch_size=DEFAULT_BATCH_SIZE):
     """Calculate average sentiment for each prompt type"""
     import pandas as pd
     
-    all_data = []
-    
+    # Reflections of every episode of every file, scored in one batched pass
+    episodes = []
+    reflections = []
     for json_file in json_files:
         data = load_json_file(json_file)
         prompt_type = get_prompt_type(json_file)
-        # Calculate sentiment for each episode
         for episode in data['episodes']:
-            sentiments = []
-            
-            for agent_key in ['agent_0', 'agent_1']:
-                reflection = episode[agent_key].get('reflection', '')
-                if reflection:
-                    sentiment = bert_sentiment_score(reflection)
-                    sentiments.append(sentiment)
-            
-            if sentiments:
-                all_data.append({
-                    'prompt_type': prompt_type,
-                    'episode': episode['episode'],
-                    'sentiment': sum(sentiments) / len(sentiments)
-                })
+            texts = [episode[agent_key].get('reflection', '') for agent_key in ['agent_0', 'agent_1']]
+            texts = [text for text in texts if text]
+            episodes.append((prompt_type, episode['episode'], len(texts)))
+            reflections.extend(texts)
+    
+    sentiments = iter(bert_sentiment_score(reflections, batch_size))
+    
+    all_data = []
+    
+    for prompt_type, episode_num, count in episodes:
+        ep_sentiments = [next(sentiments) for _ in range(count)]
+        
+        if ep_sentiments:
+            all_data.append({
+                'prompt_type': prompt_type,
+                'episode': episode_num,
+                'sentiment': sum(ep_sentiments) / len(ep_sentiments)
+            })
     
     df = pd.DataFrame(all_data)
     
@@ -807,6 +1139,86 @@ def calculate_prompt_sentiment_means(json_files):
     
     return means_dict
 
+def drift_report(reflections, backend, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Score reflections with the PyTorch models and with another backend and compare
+    
+    Both runs bypass the score cache. Throughput counts inference only:
+    models are loaded and warmed up on one batch before the timed run. The
+    backend in use before the call is restored afterwards.
+    
+    Returns:
+        dict with seconds and reflections/s per backend, and per-score drift:
+        max/mean absolute difference and agreement of the discrete outputs
+    """
+    import time
+    
+    previous_backend, cache_path = MODELS.backend, SCORE_CACHE_PATH
+    use_score_cache(None)
+    runs = {}
+    try:
+        for name in ('torch', backend):
+            MODELS.set_backend(name)
+            
+            # Load (and quantize or export) the models, compile the prototypes and
+            # run one warm-up batch before timing, so only inference is measured
+            for key in MODEL_SPECS:
+                MODELS.get(key)
+            get_prototype_set()
+            score_reflections(reflections[:batch_size], batch_size)
+            
+            start = time.perf_counter()
+            runs[name] = score_reflections(reflections, batch_size)
+            runs[name]['seconds'] = time.perf_counter() - start
+    finally:
+        MODELS.set_backend(previous_backend)
+        use_score_cache(cache_path)
+    
+    base, other = runs['torch'], runs[backend]
+    
+    def diff(a, b):
+        d = np.abs(np.asarray(a, dtype=float) - np.asarray(b, dtype=float))
+        return {'max_abs_diff': float(d.max()), 'mean_abs_diff': float(d.mean())}
+    
+    def agreement(a, b):
+        return sum(x == y for x, y in zip(a, b)) / len(a)
+    
+    labels = MORAL_CATEGORIES
+    levels = get_prototype_set().names
+    return {
+        'backend': backend,
+        'reflections': len(reflections),
+        'throughput': {name: {'seconds': runs[name]['seconds'],
+                              'reflections_per_second': len(reflections) / runs[name]['seconds']}
+                       for name in runs},
+        'sentiment': {**diff(base['sentiment'], other['sentiment']),
+                      'sign_agreement': agreement(np.sign(base['sentiment']), np.sign(other['sentiment']))},
+        'moral_density': diff(base['moral_density'], other['moral_density']),
+        'category_scores': {
+            **diff([[c['all_scores'][l] for l in labels] for c in base['classification']],
+                   [[c['all_scores'][l] for l in labels] for c in other['classification']]),
+            'top_category_agreement': agreement([c['top_category'] for c in base['classification']],
+                                                [c['top_category'] for c in other['classification']])},
+        'sophistication_similarities': {
+            **diff([[r['all_similarities'][l] for l in levels] for r in base['sophistication']],
+                   [[r['all_similarities'][l] for l in levels] for r in other['sophistication']]),
+            'level_agreement': agreement([r['sophistication_level'] for r in base['sophistication']],
+                                         [r['sophistication_level'] for r in other['sophistication']])},
+    }
+
+def print_drift_report(report):
+    """Print a drift_report() result"""
+    backend = report['backend']
+    torch_rate = report['throughput']['torch']['reflections_per_second']
+    rate = report['throughput'][backend]['reflections_per_second']
+    print(f"\nDrift of '{backend}' vs torch over {report['reflections']} reflections:")
+    print(f"  Throughput: torch {torch_rate:.1f}/s, {backend} {rate:.1f}/s ({rate / torch_rate:.2f}x)")
+    for score in ('sentiment', 'moral_density', 'category_scores', 'sophistication_similarities'):
+        entry = report[score]
+        agreements = ', '.join(f"{k.replace('_', ' ')} {v:.1%}" for k, v in entry.items() if 'agreement' in k)
+        print(f"  {score:<28} max |diff| {entry['max_abs_diff']:.2e}  mean |diff| {entry['mean_abs_diff']:.2e}"
+              + (f"  {agreements}" if agreements else ""))
+
 def main():
     """Main execution function."""
     import argparse
@@ -818,10 +1230,39 @@ def main():
                        help='Directory to save output files')
     parser.add_argument('--sample', type=int, default=None, 
                        help='Analyze only first N reflections (for testing)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                       help=f'Reflections per forward pass (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--device', type=str, default=None,
+                       help="Device for the models, e.g. cpu, cuda, cuda:1 (default: CUDA if available)")
+    parser.add_argument('--cache', type=str, default=DEFAULT_CACHE_PATH,
+                       help=f'SQLite score cache (default: {DEFAULT_CACHE_PATH})')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always run the models; do not read or write the score cache')
+    parser.add_argument('--prototypes', type=str, default=None,
+                       help='Sophistication prototypes: JSON {level: sentence} or a compiled .npz')
+    parser.add_argument('--save-prototypes', type=str, default=None,
+                       help='Write the compiled prototype set to this .npz for reuse with --prototypes')
+    parser.add_argument('--backend', choices=BACKENDS, default='torch',
+                       help='torch, int8 (dynamically quantized, CPU) or onnx (ONNX Runtime, CPU)')
+    parser.add_argument('--drift-report', action='store_true',
+                       help='Also score with PyTorch and report how far --backend drifts from it')
     
     args = parser.parse_args()
+    if args.backend == 'onnx' and not HAS_ONNX:
+        parser.error("--backend onnx needs ONNX Runtime: pip install optimum[onnxruntime]")
+    if args.backend != 'torch' and args.device and not args.device.startswith('cpu'):
+        parser.error(f"--backend {args.backend} runs on CPU only")
     
     try:
+        # Quantized and ONNX models run on CPU
+        MODELS.set_device(args.device or ('cpu' if args.backend != 'torch' else None))
+        MODELS.set_backend(args.backend)
+        use_score_cache(None if args.no_cache else args.cache)
+        use_prototypes(args.prototypes)
+        if args.save_prototypes:
+            get_prototype_set().save(args.save_prototypes)
+            print(f"Saved prototype set to {args.save_prototypes}")
+        
         files = load_game_files(args.results_dir)
         print(f"Found {len(files)} game files")
         print("Analyzing reflections with BERT...\n")
@@ -829,25 +1270,59 @@ def main():
         all_results = []
         data_by_window = defaultdict(list)
         
+        # Read every file first so all reflections are scored in shared batches
+        collected = []
+        num_reflections = 0
         for i, filepath in enumerate(files, 1):
-            print_progress(i, len(files), "Processing files")
+            print_progress(i, len(files), "Reading files")
+            try:
+                game = collect_reflections(filepath)
+            except Exception as e:
+                print(f"\n  Error processing {Path(filepath).name}: {e}")
+                continue
+            collected.append((i, filepath, game))
+            num_reflections += len(game[1])
+            if args.sample and num_reflections >= args.sample:
+                break
+        
+        reflections = [text for _, _, game in collected for text in game[1]]
+        print(f"Scoring {len(reflections)} reflections (batch size {args.batch_size}, {MODELS.device})...")
+        scores = score_reflections(reflections, args.batch_size)
+        cache = get_score_cache()
+        if cache is not None:
+            stats = cache.stats()
+            print(f"Score cache {cache.path}: {stats['hits']} hits, {stats['misses']} misses")
+        
+        if args.drift_report and args.backend != 'torch':
+            report = drift_report(reflections, args.backend, args.batch_size)
+            print_drift_report(report)
+            with open(Path(output_dir) / f'bert_drift_{args.backend}.json', 'w') as f:
+                json.dump(report, f, indent=2)
+        elif args.drift_report:
+            print("--drift-report compares a --backend (int8 or onnx) against torch; nothing to compare")
+        
+        offset = 0
+        for i, filepath, game in collected:
+            count = len(game[1])
+            file_scores = {key: values[offset:offset + count] for key, values in scores.items()}
+            offset += count
             
             try:
-                file_results, episode_metrics = analyze_game_file(filepath, game_id=i)  # <-- pass game_id
+                file_results, episode_metrics = analyze_game_file(
+                    filepath, game_id=i, collected=game, scores=file_scores)  # <-- pass game_id
                 all_results.extend(file_results)
                 
                 if episode_metrics:
                     window = episode_metrics[0]['window']
                     data_by_window[window].append(episode_metrics)
-                
-                if args.sample and len(all_results) >= args.sample:
-                    all_results = all_results[:args.sample]
-                    break
                     
             except Exception as e:
                 print(f"\n  Error processing {Path(filepath).name}: {e}")
                 continue
         
+        if args.sample:
+            all_results = all_results[:args.sample]
+        
         if not all_results:
             print("No reflections to analyze")
             return
@@ -0,0 +1,121 @@
+"""
+Append-only JSONL round log for Episodic IPD games
+Streams each round and episode summary to disk as it is produced so running
+experiments can be tailed and the game need not hold every round in memory
+"""
+
+import json
+import os
+import time
+from typing import Dict, Iterator, List
+
+
+def drop_partial_line(path: str):
+    """
+    Truncate a log back to the end of its last complete line
+
+    A crash can leave a partly written last record; appending to it would
+    join the next record onto the fragment and lose both.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            block = min(64 * 1024, end)
+            f.seek(end - block)
+            newline = f.read(block).rfind(b"\n")
+            if newline != -1:
+                end = end - block + newline + 1
+                break
+            end -= block
+        if end != size:
+            f.truncate(end)
+
+
+class JsonlRoundLog:
+    """
+    Buffered, append-only JSON Lines sink
+
+    One JSON object per line. Writes go through a buffered file; the buffer is
+    flushed and fsync'ed at most every fsync_interval seconds and whenever
+    sync() is called (the game syncs at every episode boundary).
+    """
+
+    def __init__(self, path: str, buffer_size: int = 64 * 1024, fsync_interval: float = 5.0):
+        """
+        Args:
+            path: JSONL file (appended to if it exists, after dropping a partial last line)
+            buffer_size: Write buffer size in bytes
+            fsync_interval: Max seconds between fsyncs (0 = fsync every record)
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        drop_partial_line(path)
+        self._file = open(path, 'a', buffering=buffer_size)
+        self._last_sync = time.monotonic()
+
+    def write(self, record: Dict):
+        """Append one record"""
+        self._file.write(json.dumps(record) + "\n")
+        if time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """Flush buffered records and fsync them to disk"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync and close the log"""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_round_log(path: str) -> Iterator[Dict]:
+    """
+    Yield the records of a JSONL round log
+
+    A partially written last line (e.g., after a crash) is skipped.
+    """
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def load_episode_rounds(path: str) -> Dict[int, List[Dict]]:
+    """
+    Rebuild each episode's 'rounds' list from a round log
+
+    If a round was logged more than once (an episode replayed after a resume),
+    the last record wins.
+
+    Returns:
+        {episode_number: [round_data, ...]} with rounds in order
+    """
+    rounds = {}
+    for record in read_round_log(path):
+        if record.get('type') != 'round':
+            continue
+        round_data = {k: v for k, v in record.items() if k not in ('type', 'episode')}
+        rounds.setdefault(record['episode'], {})[round_data['round']] = round_data
+
+    return {episode: [by_round[r] for r in sorted(by_round)]
+            for episode, by_round in rounds.items()}
@@ -0,0 +1,148 @@
+"""
+Persistent cache of model scores and embeddings for reflection analysis
+Keyed by (model, model revision, kind, SHA-256 of the text) in a SQLite file,
+so re-analyzing unchanged results runs no model inference
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+
+# Default location (override with IPD_SCORE_CACHE=/path/to/cache.sqlite)
+DEFAULT_CACHE_PATH = os.environ.get(
+    'IPD_SCORE_CACHE', str(Path.home() / '.cache' / 'ipd-llm-agents' / 'reflection_scores.sqlite')
+)
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of a text (UTF-8), the cache key for its scores"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ScoreCache:
+    """
+    SQLite store of per-text model outputs
+
+    Scores are stored as JSON, embeddings as float32 bytes. Lookups and
+    inserts are batched; 'kind' separates outputs of the same model (e.g.,
+    zero-shot scores for different label sets).
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        """
+        Args:
+            path: SQLite file (created if missing)
+        """
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS scores (
+                model       TEXT NOT NULL,
+                revision    TEXT NOT NULL,
+                kind        TEXT NOT NULL,
+                text_hash   TEXT NOT NULL,
+                value       BLOB NOT NULL,
+                PRIMARY KEY (model, revision, kind, text_hash)
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, model: str, revision: str, kind: str, hashes: Iterable[str]) -> Dict[str, bytes]:
+        hashes = list(dict.fromkeys(hashes))
+        found = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT text_hash, value FROM scores WHERE model = ? AND revision = ? AND kind = ? "
+                f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                [model, revision, kind, *chunk]
+            )
+            found.update(rows)
+        self.hits += len(found)
+        self.misses += len(hashes) - len(found)
+        return found
+
+    def _put(self, model: str, revision: str, kind: str, values: Dict[str, bytes]):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO scores (model, revision, kind, text_hash, value) VALUES (?, ?, ?, ?, ?)",
+            [(model, revision, kind, h, value) for h, value in values.items()]
+        )
+        self._conn.commit()
+
+    def get_scores(self, model: str, revision: str, kind: str, hashes: Iterable[str]) -> Dict[str, object]:
+        """Return {text_hash: score} for the hashes that are cached"""
+        return {h: json.loads(value) for h, value in self._get(model, revision, kind, hashes).items()}
+
+    def put_scores(self, model: str, revision: str, kind: str, scores: Dict[str, object]):
+        """Store {text_hash: score} (any JSON-serializable value)"""
+        self._put(model, revision, kind, {h: json.dumps(score) for h, score in scores.items()})
+
+    def get_embeddings(self, model: str, revision: str, kind: str, hashes: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Return {text_hash: float32 vector} for the hashes that are cached"""
+        return {h: np.frombuffer(value, dtype=np.float32)
+                for h, value in self._get(model, revision, kind, hashes).items()}
+
+    def put_embeddings(self, model: str, revision: str, kind: str, embeddings: Dict[str, np.ndarray]):
+        """Store {text_hash: vector} as float32"""
+        self._put(model, revision, kind,
+                  {h: np.asarray(vector, dtype=np.float32).tobytes() for h, vector in embeddings.items()})
+
+    def stats(self) -> Dict:
+        """Entries per (model, revision, kind) plus this session's hit/miss counts"""
+        rows = self._conn.execute(
+            "SELECT model, revision, kind, COUNT(*) FROM scores GROUP BY model, revision, kind"
+        ).fetchall()
+        return {
+            'entries': [{'model': m, 'revision': r, 'kind': k, 'count': c} for m, r, k, c in rows],
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def close(self):
+        """Close the database"""
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def cached_outputs(cache: ScoreCache, model: str, revision: str, kind: str,
+                   texts: List[str], compute, embeddings: bool = False) -> List:
+    """
+    Return one output per text, computing only the ones not in the cache
+
+    Args:
+        cache: ScoreCache, or None to always compute
+        compute: Function taking a list of texts and returning one output per text
+        embeddings: Store outputs as float32 vectors instead of JSON
+
+    Each distinct uncached text is computed once, in a single compute() call.
+    """
+    if cache is None:
+        return compute(texts)
+
+    get = cache.get_embeddings if embeddings else cache.get_scores
+    put = cache.put_embeddings if embeddings else cache.put_scores
+
+    hashes = [text_hash(text) for text in texts]
+    found = get(model, revision, kind, hashes)
+    missing = {h: text for h, text in zip(hashes, texts) if h not in found}
+    if missing:
+        computed = dict(zip(missing.keys(), compute(list(missing.values()))))
+        put(model, revision, kind, computed)
+        found.update(computed)
+    return [found[h] for h in hashes]
@@ -0,0 +1,517 @@
+#!/usr/bin/env python3
+"""
+Synthetic Episodic IPD results for load and benchmark testing
+Plays games between scripted agents (no Ollama) through EpisodicIPDGame, so the
+results JSON has exactly the layout play_game() writes: same keys, rounds,
+reflections, and telemetry, with reasoning/reflection text of realistic length.
+Thousands of files can be generated in seconds to exercise forgedb imports,
+the database views, and the query benchmarks.
+
+Usage:
+    python synthetic_results.py --count 1000 --output-dir results/synthetic
+    python synthetic_results.py --count 200 --episodes 10 --rounds 50 --workers 8
+    python synthetic_results.py --count 50 --strategies tit_for_tat,always_defect --seed 7
+"""
+
+import contextlib
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import EpisodeConfig
+from episodic_ipd_game import EpisodicIPDGame, save_results
+from prompts import DEFAULT_SYSTEM_PROMPT
+
+
+def _always_cooperate(history: List[Dict], rng: random.Random) -> str:
+    return 'COOPERATE'
+
+
+def _always_defect(history: List[Dict], rng: random.Random) -> str:
+    return 'DEFECT'
+
+
+def _tit_for_tat(history: List[Dict], rng: random.Random) -> str:
+    return history[-1]['opp_action'] if history else 'COOPERATE'
+
+
+def _suspicious_tit_for_tat(history: List[Dict], rng: random.Random) -> str:
+    return history[-1]['opp_action'] if history else 'DEFECT'
+
+
+def _generous_tit_for_tat(history: List[Dict], rng: random.Random) -> str:
+    if history and history[-1]['opp_action'] == 'DEFECT' and rng.random() >= 0.1:
+        return 'DEFECT'
+    return 'COOPERATE'
+
+
+def _grim_trigger(history: List[Dict], rng: random.Random) -> str:
+    if any(r['opp_action'] == 'DEFECT' for r in history):
+        return 'DEFECT'
+    return 'COOPERATE'
+
+
+def _pavlov(history: List[Dict], rng: random.Random) -> str:
+    # Win-stay, lose-shift: repeat after R or T, switch after P or S
+    if not history:
+        return 'COOPERATE'
+    last = history[-1]
+    if last['my_action'] == last['opp_action']:
+        return 'COOPERATE'
+    return 'DEFECT'
+
+
+def _random(history: List[Dict], rng: random.Random) -> str:
+    return 'COOPERATE' if rng.random() < 0.5 else 'DEFECT'
+
+
+# Strategy name -> decision rule (history is the agent's own episode history)
+STRATEGIES: Dict[str, Callable[[List[Dict], random.Random], str]] = {
+    'always_cooperate': _always_cooperate,
+    'always_defect': _always_defect,
+    'tit_for_tat': _tit_for_tat,
+    'suspicious_tit_for_tat': _suspicious_tit_for_tat,
+    'generous_tit_for_tat': _generous_tit_for_tat,
+    'grim_trigger': _grim_trigger,
+    'pavlov': _pavlov,
+    'random': _random,
+}
+
+
+# Building blocks for the fake reasoning and reflection text
+_OPENERS = {
+    None: [
+        "This is the first round of the period, so there is no history to go on yet.",
+        "With no previous rounds this period, I have to decide how to open.",
+        "Nothing has happened yet in this period, so I will set the tone.",
+    ],
+    'COOPERATE': [
+        "The other player cooperated last round.",
+        "In the previous round the other player chose to cooperate.",
+        "Last round we saw cooperation from the other side.",
+    ],
+    'DEFECT': [
+        "The other player defected last round.",
+        "In the previous round the other player chose to defect.",
+        "Last round the other side took the higher payoff at my expense.",
+    ],
+}
+
+_FILLER = [
+    "Mutual cooperation gives both of us 3 points, which is better over time than mutual defection at 1 point each.",
+    "If I defect while they cooperate I get 5 points, but that risks breaking any trust we have built.",
+    "Being exploited leaves me with 0 points, so I need to watch how they respond.",
+    "The game continues for several more rounds, so the long-run total matters more than any single payoff.",
+    "Reciprocity seems to be the most reliable way to keep the interaction stable.",
+    "I want to signal that I am willing to work together, but not to be taken advantage of.",
+    "Their pattern so far suggests they are paying attention to what I do.",
+    "A single defection can start a cycle of retaliation that hurts us both.",
+    "Trust takes several rounds to build and only one round to lose.",
+    "I should weigh the short-term gain against the effect on future rounds.",
+    "Keeping my behavior predictable may help the other player choose cooperation as well.",
+    "Fairness matters here, since we both face exactly the same choices and payoffs.",
+]
+
+_REFLECTION_FILLER = [
+    "Looking back, the early rounds set the tone for everything that followed.",
+    "I noticed that the other player tended to respond directly to my previous choice.",
+    "When we both cooperated, the points accumulated steadily for both of us.",
+    "The rounds with mutual defection were the least productive for either side.",
+    "Being exploited even once made me more cautious in the rounds that followed.",
+    "I think consistency was more valuable than trying to outguess the other player.",
+    "Retaliation worked as a signal, but it also cost me points when it dragged on.",
+    "Forgiveness after a defection sometimes restored cooperation quickly.",
+    "Next period I want to establish cooperation early and protect it.",
+    "I should be clearer about how I will respond to defection so the incentives are obvious.",
+    "The total score matters more to me than beating the other player in any single round.",
+    "Overall, the interaction showed how much each choice depends on the history before it.",
+    "I am considering whether a more generous approach would lead to higher joint payoffs.",
+    "The other player's behavior seemed to shift once a pattern had been established.",
+]
+
+_DECISION_LINES = {
+    'COOPERATE': [
+        "I will cooperate this round.",
+        "Cooperating is the better choice right now.",
+        "I choose to cooperate and see whether it is reciprocated.",
+    ],
+    'DEFECT': [
+        "I will defect this round.",
+        "Defecting is the safer choice right now.",
+        "I choose to defect to protect my score.",
+    ],
+}
+
+
+def _fake_text(rng: random.Random, sentences: List[str], lead: List[str], mean_words: int) -> str:
+    """Join a few leading sentences and random filler until about mean_words words"""
+    target = max(int(rng.gauss(mean_words, mean_words * 0.25)), 5)
+    parts = list(lead)
+    words = sum(len(s.split()) for s in parts)
+    while words < target:
+        sentence = rng.choice(sentences)
+        parts.append(sentence)
+        words += len(sentence.split())
+    return " ".join(parts)
+
+
+def fake_reasoning(rng: random.Random, history: List[Dict], decision: str, mean_words: int = 40) -> str:
+    """Decision reasoning that reacts to the opponent's last move (without the final action line)"""
+    last = history[-1]['opp_action'] if history else None
+    body = _fake_text(rng, _FILLER, [rng.choice(_OPENERS[last])], mean_words)
+    return f"{body} {rng.choice(_DECISION_LINES[decision])}"
+
+
+def fake_reflection(rng: random.Random, history: List[Dict], my_score: int, opp_score: int,
+                    mean_words: int = 160) -> str:
+    """Post-episode reflection that mentions the period's scores and cooperation counts"""
+    my_coop = sum(1 for r in history if r['my_action'] == 'COOPERATE')
+    opp_coop = sum(1 for r in history if r['opp_action'] == 'COOPERATE')
+    lead = [
+        f"This period I scored {my_score} points and the other player scored {opp_score}.",
+        f"I cooperated in {my_coop} of {len(history)} rounds, and they cooperated in {opp_coop}.",
+    ]
+    return _fake_text(rng, _REFLECTION_FILLER, lead, mean_words)
+
+
+class ScriptedAgent:
+    """
+    Stand-in for OllamaAgent whose decisions come from a scripted strategy
+
+    Provides the attributes and methods EpisodicIPDGame uses (conversation,
+    last_call_telemetry, prompt_eval_log, reflection context) plus decide()
+    and reflect(), which SyntheticIPDGame calls instead of an LLM. Telemetry
+    is drawn from lognormal latencies with token counts ~ len(text) / 4.
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        strategy: str,
+        rng: random.Random,
+        system_prompt: str = "",
+        reasoning_words: int = 40,
+        reflection_words: int = 160,
+        retry_rate: float = 0.02,
+        decision_latency: float = 1.2,
+        reflection_latency: float = 6.0
+    ):
+        """
+        Args:
+            agent_id: Identifier for this agent
+            strategy: Key of STRATEGIES
+            rng: Random source (seed it for reproducible files)
+            system_prompt: Stored in the conversation like a real agent
+            reasoning_words: Mean length of each decision's reasoning
+            reflection_words: Mean length of each reflection
+            retry_rate: Probability a decision needed a forced retry
+            decision_latency: Median decision wall time (seconds)
+            reflection_latency: Median reflection wall time (seconds)
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy {strategy!r}; choose from {', '.join(STRATEGIES)}")
+        self.agent_id = agent_id
+        self.strategy = strategy
+        self.model = f"scripted:{strategy}"
+        self.rng = rng
+        self.system_prompt = system_prompt
+        self.reasoning_words = reasoning_words
+        self.reflection_words = reflection_words
+        self.retry_rate = retry_rate
+        self.decision_latency = decision_latency
+        self.reflection_latency = reflection_latency
+
+        self.last_call_telemetry = None
+        self.prompt_eval_log = []
+        self.conversation = []
+        self._reflections = []
+        self._context_tokens = 0
+        self.reset_conversation()
+
+    def decide(self, history: List[Dict]) -> Tuple[str, str]:
+        """
+        Choose an action from the strategy and write reasoning that ends with it
+
+        Returns:
+            (decision, reasoning)
+        """
+        decision = STRATEGIES[self.strategy](history, self.rng)
+        reasoning = f"{fake_reasoning(self.rng, history, decision, self.reasoning_words)}\n\n{decision}"
+
+        retried = self.rng.random() < self.retry_rate
+        self._record_call(reasoning, self.decision_latency, prompt_tokens=60 + 12 * len(history),
+                          forced_retries=int(retried))
+        return decision, reasoning
+
+    def reflect(self, history: List[Dict], my_score: int, opp_score: int) -> str:
+        """Write a post-episode reflection that mentions the period's outcome"""
+        reflection = fake_reflection(self.rng, history, my_score, opp_score, self.reflection_words)
+        self._record_call(reflection, self.reflection_latency, prompt_tokens=120 + 25 * len(history))
+        return reflection
+
+    def _record_call(self, text: str, median_seconds: float, prompt_tokens: int, forced_retries: int = 0):
+        """Fill last_call_telemetry and prompt_eval_log as OllamaAgent would"""
+        requests = 1 + forced_retries
+        eval_count = max(len(text) // 4, 1)
+        wall = sum(self.rng.lognormvariate(math.log(median_seconds), 0.35) for _ in range(requests))
+        http = wall * self.rng.uniform(0.97, 0.995)
+
+        # Prompt prefix is cached server-side; only the new turn is evaluated
+        self._context_tokens += prompt_tokens
+        self.prompt_eval_log.append({
+            'prompt_tokens': self._context_tokens,
+            'prompt_eval_count': prompt_tokens
+        })
+        self._context_tokens += eval_count
+
+        self.last_call_telemetry = {
+            'wall_seconds': wall,
+            'http_seconds': http,
+            'requests': requests,
+            'retries': requests - 1,
+            'http_errors': 0,
+            'forced_retries': forced_retries,
+            'prompt_eval_count': prompt_tokens * requests,
+            'eval_count': eval_count * requests,
+            'eval_duration': int(http * 0.8e9),
+            'load_duration': int(self.rng.uniform(5e6, 30e6))
+        }
+
+    def reset_conversation(self, keep_system_prompt: bool = True):
+        """Reset the conversation history"""
+        if keep_system_prompt and self.system_prompt:
+            self.conversation = [{"role": "system", "content": self.system_prompt}]
+        else:
+            self.conversation = []
+        self._reflections = []
+        self._context_tokens = len(self.system_prompt) // 4 if keep_system_prompt else 0
+
+    def add_reflection_to_context(self, reflection_text: str):
+        """Add a reflection as a user message to preserve it in context"""
+        message = {"role": "user", "content": reflection_text}
+        self.conversation.append(message)
+        self._reflections.append([message])
+        self._context_tokens += len(reflection_text) // 4
+
+    def get_reflection_indices(self) -> List[List[int]]:
+        """Return the conversation positions of each tracked reflection (for checkpoints)"""
+        positions = {id(m): i for i, m in enumerate(self.conversation)}
+        return [[positions[id(m)] for m in group if id(m) in positions]
+                for group in self._reflections]
+
+    def restore_conversation(self, conversation: List[Dict], reflection_indices: List[List[int]] = None):
+        """Replace the conversation, e.g. from a checkpoint"""
+        self.conversation = conversation
+        self._reflections = [[conversation[i] for i in group]
+                             for group in (reflection_indices or [])]
+
+    def get_prompt_cache_stats(self) -> Dict:
+        """Summarize prompt evaluation across this agent's requests"""
+        prompt_tokens = sum(entry['prompt_tokens'] for entry in self.prompt_eval_log)
+        evaluated = sum(entry['prompt_eval_count'] for entry in self.prompt_eval_log)
+        return {
+            'requests': len(self.prompt_eval_log),
+            'prompt_tokens_estimate': prompt_tokens,
+            'prompt_eval_tokens': evaluated,
+            'cached_rate_estimate': max(1 - evaluated / prompt_tokens, 0.0) if prompt_tokens else 0.0,
+            'prompt_eval_counts': [entry['prompt_eval_count'] for entry in self.prompt_eval_log]
+        }
+
+    def __repr__(self) -> str:
+        return f"ScriptedAgent(id={self.agent_id}, strategy={self.strategy})"
+
+
+class SyntheticIPDGame(EpisodicIPDGame):
+    """EpisodicIPDGame between ScriptedAgents; decisions and reflections skip the prompts"""
+
+    def _get_agent_decision_with_retry(
+        self,
+        agent: ScriptedAgent,
+        round_num: int,
+        episode_num: int,
+        history: List[Dict],
+        my_score: int,
+        opp_score: int,
+        agent_idx: int
+    ) -> Tuple[str, str]:
+        """Get the scripted decision and its reasoning"""
+        decision, reasoning = agent.decide(history)
+        return self._resolve_decision(agent, decision, reasoning)
+
+    def _get_reflection(
+        self,
+        agent: ScriptedAgent,
+        episode_num: int,
+        history: List[Dict],
+        my_score: int,
+        opp_score: int
+    ) -> str:
+        """Get the scripted post-episode reflection"""
+        return self._resolve_reflection(agent.reflect(history, my_score, opp_score))
+
+
+def generate_results(
+    index: int,
+    strategy_0: str,
+    strategy_1: str,
+    num_episodes: int = 5,
+    rounds_per_episode: int = 20,
+    seed: int = 0,
+    timestamp: Optional[datetime] = None,
+    username: str = 'synthetic',
+    reasoning_words: int = 40,
+    reflection_words: int = 160
+) -> Dict:
+    """
+    Play one synthetic game and return its results dictionary
+
+    The same (index, seed) always produces the same rounds and text. The
+    timestamp defaults to now; pass distinct timestamps when the files will be
+    loaded into ForgeDB (results are unique on timestamp).
+    """
+    rng = random.Random(f"{seed}:{index}")
+    config = EpisodeConfig(
+        num_episodes=num_episodes,
+        rounds_per_episode=rounds_per_episode,
+        model_0=f"scripted:{strategy_0}",
+        model_1=f"scripted:{strategy_1}",
+        host_0='synthetic',
+        host_1='synthetic',
+        temperature=round(rng.choice([0.5, 0.7, 0.9, 1.0]), 1),
+        verbose=False
+    )
+    agents = [ScriptedAgent(f"agent_{i}", strategy, rng, DEFAULT_SYSTEM_PROMPT,
+                            reasoning_words, reflection_words)
+              for i, strategy in enumerate((strategy_0, strategy_1))]
+
+    game = SyntheticIPDGame(agents[0], agents[1], config, system_prompt_text=DEFAULT_SYSTEM_PROMPT)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        results = game.play_game()
+
+    # Scripted games finish instantly; report the simulated LLM time instead
+    results['elapsed_seconds'] = sum(
+        agent['telemetry'][kind]['wall_seconds']
+        for agent in (results['agent_0'], results['agent_1'])
+        for kind in ('decisions', 'reflections')
+    )
+    results['timestamp'] = (timestamp or datetime.now()).isoformat()
+    results['username'] = username
+    return results
+
+
+def _write_one(job: Dict) -> str:
+    """Worker: generate one game and write it to job['path']"""
+    path = job.pop('path')
+    comment = f"synthetic {job['strategy_0']} vs {job['strategy_1']} seed={job['seed']}"
+    results = generate_results(**job)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        save_results(results, path, comment)
+    return path
+
+
+def generate_files(
+    output_dir: str,
+    count: int,
+    num_episodes: int = 5,
+    rounds_per_episode: int = 20,
+    strategies: Optional[List[str]] = None,
+    seed: int = 0,
+    workers: int = 1,
+    username: str = 'synthetic',
+    start: Optional[datetime] = None,
+    reasoning_words: int = 40,
+    reflection_words: int = 160
+) -> List[str]:
+    """
+    Write count synthetic results files to output_dir
+
+    Strategy pairs are drawn at random from strategies (default: all of
+    STRATEGIES). Game i gets timestamp start + i seconds, so a batch loads
+    into ForgeDB without timestamp collisions.
+
+    Returns:
+        Paths written, in index order
+    """
+    strategies = strategies or list(STRATEGIES)
+    unknown = [s for s in strategies if s not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"Unknown strategies: {', '.join(unknown)}")
+
+    start = start or datetime.now().replace(microsecond=0)
+    pair_rng = random.Random(seed)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    jobs = []
+    for i in range(count):
+        strategy_0, strategy_1 = pair_rng.choice(strategies), pair_rng.choice(strategies)
+        jobs.append({
+            'path': str(Path(output_dir) / f"synthetic_{start:%Y%m%d_%H%M%S}_{seed}_{i:06d}.json"),
+            'index': i,
+            'strategy_0': strategy_0,
+            'strategy_1': strategy_1,
+            'num_episodes': num_episodes,
+            'rounds_per_episode': rounds_per_episode,
+            'seed': seed,
+            'timestamp': start + timedelta(seconds=i),
+            'username': username,
+            'reasoning_words': reasoning_words,
+            'reflection_words': reflection_words,
+        })
+
+    if workers <= 1:
+        return [_write_one(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_write_one, jobs, chunksize=max(count // (workers * 4), 1)))
+
+
+def main():
+    """Generate synthetic results files"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic Episodic IPD results JSON")
+    parser.add_argument("--count", type=int, default=100, help="Number of results files")
+    parser.add_argument("--episodes", type=int, default=5, help="Episodes per game")
+    parser.add_argument("--rounds", type=int, default=20, help="Rounds per episode")
+    parser.add_argument("--strategies", type=str, default=None,
+                        help=f"Comma-separated strategies to pair at random (default: all of "
+                             f"{', '.join(STRATEGIES)})")
+    parser.add_argument("--output-dir", type=str, default=None,
+                        help="Directory for results JSON (default: results/synthetic_<timestamp>)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed, same files)")
+    parser.add_argument("--username", type=str, default="synthetic",
+                        help="Username stored in every file")
+    parser.add_argument("--reasoning-words", type=int, default=40,
+                        help="Mean words of reasoning per decision")
+    parser.add_argument("--reflection-words", type=int, default=160,
+                        help="Mean words per reflection")
+
+    args = parser.parse_args()
+
+    if args.output_dir:
+        output_dir = args.output_dir
+    else:
+        output_dir = str(Path(__file__).parent / "results" / f"synthetic_{time.strftime('%Y%m%d_%H%M%S')}")
+
+    strategies = args.strategies.split(',') if args.strategies else None
+
+    start_time = time.time()
+    paths = generate_files(
+        output_dir, args.count, args.episodes, args.rounds, strategies,
+        args.seed, args.workers, args.username,
+        reasoning_words=args.reasoning_words, reflection_words=args.reflection_words
+    )
+    elapsed = time.time() - start_time
+    print(f"Wrote {len(paths)} files ({args.episodes} episodes x {args.rounds} rounds) "
+          f"to {output_dir} in {elapsed:.1f} seconds", flush=True)
+
+
+if __name__ == "__main__":
+    main()
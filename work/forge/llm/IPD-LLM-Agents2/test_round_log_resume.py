@@ -0,0 +1,81 @@
+"""
+Crash a game mid-way through a round log line, resume it, and check the rounds
+Runs episodic_ipd_game.py against a MockOllamaServer with --no-keep-rounds, so
+the final results are rebuilt from the round log. The game is killed after its
+first checkpoint, the log is left ending in a partly written record, and the
+resumed run must still report every round of every episode.
+
+Usage:
+    python test_round_log_resume.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mock_ollama_server import MockOllamaServer, MockSettings
+from round_log import read_round_log
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+EPISODES = 2
+ROUNDS = 8
+
+
+def game_command(work_dir: Path, resume: bool = False):
+    command = [sys.executable, str(SCRIPT_DIR / "episodic_ipd_game.py"),
+               "--episodes", str(EPISODES), "--rounds", str(ROUNDS),
+               "--host-0", "127.0.0.1", "--host-1", "127.0.0.1",
+               "--model-0", "scripted:tit_for_tat", "--model-1", "scripted:pavlov",
+               "--system-prompt", str(SCRIPT_DIR / "system_prompt.txt"),
+               "--reflection-template", str(SCRIPT_DIR / "reflection_prompt_template.txt"),
+               "--output", str(work_dir / "game.json"),
+               "--round-log", str(work_dir / "rounds.jsonl"), "--no-keep-rounds", "--quiet"]
+    return command + ["--resume"] if resume else command
+
+
+def test_resume_after_partial_round_log_line():
+    settings = MockSettings(latency='fixed:0.05', reflection_latency='fixed:0.05')
+    with tempfile.TemporaryDirectory() as tmp, MockOllamaServer(settings) as server:
+        work_dir = Path(tmp)
+        env = {**os.environ, 'OLLAMA_PORT': str(server.port)}
+        checkpoint = work_dir / "game.checkpoint.json"
+        round_log = work_dir / "rounds.jsonl"
+
+        # Kill the game once the first episode is checkpointed, mid-way through the second
+        game = subprocess.Popen(game_command(work_dir), cwd=work_dir, env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            while not checkpoint.exists():
+                assert game.poll() is None, "game exited before its first checkpoint"
+                time.sleep(0.01)
+        finally:
+            game.kill()
+            game.wait()
+
+        # A buffer flush cut short by the crash leaves a partial last record
+        with open(round_log, 'a') as f:
+            f.write('{"type": "round", "episode": 2, "round": 1, "agent_0": {"act')
+
+        subprocess.run(game_command(work_dir, resume=True), cwd=work_dir, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        with open(work_dir / "game.json") as f:
+            results = json.load(f)
+        assert len(results['episodes']) == EPISODES
+        for episode in results['episodes']:
+            rounds = [r['round'] for r in episode['rounds']]
+            assert rounds == list(range(1, ROUNDS + 1)), f"episode {episode['episode']} rounds: {rounds}"
+
+        # Every line of the log is a complete record
+        with open(round_log) as f:
+            lines = [line for line in f if line.strip()]
+        assert len(list(read_round_log(str(round_log)))) == len(lines)
+
+
+if __name__ == "__main__":
+    test_resume_after_partial_round_log_line()
+    print("OK")